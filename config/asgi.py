@@ -0,0 +1,22 @@
+"""
+ASGI config for digiplan project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Run it i.e. via gunicorn using uvicorn workers together with env variable `ASYNC_VIEWS=True`, so that chart, popup
+and choropleth endpoints are served as async views:
+
+    gunicorn config.asgi -k uvicorn.workers.UvicornWorker
+
+"""
+import os
+import sys
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# digiplan directory.
+app_path = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.append(os.path.join(app_path, "digiplan"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+application = get_asgi_application()
@@ -4,15 +4,13 @@ import os
 import sys
 
 import environ
+from celery.schedules import crontab
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django_mapengine import setup
 
 ROOT_DIR = environ.Path(__file__) - 3  # (digiplan/config/settings/base.py - 3 = digiplan/)
 APPS_DIR = ROOT_DIR.path("digiplan")
-DATA_DIR = APPS_DIR.path("data")
-DIGIPIPE_DIR = DATA_DIR.path("digipipe")
-DIGIPIPE_GEODATA_DIR = DIGIPIPE_DIR.path("geodata")
 METADATA_DIR = APPS_DIR.path("metadata")
 
 env = environ.Env()
@@ -22,6 +20,11 @@ if READ_DOT_ENV_FILE:
     # OS environment variables take precedence over variables from .env
     env.read_env(str(ROOT_DIR.path(".env")))
 
+# Data folder can be changed to use another datapackage (e.g. a synthetic one, see `digiplan.utils.synthetic_data`)
+DATA_DIR = environ.Path(env.str("DIGIPLAN_DATA_DIR", default=str(APPS_DIR.path("data"))))
+DIGIPIPE_DIR = DATA_DIR.path("digipipe")
+DIGIPIPE_GEODATA_DIR = DIGIPIPE_DIR.path("geodata")
+
 # GENERAL
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#debug
@@ -107,7 +110,9 @@ MIGRATION_MODULES = {"sites": "digiplan.contrib.sites.migrations"}
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "digiplan.utils.middleware.WhiteNoiseMiddleware",
+    "digiplan.utils.timing.ServerTimingMiddleware",
+    "digiplan.utils.middleware.PrerenderedTileMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -133,7 +138,7 @@ STATICFILES_FINDERS = [
 # MEDIA
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-root
-MEDIA_ROOT = str(APPS_DIR("data"))
+MEDIA_ROOT = str(DATA_DIR)
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "/media/"
 
@@ -235,6 +240,13 @@ COMPRESS_CACHEABLE_PRECOMPILERS = (("text/x-scss", "django_libsass.SassCompiler"
 CELERY_BROKER_URL = env("CELERY_BROKER_URL")
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-result_backend
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+# https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html
+CELERY_BEAT_SCHEDULE = {
+    "simulation_retention": {
+        "task": "digiplan.map.tasks.apply_simulation_retention",
+        "schedule": crontab(hour=3, minute=0),
+    },
+}
 
 # test
 TESTING = "test" in sys.argv[1:]
@@ -264,6 +276,29 @@ CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
 OEMOF_SCENARIO = env.str("OEMOF_SCENARIO", "scenario_2045")
+# Columnar result files per simulation (see digiplan.map.result_store)
+RESULT_STORE_DIR = env.str("RESULT_STORE_DIR", default=str(DATA_DIR.path("result_store")))
+# Source of potential areas per municipality for slider maxima and disaggregation: "csv" (digipipe stats files) or
+# "postgis" (calculated from loaded potential area layers, see digiplan.map.potentials)
+POTENTIAL_AREA_SOURCE = env.str("POTENTIAL_AREA_SOURCE", default="csv")
+
+# Send timings per request as `Server-Timing` header (see digiplan.utils.timing); timings are logged in any case
+SERVER_TIMING = env.bool("SERVER_TIMING", default=DEBUG)
+# Sampling profiler (see digiplan.utils.timing); interval between stack samples in seconds
+PROFILE_DIR = env.str("PROFILE_DIR", default=str(ROOT_DIR.path("profiles")))
+PROFILE_INTERVAL = env.float("PROFILE_INTERVAL", default=0.005)
+
+# Serve chart, popup and choropleth endpoints as async views (requires ASGI, see config/asgi.py);
+# blocking calculations are run in executor with given number of threads per process
+ASYNC_VIEWS = env.bool("ASYNC_VIEWS", default=False)
+ASYNC_EXECUTOR_WORKERS = env.int("ASYNC_EXECUTOR_WORKERS", default=4)
+# Number of processes to calculate indicators when comparing simulations
+COMPARISON_WORKERS = env.int("COMPARISON_WORKERS", default=4)
+
+# Retention of simulations (see digiplan.map.retention): unpinned simulations are compacted if not used within
+# SIMULATION_KEEP_DAYS and deleted if not used within SIMULATION_TTL_DAYS
+SIMULATION_KEEP_DAYS = env.int("SIMULATION_KEEP_DAYS", default=7)
+SIMULATION_TTL_DAYS = env.int("SIMULATION_TTL_DAYS", default=90)
 
 # django-mapengine
 # ------------------------------------------------------------------------------
@@ -0,0 +1,135 @@
+"""
+Module to aggregate renewables and potential areas within user-drawn polygons.
+
+Each cluster model and potential area layer is queried in its own DB connection, thus layers are aggregated in
+parallel. Queries filter via `ST_Intersects`, which is answered from GiST index of each layer before exact geometries
+are compared. Answers are cached per data version and hash of polygon geometry.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+from django import db
+from django.contrib.gis.gdal import GDALException
+from django.contrib.gis.geos import GEOSException, GEOSGeometry, MultiPolygon, Polygon
+from django.core.cache import cache
+from django.db.models import Model, Sum
+
+from digiplan.map import caching, models, potentials
+
+# Polygons exceeding vertex limit are rejected to keep intersection queries fast
+MAX_VERTICES = 5000
+# Upper bound of parallel DB connections per analysis
+MAX_WORKERS = 8
+
+AREA_SQL = """
+SELECT COALESCE(ST_Area(ST_Union(ST_Intersection(geom, ST_GeomFromEWKT(%(polygon)s)))::geography) / 1e6, 0)
+FROM {table}
+WHERE ST_Intersects(geom, ST_GeomFromEWKT(%(polygon)s))
+"""
+
+
+def parse_polygon(geojson: str) -> Union[Polygon, MultiPolygon]:
+    """
+    Return polygon from GeoJSON geometry given in WGS84.
+
+    Parameters
+    ----------
+    geojson: str
+        GeoJSON geometry of type Polygon or MultiPolygon
+
+    Returns
+    -------
+    Union[Polygon, MultiPolygon]
+        Polygon in WGS84
+
+    Raises
+    ------
+    ValueError
+        if geometry cannot be parsed, is no valid (multi)polygon or exceeds vertex limit
+    """
+    try:
+        polygon = GEOSGeometry(geojson, srid=4326)
+    except (GEOSException, GDALException, TypeError, ValueError) as error:
+        msg = "Polygon must be given as GeoJSON geometry"
+        raise ValueError(msg) from error
+    if not isinstance(polygon, (Polygon, MultiPolygon)) or polygon.empty or not polygon.valid:
+        msg = "Geometry must be a valid polygon or multipolygon"
+        raise ValueError(msg)
+    if polygon.num_coords > MAX_VERTICES:
+        msg = f"Polygon must not have more than {MAX_VERTICES} vertices"
+        raise ValueError(msg)
+    polygon.srid = 4326
+    return polygon
+
+
+def get_polygon_hash(polygon: Union[Polygon, MultiPolygon]) -> str:
+    """Return hash of polygon independent of its GeoJSON formatting."""
+    return hashlib.sha1(bytes(polygon.ewkb)).hexdigest()  # noqa: S324
+
+
+def aggregate_renewables(model: type[Model], polygon: Union[Polygon, MultiPolygon]) -> dict[str, float]:
+    """Return summed unit count, net and gross capacity of cluster model within polygon."""
+    values = model.objects.filter(geom__intersects=polygon).aggregate(
+        unit_count=Sum("unit_count"),
+        capacity_net=Sum("capacity_net"),
+        capacity_gross=Sum("capacity_gross"),
+    )
+    return {name: value or 0 for name, value in values.items()}
+
+
+def aggregate_area(model: type[Model], polygon: Union[Polygon, MultiPolygon]) -> float:
+    """Return area of potential area layer within polygon in km²."""
+    with db.connection.cursor() as cursor:
+        cursor.execute(AREA_SQL.format(table=model._meta.db_table), {"polygon": polygon.ewkt})  # noqa: SLF001
+        return float(cursor.fetchone()[0])
+
+
+def _aggregate_in_thread(aggregate: tuple) -> Union[dict[str, float], float]:
+    """Run aggregation in executor thread and close connection of thread afterwards."""
+    func, model, polygon = aggregate
+    try:
+        return func(model, polygon)
+    finally:
+        db.connection.close()
+
+
+def analyse(polygon: Union[Polygon, MultiPolygon]) -> dict:
+    """
+    Return renewables and potential areas within polygon (cached per data version and polygon).
+
+    Parameters
+    ----------
+    polygon: Union[Polygon, MultiPolygon]
+        Polygon in WGS84
+
+    Returns
+    -------
+    dict
+        Area of polygon in km², unit count, net and gross capacity per technology and area in km² per potential area
+        layer and technology
+    """
+    key = caching.get_key("analysis", get_polygon_hash(polygon))
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    renewables = models.RenewableStats.TECHNOLOGIES
+    layers = [(technology, layer) for technology, areas in potentials.POTENTIAL_AREAS.items() for layer in areas]
+    aggregates = [(aggregate_renewables, model, polygon) for model in renewables.values()] + [
+        (aggregate_area, potentials.POTENTIAL_AREAS[technology][layer], polygon) for technology, layer in layers
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="analysis") as pool:
+        values = list(pool.map(_aggregate_in_thread, aggregates))
+    count = len(renewables)
+
+    result = {
+        "area": polygon.transform(3035, clone=True).area / 1e6,
+        "renewables": dict(zip(renewables, values[:count])),
+        "potentials": {technology: {} for technology in potentials.POTENTIAL_AREAS},
+    }
+    for (technology, layer), area in zip(layers, values[count:]):
+        result["potentials"][technology][layer] = area
+    cache.set(key, result, timeout=caching.DATA_TIMEOUT)
+    return result
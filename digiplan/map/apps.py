@@ -15,10 +15,13 @@ class MapConfig(AppConfig):
     def ready(self) -> None:
         """Content in here is run when app is ready."""
         # pylint: disable=C0415
+        from django.db.models.signals import post_delete
         from django_oemof import hooks
+        from django_oemof.models import Simulation
 
         # pylint: disable=C0415
         from digiplan.map import hooks as digiplan_hooks
+        from digiplan.map import result_store
 
         hooks.register_hook(
             hooks.HookType.SETUP,
@@ -39,3 +42,5 @@ class MapConfig(AppConfig):
             hooks.HookType.PARAMETER,
             hooks.Hook(scenario=hooks.ALL_SCENARIOS, function=digiplan_hooks.adapt_renewable_capacities),
         )
+
+        post_delete.connect(result_store.delete_results, sender=Simulation)
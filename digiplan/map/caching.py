@@ -0,0 +1,205 @@
+"""Module to support caching of calculated data across requests."""
+
+import functools
+import hashlib
+import json
+import logging
+import pathlib
+from collections.abc import Callable
+from typing import Any, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import translation
+from django_oemof.settings import OEMOF_DIR
+
+from digiplan import __version__
+from digiplan.map import models
+
+DATA_VERSION_KEY = "data_version"
+# Data version is read from cache and refreshed from DB after given seconds, thus all processes follow a new version
+DATA_VERSION_TIMEOUT = 60
+# Used until a data version has been stored, as calculating a version is too expensive to be done within a request
+INITIAL_DATA_VERSION = "initial"
+
+# Entries depending on data version only are valid until data changes; simulation based entries expire after one day
+DATA_TIMEOUT = None
+SIMULATION_TIMEOUT = 60 * 60 * 24
+
+# Tables not holding loaded data or derived from loaded data
+UNVERSIONED_MODELS = ("DataVersion", "SimulationUsage", "RenewableStats")
+
+
+def get_file_hash(path: pathlib.Path) -> str:
+    """
+    Return hash over relative paths and content of all files in given folder.
+
+    Parameters
+    ----------
+    path: pathlib.Path
+        Data folder
+
+    Returns
+    -------
+    str
+        SHA1 hash, empty if folder does not exist
+    """
+    if not path.is_dir():
+        return ""
+    file_hash = hashlib.sha1()  # noqa: S324
+    for filename in sorted(path.rglob("*")):
+        if not filename.is_file():
+            continue
+        file_hash.update(str(filename.relative_to(path)).encode("utf-8"))
+        with filename.open("rb") as file:
+            for chunk in iter(functools.partial(file.read, 2**20), b""):
+                file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_file_hashes() -> dict[str, str]:
+    """Return hashes of digipipe data (including geodata loaded into tables) and oemof scenario."""
+    return {
+        "digipipe": get_file_hash(pathlib.Path(settings.DIGIPIPE_DIR)),
+        "oemof": get_file_hash(OEMOF_DIR / settings.OEMOF_SCENARIO),
+    }
+
+
+def get_table_stamps() -> dict[str, str]:
+    """
+    Return load stamp per data table.
+
+    Stamps cover changes of table contents not originating from data files, e.g. rows added or deleted via admin or
+    shell. Tables loaded with explicit IDs (i.e. municipalities) keep their stamp when identical data is reloaded;
+    changes of loaded data are covered by file hash of geodata.
+
+    Returns
+    -------
+    dict[str, str]
+        Number of rows and highest ID per model
+    """
+    stamps = {}
+    for model in apps.get_app_config("map").get_models():
+        if model.__name__ in UNVERSIONED_MODELS:
+            continue
+        stamp = model.objects.aggregate(count=Count("pk"), max_id=Max("pk"))
+        stamps[model.__name__] = f"{stamp['count']}:{stamp['max_id']}"
+    return stamps
+
+
+def get_fingerprint(files: dict[str, str], tables: dict[str, str]) -> str:
+    """Return fingerprint from file hashes and table stamps."""
+    return hashlib.sha1(json.dumps([files, tables], sort_keys=True).encode("utf-8")).hexdigest()  # noqa: S324
+
+
+def get_data_version() -> str:
+    """
+    Return current data version.
+
+    Data version is a fingerprint of digipipe and oemof scenario files and loaded tables. It is stored in DB and
+    shared via cache. If no data version has been stored yet, `INITIAL_DATA_VERSION` is returned and a warning is
+    logged; data version is stored when loading data or via `make bump_data_version`.
+
+    Returns
+    -------
+    str
+        current data version
+    """
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        try:
+            version = models.DataVersion.objects.latest().fingerprint
+        except models.DataVersion.DoesNotExist:
+            logging.warning("No data version stored yet, run `make bump_data_version` after data has been loaded.")
+            version = INITIAL_DATA_VERSION
+        cache.set(DATA_VERSION_KEY, version, timeout=DATA_VERSION_TIMEOUT)
+    return version
+
+
+def bump_data_version() -> str:
+    """
+    Recalculate data version and store it, if data has changed; this invalidates all cached entries depending on data.
+
+    Returns
+    -------
+    str
+        new data version
+    """
+    files = get_file_hashes()
+    tables = get_table_stamps()
+    fingerprint = get_fingerprint(files, tables)
+    latest = models.DataVersion.objects.order_by("-created").values_list("fingerprint", flat=True).first()
+    if fingerprint != latest:
+        models.DataVersion.objects.create(fingerprint=fingerprint, files=files, tables=tables)
+        logging.info(f"Data version changed from {latest} to {fingerprint}.")
+    cache.set(DATA_VERSION_KEY, fingerprint, timeout=DATA_VERSION_TIMEOUT)
+    return fingerprint
+
+
+def get_key(*parts: Any) -> str:  # noqa: ANN401
+    """
+    Return cache key from given parts prefixed by current data version.
+
+    Parameters
+    ----------
+    parts: Any
+        Parts of key, `None` parts are skipped
+
+    Returns
+    -------
+    str
+        cache key
+    """
+    return ":".join(str(part) for part in (f"v{get_data_version()}", *parts) if part is not None)
+
+
+def get_timeout(*, simulation_based: bool = False) -> Optional[int]:
+    """Return cache timeout depending on whether cached entry is simulation based or not."""
+    return SIMULATION_TIMEOUT if simulation_based else DATA_TIMEOUT
+
+
+def cached(func: Callable) -> Callable:
+    """
+    Cache result of function depending on data only (not on simulations) per data version and arguments.
+
+    Parameters
+    ----------
+    func: Callable
+        Function to cache, its arguments must be representable as strings
+
+    Returns
+    -------
+    Callable
+        Function returning cached result
+    """
+
+    @functools.wraps(func)
+    def inner(*args, **kwargs) -> Any:  # noqa: ANN002, ANN401
+        key = get_key(func.__module__, func.__qualname__, *args, *(f"{name}={kwargs[name]}" for name in sorted(kwargs)))
+        result = cache.get(key)
+        if result is None:
+            result = func(*args, **kwargs)
+            cache.set(key, result, timeout=DATA_TIMEOUT)
+        return result
+
+    return inner
+
+
+def get_etag(*parts: Any) -> str:  # noqa: ANN401
+    """
+    Return ETag for given parts including data version, language and app version.
+
+    Parameters
+    ----------
+    parts: Any
+        Parts identifying response (i.e. lookup and simulation ID), `None` parts are skipped
+
+    Returns
+    -------
+    str
+        unquoted ETag
+    """
+    key = get_key(*parts, translation.get_language(), __version__)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()  # noqa: S324
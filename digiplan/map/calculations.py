@@ -2,14 +2,15 @@
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django_oemof.models import Simulation
-from django_oemof.results import get_results
 from oemof.tabular.postprocessing import calculations, core, helper
 
-from digiplan.map import config, datapackage, models
+from digiplan.map import caching, config, datapackage, models, result_store
+from digiplan.map.result_store import get_results
 
 
 def calculate_square_for_value(df: pd.DataFrame) -> pd.DataFrame:
@@ -41,12 +42,11 @@ def calculate_square_for_value(df: pd.DataFrame) -> pd.DataFrame:
 
 def value_per_municipality(series: pd.Series) -> pd.DataFrame:
     """Shares values across areas (dummy function)."""
-    data = pd.concat([series] * 20, axis=1).transpose()
-    data.index = range(20)
     areas = (
         pd.DataFrame.from_records(models.Municipality.objects.all().values("id", "area")).set_index("id").sort_index()
     )
-    result = data.sort_index() / areas.to_numpy()
+    data = pd.DataFrame([series.to_numpy()] * len(areas), index=areas.index, columns=series.index)
+    result = data / areas.to_numpy()
     return result / areas.sum().sum()
 
 
@@ -69,12 +69,8 @@ def calculate_capita_for_value(df: pd.DataFrame) -> pd.DataFrame:
         is_series = True
         df = pd.DataFrame(df)  # noqa: PD901
 
-    population = (
-        pd.DataFrame.from_records(models.Population.objects.filter(year=2022).values("municipality__id", "value"))
-        .set_index("municipality__id")
-        .sort_index()
-    )
-    result = df / population.sum().sum() if len(df) == 1 else df.sort_index() / population.to_numpy()
+    population = models.Population.quantity_per_municipality(2022).sort_index()
+    result = df / population.sum() if len(df) == 1 else df.sort_index() / population.to_numpy()[:, np.newaxis]
     if is_series:
         return result.iloc[:, 0]
     return result
@@ -91,8 +87,8 @@ def companies_per_municipality() -> pd.DataFrame:
 
 
 def batteries_per_municipality() -> pd.DataFrame:
-    """Return battery count per municipality."""
-    return datapackage.get_batteries()["count"]
+    """Return count of batteries in operation per municipality."""
+    return models.RenewableStats.per_municipality("storage", "unit_count", status=models.RenewableStats.OPERATING)
 
 
 def battery_capacities_per_municipality() -> pd.DataFrame:
@@ -102,14 +98,18 @@ def battery_capacities_per_municipality() -> pd.DataFrame:
 
 def capacities_per_municipality() -> pd.DataFrame:
     """
-    Calculate capacity of renewables per municipality in MW.
+    Calculate capacity of renewables in operation per municipality in MW.
 
     Returns
     -------
     pd.DataFrame
         Capacity per municipality (index) and technology (column)
     """
-    return datapackage.get_capacities_from_datapackage()
+    capacities = models.RenewableStats.per_municipality(
+        ["wind", "pv_roof", "pv_ground", "hydro", "biomass"],
+        status=models.RenewableStats.OPERATING,
+    )
+    return capacities / 1e3  # Net capacity of cluster units is given in kW
 
 
 def capacities_per_municipality_2045(simulation_id: int) -> pd.DataFrame:
@@ -516,10 +516,7 @@ def calculate_potential_shares(parameters: dict) -> pd.DataFrame:
     """Calculate potential shares depending on user settings."""
     # DISAGGREGATION
     # Wind
-    wind_areas = pd.read_csv(
-        settings.DIGIPIPE_DIR.path("scalars").path("potentialarea_wind_area_stats_muns.csv"),
-        index_col=0,
-    )
+    wind_areas = datapackage.get_potential_areas("wind")
     if parameters["s_w_3"]:
         wind_area_per_mun = wind_areas["stp_2018_vreg"]
     elif parameters["s_w_4_1"]:
@@ -537,9 +534,7 @@ def calculate_potential_shares(parameters: dict) -> pd.DataFrame:
     wind_share_per_mun = wind_area_per_mun / wind_area_per_mun.sum()
 
     # PV ground
-    pv_ground_areas = pd.read_csv(
-        settings.DIGIPIPE_DIR.path("scalars").path("potentialarea_pv_ground_area_stats_muns.csv", index_col=0),
-    )
+    pv_ground_areas = datapackage.get_potential_areas("pv_ground")
     pv_ground_area_per_mun = (
         pv_ground_areas["agriculture_lfa-off_region"] * parameters["s_pv_ff_3"] / 100
         + pv_ground_areas["road_railway_region"] * parameters["s_pv_ff_4"] / 100
@@ -570,9 +565,10 @@ def calculate_potential_shares(parameters: dict) -> pd.DataFrame:
     return shares
 
 
+@caching.cached
 def electricity_overview(year: int) -> pd.Series:
     """
-    Return static data for electricity overview chart for given year.
+    Return static data for electricity overview chart for given year (cached per data version).
 
     Parameters
     ----------
@@ -670,40 +666,66 @@ def renewable_electricity_production(simulation_id: int) -> pd.Series:
     return renewables
 
 
-def get_regional_independency(simulation_id: int) -> tuple[int, int, int, int]:
-    """Return electricity autarky for 2022 and user scenario."""
-    # 2022
-    demand = datapackage.get_hourly_electricity_demand(2022)
+# Renewables used to calculate status quo autarky and related full load hours / capacities
+AUTARKY_TECHNOLOGIES = {
+    "wind-onshore": "wind",
+    "solar-pv_ground": "pv_ground",
+    "solar-pv_rooftop": "pv_roof",
+    "hydro-ror": "ror",
+}
+
+
+def get_autarky(renewables: np.ndarray, demand: np.ndarray) -> tuple[float, float]:
+    """
+    Return electricity autarky from hourly renewable production and demand.
+
+    Parameters
+    ----------
+    renewables: np.ndarray
+        Hourly production of all renewables
+    demand: np.ndarray
+        Hourly demand
+
+    Returns
+    -------
+    tuple[float, float]
+        Share of renewable production in demand and share of hours with surplus in percent
+    """
+    summary = round(float(renewables.sum() / demand.sum() * 100), 1)
+    temporal = round(float(np.count_nonzero(renewables > demand) / len(demand) * 100), 1)
+    return summary, temporal
+
+
+@caching.cached
+def get_regional_independency_2022() -> tuple[float, float]:
+    """
+    Return electricity autarky for 2022.
+
+    Status quo autarky only depends on data, thus it is calculated once per data version and cached.
+
+    Returns
+    -------
+    tuple[float, float]
+        Summary and temporal autarky in percent
+    """
+    demand = datapackage.get_hourly_electricity_demand(2022).to_numpy()
     full_load_hours = datapackage.get_full_load_hours(2022)
     capacities = datapackage.get_capacities_from_sliders(2022)
-    technology_mapping = {
-        "ABW-wind-onshore": "wind",
-        "ABW-solar-pv_ground": "pv_ground",
-        "ABW-solar-pv_rooftop": "pv_roof",
-        "ABW-hydro-ror": "ror",
-    }
-    renewables = []
-    for technology, mapped_key in technology_mapping.items():
-        renewables.append(
-            datapackage.get_profile(technology[4:]) * full_load_hours[mapped_key] * capacities[mapped_key],
-        )
-    renewables_summed_flow = pd.concat(renewables, axis=1).sum(axis=1)
-    # summary
-    independency_summary_2022 = round(renewables_summed_flow.sum() / demand.sum() * 100, 1)
-    # temporal
-    independency_temporal_2022 = renewables_summed_flow - demand
-    independency_temporal_2022 = round(sum(independency_temporal_2022 > 0) / 8760 * 100, 1)
-
-    # USER
-    results = get_results(
-        simulation_id,
-        {"renewable_flows": renewable_flows, "demand_flows": demand_flows},
+    technologies = list(AUTARKY_TECHNOLOGIES.values())
+    profiles = np.column_stack([datapackage.get_profile(technology) for technology in AUTARKY_TECHNOLOGIES])
+    renewables = profiles @ (full_load_hours[technologies] * capacities[technologies]).to_numpy()
+    return get_autarky(renewables, demand)
+
+
+def get_regional_independency(simulation_id: int) -> tuple[float, float, float, float]:
+    """Return electricity autarky for 2022 and user scenario."""
+    independency_summary_2022, independency_temporal_2022 = get_regional_independency_2022()
+    # Only precomputed hourly sums are read from result store, single flows are not needed
+    store = result_store.get_store(simulation_id, [renewable_flows, demand_flows])
+    independency_summary, independency_temporal = get_autarky(
+        store.read_row_sums(renewable_flows).to_numpy(),
+        store.read_row_sums(demand_flows).to_numpy(),
     )
-    # summary
-    independency_summary = round(results["renewable_flows"].sum().sum() / results["demand_flows"].sum().sum() * 100, 1)
-    # temporal
-    independency_temporal = results["renewable_flows"].sum(axis=1) - results["demand_flows"].sum(axis=1)
-    independency_temporal = round(sum(independency_temporal > 0) / 8760 * 100, 1)
     return independency_summary_2022, independency_temporal_2022, independency_summary, independency_temporal
 
 
@@ -728,6 +750,31 @@ def get_reduction(simulation_id: int) -> tuple[int, int]:
     return round(import_reduction / summed_reduction * reduction), round(res_reduction / summed_reduction * reduction)
 
 
+@caching.cached
+def heat_overview_statusquo(distribution: str) -> dict:
+    """
+    Return static data for heat overview chart for 2022 and 2045 (cached per data version).
+
+    Parameters
+    ----------
+    distribution: str
+        central/decentral
+
+    Returns
+    -------
+    dict
+        containing heat demand and production for all sectors (hh, cts, ind) and technologies per year
+    """
+    demand_per_sector = datapackage.get_heat_demand(distribution=distribution)
+    data = {}
+    for year in (2022, 2045):
+        data[str(year)] = {
+            f"heat-demand-{sector}": demand[str(year)].sum() for sector, demand in demand_per_sector.items()
+        }
+        data[str(year)].update(get_heat_production(distribution, year))
+    return data
+
+
 def heat_overview(simulation_id: int, distribution: str) -> dict:
     """
     Return data for heat overview chart.
@@ -744,13 +791,7 @@ def heat_overview(simulation_id: int, distribution: str) -> dict:
     dict
         containing heat demand and production for all sectors (hh, cts, ind) and technologies
     """
-    data = {}
-    for year in (2022, 2045):
-        demand = datapackage.get_heat_demand(distribution=distribution)
-        demand = {f"heat-demand-{sector}": demand[str(year)].sum() for sector, demand in demand.items()}
-        data[str(year)] = demand
-        data[str(year)].update(get_heat_production(distribution, year))
-
+    data = heat_overview_statusquo(distribution)
     results = get_results(
         simulation_id,
         {"heat_demand": heat_demand, "heat_production": heat_production},
@@ -940,3 +981,18 @@ demand_flows = core.ParametrizedCalculation(
         ],
     },
 )
+
+electricity_exchange_flows = core.ParametrizedCalculation(
+    Flows,
+    {
+        "from_nodes": ["ABW-electricity-import"],
+        "to_nodes": ["ABW-electricity-export"],
+    },
+)
+
+heatpump_flows = core.ParametrizedCalculation(
+    Flows,
+    {
+        "to_nodes": ["ABW-electricity-heatpump_decentral", "ABW-electricity-heatpump_central"],
+    },
+)
@@ -1,16 +1,57 @@
 """Module for extracting structure and data for charts."""
 
+import copy
+import functools
 import json
 import pathlib
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import pandas as pd
 from django.utils.translation import gettext_lazy as _
 
-from digiplan.map import calculations, config, models
+from digiplan.map import calculations, config, indicators
 from digiplan.map.utils import merge_dicts
 
 
+@functools.cache
+def load_chart_options(lookup: str) -> dict:
+    """
+    Load options for a chart from the corresponding json file merged into general options.
+
+    Chart files are static, thus they are read once per process. Options must be copied before changing them.
+
+    Parameters
+    ----------
+    lookup: str
+        Name of chart file
+
+    Returns
+    -------
+    dict
+        Containing the json that can be filled with data
+
+    Raises
+    ------
+    LookupError
+        if lookup can't be found in charts folder
+    """
+    lookup_path = pathlib.Path(config.CHARTS_DIR.path(f"{lookup}.json"))
+    if not lookup_path.exists():
+        error_msg = f"Could not find lookup '{lookup}' in charts folder."
+        raise LookupError(error_msg)
+
+    with lookup_path.open("r", encoding="utf-8") as lookup_json:
+        lookup_options = json.load(lookup_json)
+
+    with pathlib.Path(config.CHARTS_DIR.path("general_options.json")).open(
+        "r",
+        encoding="utf-8",
+    ) as general_chart_json:
+        general_chart_options = json.load(general_chart_json)
+
+    return merge_dicts(general_chart_options, lookup_options)
+
+
 class Chart:
     """Base class for charts."""
 
@@ -72,22 +113,7 @@ class Chart:
         LookupError
             if lookup can't be found in LOOKUPS
         """
-        lookup_path = pathlib.Path(config.CHARTS_DIR.path(f"{self.lookup}.json"))
-        if not lookup_path.exists():
-            error_msg = f"Could not find lookup '{self.lookup}' in charts folder."
-            raise LookupError(error_msg)
-
-        with lookup_path.open("r", encoding="utf-8") as lookup_json:
-            lookup_options = json.load(lookup_json)
-
-        with pathlib.Path(config.CHARTS_DIR.path("general_options.json")).open(
-            "r",
-            encoding="utf-8",
-        ) as general_chart_json:
-            general_chart_options = json.load(general_chart_json)
-
-        options = merge_dicts(general_chart_options, lookup_options)
-        return options
+        return copy.deepcopy(load_chart_options(self.lookup))
 
     def get_chart_data(self) -> None:
         """
@@ -293,7 +319,7 @@ class PopulationRegionChart(Chart):
 
     def get_chart_data(self) -> None:
         """Calculate population for whole region."""
-        return models.Population.quantity_per_municipality_per_year().sum()
+        return indicators.get_population_per_year().sum()
 
     def get_chart_options(self) -> dict:
         """Overwrite title and unit."""
@@ -308,10 +334,8 @@ class PopulationDensityRegionChart(Chart):
     lookup = "population"
 
     def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return calculations.calculate_square_for_value(
-            pd.DataFrame(models.Population.quantity_per_municipality_per_year().sum()).transpose(),
-        ).sum()
+        """Calculate population density for whole region."""
+        return indicators.get_population_per_year().sum() / indicators.get_areas().sum()
 
     def get_chart_options(self) -> dict:
         """Overwrite title and unit."""
@@ -321,641 +345,246 @@ class PopulationDensityRegionChart(Chart):
         return chart_options
 
 
-class EmployeesRegionChart(Chart):
-    """Chart for regional employees."""
+class IndicatorRegionChart(Chart):
+    """Chart showing variant of an indicator declared in `digiplan.map.indicators` for whole region."""
 
-    lookup = "wind_turbines"
+    indicator: str = None
+    variant: str = "absolute"
+    decimals: int = 1
+    unit: Optional[str] = None
+    legend: bool = True
 
-    def get_chart_data(self) -> list:
-        """Calculate population for whole region."""
-        return [int(calculations.employment_per_municipality().sum())]
+    def get_region_values(
+        self,
+        scenario: str = "statusquo",
+        simulation_id: Optional[int] = None,
+    ) -> Union[pd.Series, float, int]:
+        """Return rounded region values of indicator for given scenario."""
+        values = indicators.get_region_values(self.indicator, self.variant, scenario, simulation_id)
+        return indicators.round_values(values, self.decimals)
+
+    def get_chart_data(self) -> Any:  # noqa: ANN401
+        """Return region values per technology/sector or single region value."""
+        values = self.get_region_values()
+        return values if isinstance(values, pd.Series) else [values]
 
     def get_chart_options(self) -> dict:
         """Overwrite title and unit."""
         chart_options = super().get_chart_options()
         chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = "Beschäftigte"
-        del chart_options["series"][0]["name"]
+        if self.unit is not None:
+            chart_options["yAxis"]["name"] = self.unit
+        if not self.legend:
+            del chart_options["series"][0]["name"]
         return chart_options
 
 
-class CompaniesRegionChart(Chart):
-    """Chart for regional companies."""
-
-    lookup = "wind_turbines"
+class IndicatorRegion2045Chart(SimulationChart, IndicatorRegionChart):
+    """Chart comparing status quo and simulation values of an indicator for whole region."""
 
     def get_chart_data(self) -> list:
-        """Calculate population for whole region."""
-        return [int(calculations.companies_per_municipality().sum())]
+        """Return pairs of status quo and simulation values per technology/sector or single pair."""
+        status_quo_data = self.get_region_values()
+        future_data = self.get_region_values("2045", self.simulation_id)
+        if isinstance(status_quo_data, pd.Series):
+            return list(zip(status_quo_data, future_data))
+        return [status_quo_data, future_data]
 
     def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
+        """Overwrite scenario labels."""
         chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = "Betriebe"
-        del chart_options["series"][0]["name"]
+        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
         return chart_options
 
 
-class CapacityRegionChart(Chart):
-    """Chart for regional capacities."""
-
-    lookup = "capacity"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return calculations.capacities_per_municipality().sum().round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        return chart_options
-
+class EmployeesRegionChart(IndicatorRegionChart):
+    """Chart for regional employees."""
 
-class Capacity2045RegionChart(SimulationChart):
-    """Chart for regional capacities in 2045."""
+    lookup = "wind_turbines"
+    indicator = "employees"
+    decimals = 0
+    unit = "Beschäftigte"
+    legend = False
 
-    lookup = "capacity"
 
-    def get_chart_data(self) -> list:
-        """Calculate capacities for whole region."""
-        status_quo_data = calculations.capacities_per_municipality().sum().round(1)
-        future_data = calculations.capacities_per_municipality_2045(self.simulation_id).sum().astype(float).round(1)
-        return list(zip(status_quo_data, future_data))
+class CompaniesRegionChart(IndicatorRegionChart):
+    """Chart for regional companies."""
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        chart_options["title"]["text"] = "Region ABW"
-        return chart_options
+    lookup = "wind_turbines"
+    indicator = "companies"
+    decimals = 0
+    unit = "Betriebe"
+    legend = False
 
 
-class CapacitySquareRegionChart(Chart):
-    """Chart for regional capacities per square meter."""
+class CapacityRegionChart(IndicatorRegionChart):
+    """Chart for regional capacities."""
 
     lookup = "capacity"
+    indicator = "capacity"
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return (
-            calculations.calculate_square_for_value(
-                pd.DataFrame(calculations.capacities_per_municipality().sum()).transpose(),
-            )
-            .round(2)
-            .sum()
-        )
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("MW")
-        return chart_options
-
-
-class CapacitySquare2045RegionChart(SimulationChart):
+class Capacity2045RegionChart(IndicatorRegion2045Chart, CapacityRegionChart):
     """Chart for regional capacities in 2045."""
 
-    lookup = "capacity"
-
-    def get_chart_data(self) -> list:
-        """Calculate capacities for whole region."""
-        status_quo_data = (
-            calculations.calculate_square_for_value(
-                pd.DataFrame(calculations.capacities_per_municipality().sum()).transpose(),
-            )
-            .sum()
-            .round(2)
-        )
-        future_data = (
-            calculations.calculate_square_for_value(
-                pd.DataFrame(calculations.capacities_per_municipality_2045(self.simulation_id).sum()).transpose(),
-            )
-            .sum()
-            .astype(float)
-            .round(2)
-        )
-        return list(zip(status_quo_data, future_data))
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        chart_options["yAxis"]["name"] = _("MW")
-        chart_options["title"]["text"] = "Region ABW"
-        return chart_options
-
 
-class EnergyRegionChart(Chart):
-    """Chart for regional energy."""
+class CapacitySquareRegionChart(IndicatorRegionChart):
+    """Chart for regional capacities per km²."""
 
     lookup = "capacity"
+    indicator = "capacity"
+    variant = "square"
+    decimals = 2
+    unit = _("MW")
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return calculations.energies_per_municipality().sum().round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("GWh")
-        return chart_options
+class CapacitySquare2045RegionChart(IndicatorRegion2045Chart, CapacitySquareRegionChart):
+    """Chart for regional capacities per km² in 2045."""
 
 
-class Energy2045RegionChart(SimulationChart):
+class EnergyRegionChart(IndicatorRegionChart):
     """Chart for regional energy."""
 
     lookup = "capacity"
+    indicator = "energy"
+    unit = _("GWh")
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        status_quo_data = calculations.energies_per_municipality().sum().round(1)
-        future_data = calculations.energies_per_municipality_2045(self.simulation_id).sum().astype(float) * 1e-3
-        future_data = future_data.round(1)
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("GWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
+class Energy2045RegionChart(IndicatorRegion2045Chart, EnergyRegionChart):
+    """Chart for regional energy in 2045."""
 
 
-class EnergyShareRegionChart(Chart):
-    """Calculate RES energy shares for whole region."""
-
-    lookup = "capacity"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return calculations.energy_shares_region().round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("%")
-        return chart_options
-
-
-class EnergyShare2045RegionChart(SimulationChart):
+class EnergyShareRegionChart(IndicatorRegionChart):
     """Chart for regional energy shares."""
 
     lookup = "capacity"
+    indicator = "energy_share"
+    unit = _("%")
 
-    def get_chart_data(self) -> None:
-        """Calculate RES energy shares for whole region."""
-        status_quo_data = calculations.energy_shares_region().round(1)
-        future_data = calculations.energy_shares_2045_region(self.simulation_id).round(1)
-        return list(zip(status_quo_data, future_data))
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("%")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
-
-
-class EnergyCapitaRegionChart(Chart):
-    """Chart for regional energy shares per capita."""
-
-    lookup = "capacity"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return (
-            calculations.calculate_capita_for_value(
-                pd.DataFrame(calculations.energies_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e3
-        ).round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("MWh")
-        return chart_options
+class EnergyShare2045RegionChart(IndicatorRegion2045Chart, EnergyShareRegionChart):
+    """Chart for regional energy shares in 2045."""
 
 
-class EnergyCapita2045RegionChart(SimulationChart):
-    """Chart for regional energy."""
+class EnergyCapitaRegionChart(IndicatorRegionChart):
+    """Chart for regional energy per capita."""
 
     lookup = "capacity"
+    indicator = "energy"
+    variant = "capita"
+    unit = _("MWh")
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        status_quo_data = (
-            calculations.calculate_capita_for_value(
-                pd.DataFrame(calculations.energies_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e3
-        ).round(1)
-        future_data = (
-            (
-                calculations.calculate_capita_for_value(
-                    pd.DataFrame(calculations.energies_per_municipality_2045(self.simulation_id).sum()).transpose(),
-                ).sum()
-            )
-            .astype(float)
-            .round(1)
-        )
-        future_data = future_data.round(1)
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("MWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
-
-
-class EnergySquareRegionChart(Chart):
-    """Chart for regional energy shares per square meter."""
-
-    lookup = "capacity"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return (
-            calculations.calculate_square_for_value(
-                pd.DataFrame(calculations.energies_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e3
-        ).round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("MWh")
-        return chart_options
+class EnergyCapita2045RegionChart(IndicatorRegion2045Chart, EnergyCapitaRegionChart):
+    """Chart for regional energy per capita in 2045."""
 
 
-class EnergySquare2045RegionChart(SimulationChart):
-    """Chart for regional energy shares per square meter."""
+class EnergySquareRegionChart(IndicatorRegionChart):
+    """Chart for regional energy per km²."""
 
     lookup = "capacity"
+    indicator = "energy"
+    variant = "square"
+    unit = _("MWh")
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        status_quo_data = (
-            calculations.calculate_square_for_value(
-                pd.DataFrame(calculations.energies_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e3
-        ).round(1)
-        future_data = (
-            (
-                calculations.calculate_square_for_value(
-                    pd.DataFrame(calculations.energies_per_municipality_2045(self.simulation_id).sum()).transpose(),
-                ).sum()
-            )
-            .astype(float)
-            .round(1)
-        )
-        future_data = future_data.round(1)
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("MWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
+class EnergySquare2045RegionChart(IndicatorRegion2045Chart, EnergySquareRegionChart):
+    """Chart for regional energy per km² in 2045."""
 
 
-class WindTurbinesRegionChart(Chart):
+class WindTurbinesRegionChart(IndicatorRegionChart):
     """Chart for regional wind turbines."""
 
     lookup = "wind_turbines"
-
-    def get_chart_data(self) -> list[int]:
-        """Calculate population for whole region."""
-        return [int(models.WindTurbine.quantity_per_municipality().sum())]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        return chart_options
+    indicator = "wind_turbines"
+    decimals = 0
 
 
-class WindTurbines2045RegionChart(SimulationChart):
+class WindTurbines2045RegionChart(IndicatorRegion2045Chart, WindTurbinesRegionChart):
     """Chart for regional wind turbines in 2045."""
 
-    lookup = "wind_turbines"
-
-    def get_chart_data(self) -> list[int]:
-        """Calculate population for whole region."""
-        status_quo_data = models.WindTurbine.quantity_per_municipality().sum()
-        future_data = calculations.wind_turbines_per_municipality_2045(self.simulation_id).sum()
-        return [int(status_quo_data), int(future_data)]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        chart_options["title"]["text"] = "Region ABW"
-        return chart_options
-
-
-class WindTurbinesSquareRegionChart(Chart):
-    """Chart for regional wind turbines per square meter."""
-
-    lookup = "wind_turbines"
-
-    def get_chart_data(self) -> list[float]:
-        """Calculate population for whole region."""
-        return [
-            float(
-                calculations.calculate_square_for_value(
-                    pd.DataFrame({"turbines": models.WindTurbine.quantity_per_municipality().sum()}, index=[1]),
-                )
-                .sum()
-                .round(2),
-            ),
-        ]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = "WEA/km²"
-        return chart_options
-
 
-class WindTurbinesSquare2045RegionChart(SimulationChart):
-    """Chart for regional wind turbines per square meter in 2045."""
+class WindTurbinesSquareRegionChart(IndicatorRegionChart):
+    """Chart for regional wind turbines per km²."""
 
     lookup = "wind_turbines"
+    indicator = "wind_turbines"
+    variant = "square"
+    decimals = 2
+    unit = "WEA/km²"
 
-    def get_chart_data(self) -> list[float]:
-        """Calculate population for whole region."""
-        status_quo_data = (
-            calculations.calculate_square_for_value(
-                pd.DataFrame({"turbines": models.WindTurbine.quantity_per_municipality().sum()}, index=[1]),
-            )
-            .sum()
-            .round(2)
-        )
-        future_data = (
-            calculations.calculate_square_for_value(
-                pd.DataFrame(
-                    {"turbines": calculations.wind_turbines_per_municipality_2045(self.simulation_id).sum()},
-                    index=[1],
-                ),
-            )
-            .sum()
-            .round(2)
-        )
-        return [float(status_quo_data), float(future_data)]
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = ""
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+class WindTurbinesSquare2045RegionChart(IndicatorRegion2045Chart, WindTurbinesSquareRegionChart):
+    """Chart for regional wind turbines per km² in 2045."""
 
 
-class ElectricityDemandRegionChart(Chart):
+class ElectricityDemandRegionChart(IndicatorRegionChart):
     """Chart for regional electricity demand."""
 
     lookup = "electricity_demand"
+    indicator = "electricity_demand"
+    unit = _("GWh")
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return calculations.electricity_demand_per_municipality().sum().round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("GWh")
-        return chart_options
-
-
-class ElectricityDemand2045RegionChart(SimulationChart):
-    """Chart for regional electricity demand."""
-
-    lookup = "electricity_demand"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        status_quo_data = calculations.electricity_demand_per_municipality().sum().round(1)
-        future_data = (
-            calculations.electricity_demand_per_municipality_2045(self.simulation_id).sum().astype(float).round(1)
-        )
-        return list(zip(status_quo_data, future_data))
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("GWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
-
-
-class ElectricityDemandCapitaRegionChart(Chart):
-    """Chart for regional electricity demand per population."""
-
-    lookup = "electricity_demand"
-
-    def get_chart_data(self) -> pd.DataFrame:
-        """Calculate capacities for whole region."""
-        return (
-            calculations.calculate_capita_for_value(
-                pd.DataFrame(calculations.electricity_demand_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e6
-        ).round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("kWh")
-        return chart_options
+class ElectricityDemand2045RegionChart(IndicatorRegion2045Chart, ElectricityDemandRegionChart):
+    """Chart for regional electricity demand in 2045."""
 
 
-class ElectricityDemandCapita2045RegionChart(SimulationChart):
-    """Chart for regional electricity demand per population in 2045."""
+class ElectricityDemandCapitaRegionChart(IndicatorRegionChart):
+    """Chart for regional electricity demand per capita."""
 
     lookup = "electricity_demand"
+    indicator = "electricity_demand"
+    variant = "capita"
+    unit = _("kWh")
 
-    def get_chart_data(self) -> pd.DataFrame:
-        """Calculate capacities for whole region."""
-        status_quo_data = (
-            calculations.calculate_capita_for_value(
-                pd.DataFrame(calculations.electricity_demand_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e6
-        ).round(1)
-        future_data = (
-            (
-                calculations.calculate_capita_for_value(
-                    pd.DataFrame(
-                        calculations.electricity_demand_per_municipality_2045(self.simulation_id).sum(),
-                    ).transpose(),
-                ).sum()
-                * 1e6
-            )
-            .astype(float)
-            .round(1)
-        )
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("kWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
+class ElectricityDemandCapita2045RegionChart(IndicatorRegion2045Chart, ElectricityDemandCapitaRegionChart):
+    """Chart for regional electricity demand per capita in 2045."""
 
 
-class HeatDemandRegionChart(Chart):
+class HeatDemandRegionChart(IndicatorRegionChart):
     """Chart for regional heat demand."""
 
     lookup = "heat_demand"
+    indicator = "heat_demand"
+    unit = _("GWh")
 
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return calculations.heat_demand_per_municipality().sum().round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("GWh")
-        return chart_options
-
-
-class HeatDemand2045RegionChart(SimulationChart):
+class HeatDemand2045RegionChart(IndicatorRegion2045Chart, HeatDemandRegionChart):
     """Chart for regional heat demand in 2045."""
 
-    lookup = "heat_demand"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        status_quo_data = calculations.heat_demand_per_municipality().sum().round(1)
-        future_data = calculations.heat_demand_per_municipality_2045(self.simulation_id).sum().astype(float).round(1)
-        return list(zip(status_quo_data, future_data))
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("GWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
-
-
-class HeatDemandCapitaRegionChart(Chart):
-    """Chart for regional heat demand per population."""
-
-    lookup = "heat_demand"
-
-    def get_chart_data(self) -> None:
-        """Calculate capacities for whole region."""
-        return (
-            calculations.calculate_capita_for_value(
-                pd.DataFrame(calculations.heat_demand_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e6
-        ).round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("kWh")
-        return chart_options
 
-
-class HeatDemandCapita2045RegionChart(SimulationChart):
-    """Chart for regional heat demand per population in 2045."""
+class HeatDemandCapitaRegionChart(IndicatorRegionChart):
+    """Chart for regional heat demand per capita."""
 
     lookup = "heat_demand"
+    indicator = "heat_demand"
+    variant = "capita"
+    unit = _("kWh")
 
-    def get_chart_data(self) -> pd.DataFrame:
-        """Calculate capacities for whole region."""
-        status_quo_data = (
-            calculations.calculate_capita_for_value(
-                pd.DataFrame(calculations.heat_demand_per_municipality().sum()).transpose(),
-            ).sum()
-            * 1e6
-        ).round(1)
-        future_data = (
-            (
-                calculations.calculate_capita_for_value(
-                    pd.DataFrame(
-                        calculations.heat_demand_per_municipality_2045(self.simulation_id).sum(),
-                    ).transpose(),
-                ).sum()
-                * 1e6
-            )
-            .astype(float)
-            .round(1)
-        )
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("kWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein\nSzenario"]
-        return chart_options
+class HeatDemandCapita2045RegionChart(IndicatorRegion2045Chart, HeatDemandCapitaRegionChart):
+    """Chart for regional heat demand per capita in 2045."""
 
 
-class BatteriesRegionChart(Chart):
+class BatteriesRegionChart(IndicatorRegionChart):
     """Chart for regional battery count."""
 
     lookup = "wind_turbines"
+    indicator = "batteries"
+    decimals = 0
+    unit = _("Anzahl")
+    legend = False
 
-    def get_chart_data(self) -> list:
-        """Calculate population for whole region."""
-        return [int(calculations.batteries_per_municipality().sum())]
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("Anzahl")
-        del chart_options["series"][0]["name"]
-        return chart_options
-
-
-class BatteriesCapacityRegionChart(Chart):
+class BatteriesCapacityRegionChart(IndicatorRegionChart):
     """Chart for regional battery capacity."""
 
     lookup = "wind_turbines"
-
-    def get_chart_data(self) -> list:
-        """Calculate population for whole region."""
-        return [calculations.battery_capacities_per_municipality().sum().round(1)]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = "Region ABW"
-        chart_options["yAxis"]["name"] = _("MWh")
-        del chart_options["series"][0]["name"]
-        return chart_options
+    indicator = "batteries_capacity"
+    unit = _("MWh")
+    legend = False
 
 
 CHARTS: dict[str, type[Chart]] = {
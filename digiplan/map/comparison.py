@@ -0,0 +1,138 @@
+"""
+Module to compare indicators of multiple simulations side by side.
+
+Indicators are calculated per simulation in a process pool, as calculations are CPU-bound pandas operations.
+Each result is flattened into a series of values indexed by its labels (i.e. municipality and technology) and cached
+per simulation and indicator. Afterwards, series of all simulations are aligned into one table per indicator.
+"""
+
+import functools
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+import django
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+
+from digiplan.map import caching, calculations
+
+INDICATORS = {
+    "capacities": calculations.capacities_per_municipality_2045,
+    "energies": calculations.energies_per_municipality_2045,
+    "energy_shares": calculations.energy_shares_2045_region,
+    "electricity_demand": calculations.electricity_demand_per_municipality_2045,
+    "heat_demand": calculations.heat_demand_per_municipality_2045,
+    "wind_turbines": calculations.wind_turbines_per_municipality_2045,
+    "ghg_reduction": calculations.ghg_reduction,
+    "electricity_overview": calculations.electricity_overview_from_user,
+    "electricity_heat_demand": calculations.electricity_heat_demand,
+    "renewable_electricity_production": calculations.renewable_electricity_production,
+    "regional_independency": calculations.get_regional_independency,
+    "reduction": calculations.get_reduction,
+    "heat_overview_central": functools.partial(calculations.heat_overview, distribution="central"),
+    "heat_overview_decentral": functools.partial(calculations.heat_overview, distribution="decentral"),
+}
+
+MAX_SIMULATIONS = 5
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """
+    Return process pool of current process (created on first use).
+
+    Workers are spawned instead of forked, as forking a multithreaded server process (including its DB connections)
+    is unsafe. Django is set up once per worker.
+    """
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.COMPARISON_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        )
+    return _pool
+
+
+def flatten(result: Any) -> pd.Series:  # noqa: ANN401
+    """
+    Flatten result of indicator into series of values.
+
+    Parameters
+    ----------
+    result: Any
+        Result of indicator (frame, series, nested dict, tuple or scalar)
+
+    Returns
+    -------
+    pd.Series
+        Values indexed by labels of result
+    """
+    if isinstance(result, pd.DataFrame):
+        return result.stack()  # noqa: PD013
+    if isinstance(result, pd.Series):
+        return result
+    if isinstance(result, dict):
+        return pd.json_normalize(result, sep=".").iloc[0]
+    if isinstance(result, (tuple, list)):
+        return pd.Series(result)
+    return pd.Series([result])
+
+
+def calculate_indicator(simulation_id: int, indicator: str) -> pd.Series:
+    """Calculate flattened indicator for simulation (run within process pool)."""
+    return flatten(INDICATORS[indicator](simulation_id))
+
+
+def compare(simulation_ids: list[int], indicators: list[str]) -> dict[str, pd.DataFrame]:
+    """
+    Return aligned tables of indicators for given simulations.
+
+    Cached indicators are reused, all others are calculated in parallel within process pool.
+
+    Parameters
+    ----------
+    simulation_ids: list[int]
+        Simulations to compare
+    indicators: list[str]
+        Indicators to compare, see `INDICATORS`
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Table per indicator, holding values of each simulation in a column; missing values are NaN
+    """
+    keys = {
+        (simulation_id, indicator): caching.get_key("comparison", indicator, simulation_id)
+        for simulation_id in simulation_ids
+        for indicator in indicators
+    }
+    cached = cache.get_many(keys.values())
+    values = {task: cached[key] for task, key in keys.items() if key in cached}
+
+    missing = [task for task in keys if task not in values]
+    if missing:
+        futures = {task: get_pool().submit(calculate_indicator, *task) for task in missing}
+        calculated = {task: future.result() for task, future in futures.items()}
+        cache.set_many(
+            {keys[task]: value for task, value in calculated.items()},
+            timeout=caching.get_timeout(simulation_based=True),
+        )
+        values.update(calculated)
+
+    return {
+        indicator: pd.concat(
+            {simulation_id: values[(simulation_id, indicator)] for simulation_id in simulation_ids},
+            axis=1,
+        )
+        for indicator in indicators
+    }
+
+
+def to_json(table: pd.DataFrame) -> dict:
+    """Return table in split orientation (index, columns and data) with missing values as `None`."""
+    return json.loads(table.to_json(orient="split", default_handler=str))
@@ -20,9 +20,9 @@ SCENARIOS_DIR = settings.DATA_DIR.path("scenarios")
 ENERGY_SETTINGS_PANEL_FILE = settings.APPS_DIR.path("static/config/energy_settings_panel.json")
 HEAT_SETTINGS_PANEL_FILE = settings.APPS_DIR.path("static/config/heat_settings_panel.json")
 TRAFFIC_SETTINGS_PANEL_FILE = settings.APPS_DIR.path("static/config/traffic_settings_panel.json")
-ADDITIONAL_ENERGY_SETTINGS_FILE = settings.DATA_DIR.path("digipipe/settings/energy_settings_panel.json")
-ADDITIONAL_HEAT_SETTINGS_FILE = settings.DATA_DIR.path("digipipe/settings/heat_settings_panel.json")
-ADDITIONAL_TRAFFIC_SETTINGS_FILE = settings.DATA_DIR.path("digipipe/settings/traffic_settings_panel.json")
+ADDITIONAL_ENERGY_SETTINGS_FILE = settings.DIGIPIPE_DIR.path("settings/energy_settings_panel.json")
+ADDITIONAL_HEAT_SETTINGS_FILE = settings.DIGIPIPE_DIR.path("settings/heat_settings_panel.json")
+ADDITIONAL_TRAFFIC_SETTINGS_FILE = settings.DIGIPIPE_DIR.path("settings/traffic_settings_panel.json")
 SETTINGS_DEPENDENCY_MAP_FILE = settings.APPS_DIR.path("static/config/settings_dependency_map.json")
 DEPENDENCY_PARAMETERS_FILE = settings.APPS_DIR.path("static/config/dependency_parameters.json")
 TECHNOLOGY_DATA_FILE = settings.DIGIPIPE_DIR.path("scalars").path("technology_data.json")
@@ -109,7 +109,7 @@ def get_slider_per_sector() -> dict:
     for key, value in demand.items():
         for sector in sectors:
             file = f"demand_{sector}_{value}.csv"
-            path = Path(settings.DATA_DIR, "digipipe/scalars", file)
+            path = Path(settings.DIGIPIPE_DIR, "scalars", file)
             reader = pd.read_csv(path)
             sector_dict[key][sector] = reader["2022"].sum()
     return sector_dict
@@ -119,7 +119,6 @@ def get_slider_per_sector() -> dict:
 STORE_COLD_INIT = {
     "version": __version__,
     "slider_marks": get_slider_marks(),
-    "slider_max": datapackage.get_potential_values(),
     "slider_per_sector": get_slider_per_sector(),
     "allowedSwitches": ["wind_distance"],
     "detailTab": {"showPotentialLayers": True},
@@ -127,6 +126,11 @@ STORE_COLD_INIT = {
 }
 
 
+def get_store_cold_init() -> dict:
+    """Return initial cold store including slider maxima (potentials depend on loaded data, thus not set on import)."""
+    return {**STORE_COLD_INIT, "slider_max": datapackage.get_potential_values()}
+
+
 def init_hot_store() -> str:
     """
     Initialize hot store for use in JS store.
@@ -9,22 +9,30 @@ import pandas as pd
 from django.conf import settings
 from django_oemof.settings import OEMOF_DIR
 
-from config.settings.base import DATA_DIR
-from digiplan.map import config
+from digiplan.map import caching, config, potentials
+from digiplan.utils import timing
 
+POTENTIAL_AREA_FILES = {
+    "wind": "potentialarea_wind_area_stats_muns.csv",
+    "pv_ground": "potentialarea_pv_ground_area_stats_muns.csv",
+}
 
+
+@timing.timed("csv")
 def get_employment() -> pd.DataFrame:
     """Return employment data."""
     employment_filename = settings.DIGIPIPE_DIR.path("scalars").path("employment.csv")
     return pd.read_csv(employment_filename, index_col=0)
 
 
+@timing.timed("csv")
 def get_batteries() -> pd.DataFrame:
     """Return battery data."""
     battery_filename = settings.DIGIPIPE_DIR.path("scalars").path("bnetza_mastr_storage_stats_muns.csv")
     return pd.read_csv(battery_filename)
 
 
+@timing.timed("csv")
 def get_power_demand(sector: Optional[str] = None) -> dict[str, pd.DataFrame]:
     """Return power demand for given sector or all sectors."""
     sectors = (sector,) if sector else ("hh", "cts", "ind")
@@ -35,6 +43,7 @@ def get_power_demand(sector: Optional[str] = None) -> dict[str, pd.DataFrame]:
     return demand
 
 
+@timing.timed("csv")
 def get_hourly_electricity_demand(year: int) -> pd.Series:
     """Return hourly electricity demand per sector."""
     demand_per_sector = get_power_demand()
@@ -45,6 +54,7 @@ def get_hourly_electricity_demand(year: int) -> pd.Series:
     return pd.concat(demand, axis=1).sum(axis=1)
 
 
+@timing.timed("csv")
 def get_heat_demand(sector: Optional[str] = None, distribution: Optional[str] = None) -> dict[str, pd.DataFrame]:
     """Return heat demand for given sector or all sectors."""
     sectors = (sector,) if sector else ("hh", "cts", "ind")
@@ -58,6 +68,7 @@ def get_heat_demand(sector: Optional[str] = None, distribution: Optional[str] =
     return demand
 
 
+@timing.timed("csv")
 def get_heat_capacity_shares(
     distribution: str,
     year: Optional[int] = 2045,
@@ -80,6 +91,7 @@ def get_heat_capacity_shares(
     return {k: v / summed_shares for k, v in shares.items()}
 
 
+@timing.timed("csv")
 def get_summed_heat_demand_per_municipality(
     sector: Optional[str] = None,
     distribution: Optional[str] = None,
@@ -97,6 +109,7 @@ def get_summed_heat_demand_per_municipality(
     return demand
 
 
+@timing.timed("csv")
 def get_heat_demand_profile(
     sector: Optional[str] = None,
     distribution: Optional[str] = None,
@@ -114,6 +127,7 @@ def get_heat_demand_profile(
     return demand
 
 
+@timing.timed("csv")
 def get_electricity_demand_profile(
     sector: Optional[str] = None,
 ) -> dict[str, pd.DataFrame]:
@@ -128,6 +142,7 @@ def get_electricity_demand_profile(
     return demand
 
 
+@timing.timed("csv")
 def get_thermal_efficiency(component: str) -> float:
     """Return thermal efficiency from given component from oemof scenario."""
     component_filename = OEMOF_DIR / settings.OEMOF_SCENARIO / "data" / "elements" / f"{component}.csv"
@@ -144,9 +159,36 @@ def get_thermal_efficiency(component: str) -> float:
     return pd.read_csv(sequence_filename, sep=";").iloc[:, 1]
 
 
+def get_potential_areas(technology: str) -> pd.DataFrame:
+    """
+    Return potential areas of wind or PV ground per municipality.
+
+    Areas are read from digipipe stats files or calculated from loaded potential area layers, depending on
+    `settings.POTENTIAL_AREA_SOURCE`.
+
+    Parameters
+    ----------
+    technology: str
+        "wind" or "pv_ground"
+
+    Returns
+    -------
+    pd.DataFrame
+        Area in km² per municipality (index) and potential area layer (column)
+    """
+    if settings.POTENTIAL_AREA_SOURCE == "postgis":
+        return potentials.get_areas(technology)
+    with timing.measure("csv"):
+        return pd.read_csv(
+            settings.DIGIPIPE_DIR.path("scalars").path(POTENTIAL_AREA_FILES[technology]),
+            index_col=0,
+        )
+
+
+@caching.cached
 def get_potential_values(*, per_municipality: bool = False) -> dict:
     """
-    Calculate max_values for sliders.
+    Calculate max_values for sliders (cached per data version).
 
     Parameters
     ----------
@@ -158,12 +200,6 @@ def get_potential_values(*, per_municipality: bool = False) -> dict:
     dict
         dictionary with each slider / switch and respective max_value
     """
-    scalars = {
-        "wind": "potentialarea_wind_area_stats_muns.csv",
-        "pv_ground": "potentialarea_pv_ground_area_stats_muns.csv",
-        "pv_roof": "potentialarea_pv_roof_wo_historic_area_stats_muns.csv",
-    }
-
     areas = {
         "wind": {
             "s_w_3": "stp_2018_vreg",
@@ -180,8 +216,11 @@ def get_potential_values(*, per_municipality: bool = False) -> dict:
 
     potentials = {}
     for profile in areas:
-        path = Path(DATA_DIR, "digipipe/scalars", scalars[profile])
-        reader = pd.read_csv(path)
+        if profile == "pv_roof":
+            path = Path(settings.DIGIPIPE_DIR, "scalars", "potentialarea_pv_roof_wo_historic_area_stats_muns.csv")
+            reader = pd.read_csv(path, index_col=0)
+        else:
+            reader = get_potential_areas(profile)
         for key, value in areas[profile].items():
             if key == "s_pv_d_3":
                 pv_roof_potential = reader[
@@ -212,13 +251,14 @@ def get_full_load_hours(year: int) -> pd.Series:
     return full_load_hours
 
 
+@timing.timed("csv")
 def get_capacities_from_datapackage() -> pd.DataFrame:
     """Return renewable capacities for given year from datapackage."""
     capacities = pd.concat(
         [
             pd.read_csv(
                 settings.DIGIPIPE_DIR.path("scalars").path(f"bnetza_mastr_{tech}_stats_muns.csv"),
-                index_col="municipality_id",
+                index_col=0,
                 usecols=["municipality_id", "capacity_net"],
             ).rename(columns={"capacity_net": tech})
             for tech in ["wind", "pv_roof", "pv_ground", "hydro", "biomass"]
@@ -229,6 +269,7 @@ def get_capacities_from_datapackage() -> pd.DataFrame:
     return capacities
 
 
+@timing.timed("csv")
 def get_capacities_from_sliders(year: int) -> pd.Series:
     """Return renewable capacities for given year from slider settings (totals for each technology)."""
     if year == 2022:  # noqa: PLR2004
@@ -258,6 +299,7 @@ def get_power_density(technology: Optional[str] = None) -> dict:
     return config.TECHNOLOGY_DATA["power_density"]
 
 
+@timing.timed("csv")
 def get_profile(technology: str) -> pd.Series:
     """Return profile for given technology from oemof datapackage."""
     profile_filename = OEMOF_DIR / settings.OEMOF_SCENARIO / "data" / "sequences" / f"{technology}_profile.csv"
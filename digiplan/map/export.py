@@ -0,0 +1,170 @@
+"""
+Module to export simulation results as CSV, XLSX or Parquet.
+
+Results are exported in long format, i.e. one row per value holding indicator, municipality ID (if per municipality),
+timestamp (if hourly sequence), category (i.e. technology or flow) and value.
+Rows are generated indicator by indicator and flow by flow (flows are read lazily from result store),
+thus memory stays constant regardless of number of requested indicators and sequences.
+"""
+
+import csv
+import itertools
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Optional
+
+import openpyxl
+import pandas as pd
+
+from digiplan.map import calculations, result_store, timeseries
+
+try:
+    import pyarrow as pa
+    from pyarrow import parquet
+except ImportError:
+    pa = None
+
+MUNICIPALITY_INDICATORS = {
+    "capacities": calculations.capacities_per_municipality_2045,
+    "energies": calculations.energies_per_municipality_2045,
+    "energy_shares": calculations.energy_shares_2045_per_municipality,
+    "electricity_demand": calculations.electricity_demand_per_municipality_2045,
+    "heat_demand": calculations.heat_demand_per_municipality_2045,
+    "wind_turbines": calculations.wind_turbines_per_municipality_2045,
+}
+REGION_INDICATORS = {
+    "ghg_reduction": calculations.ghg_reduction,
+    "renewable_electricity_production": calculations.renewable_electricity_production,
+}
+INDICATORS = MUNICIPALITY_INDICATORS | REGION_INDICATORS
+
+COLUMNS = ["indicator", "municipality_id", "timestamp", "category", "value"]
+BATCH_SIZE = 10000
+CHUNK_SIZE = 64 * 1024
+
+Row = tuple[str, Optional[int], Optional[str], str, float]
+
+
+def iter_rows(simulation_id: int, indicators: Iterable[str], sequences: Iterable[str] = ()) -> Iterator[Row]:
+    """
+    Generate rows of indicators and hourly sequences of simulation in long format.
+
+    Parameters
+    ----------
+    simulation_id: int
+        Simulation ID
+    indicators: Iterable[str]
+        Indicators to export, see `INDICATORS`
+    sequences: Iterable[str]
+        Hourly sequences to export, see `digiplan.map.timeseries.TIMESERIES`
+
+    Yields
+    ------
+    Row
+        indicator, municipality ID, timestamp, category and value
+    """
+    for indicator in indicators:
+        result = INDICATORS[indicator](simulation_id)
+        if indicator in MUNICIPALITY_INDICATORS:
+            if isinstance(result, pd.Series):
+                result = result.to_frame(indicator)
+            for (municipality_id, category), value in result.stack().items():  # noqa: PD013
+                yield indicator, int(municipality_id), None, str(category), float(value)
+        else:
+            for category, value in result.items():
+                yield indicator, None, None, str(category), float(value)
+
+    for lookup in sequences:
+        calculation = timeseries.TIMESERIES[lookup]
+        store = result_store.get_store(simulation_id, [calculation])
+        for flow in store.columns(calculation):
+            sequence = store.read(calculation, columns=[flow])[flow]
+            timestamps = sequence.index.strftime("%Y-%m-%dT%H:%M:%S")
+            for timestamp, value in zip(timestamps, sequence.to_numpy(dtype=float)):
+                yield lookup, None, timestamp, str(flow), float(value)
+
+
+def iter_batches(rows: Iterable[Row]) -> Iterator[list[Row]]:
+    """Group rows into batches of `BATCH_SIZE` rows."""
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, BATCH_SIZE)):
+        yield batch
+
+
+def iter_file(file: IO[bytes]) -> Iterator[bytes]:
+    """Read file chunk by chunk from start and close it afterwards."""
+    with file:
+        file.seek(0)
+        yield from iter(lambda: file.read(CHUNK_SIZE), b"")
+
+
+class _Echo:
+    """Pseudo buffer returning written value, used to stream CSV rows."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def to_csv(rows: Iterable[Row]) -> Iterator[bytes]:
+    """Stream rows as CSV."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(COLUMNS).encode("utf-8")
+    for batch in iter_batches(rows):
+        yield "".join(writer.writerow(row) for row in batch).encode("utf-8")
+
+
+def to_xlsx(rows: Iterable[Row]) -> Iterator[bytes]:
+    """Stream rows as XLSX; workbook is written in write-only mode into temporary file, as XLSX is a zip container."""
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("export")
+    sheet.append(COLUMNS)
+    # Rows are appended to write-only worksheet (not to a list), which writes them into workbook one by one
+    for row in rows:
+        sheet.append(row)  # noqa: PERF402
+    file = tempfile.TemporaryFile()
+    workbook.save(file)
+    yield from iter_file(file)
+
+
+def to_parquet(rows: Iterable[Row]) -> Iterator[bytes]:
+    """Stream rows as Parquet; each batch is written as row group into temporary file, as footer is written last."""
+    schema = pa.schema(
+        [
+            ("indicator", pa.string()),
+            ("municipality_id", pa.int64()),
+            ("timestamp", pa.string()),
+            ("category", pa.string()),
+            ("value", pa.float64()),
+        ],
+    )
+    file = tempfile.TemporaryFile()
+    with parquet.ParquetWriter(file, schema) as writer:
+        for batch in iter_batches(rows):
+            columns = [pa.array(column, type=field.type) for column, field in zip(zip(*batch), schema)]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+    yield from iter_file(file)
+
+
+FORMATS = {
+    "csv": ("text/csv", to_csv),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", to_xlsx),
+    "parquet": ("application/vnd.apache.parquet", to_parquet),
+}
+
+
+def get_formats() -> list[str]:
+    """Return available export formats (Parquet requires optional dependency pyarrow)."""
+    return [export_format for export_format in FORMATS if export_format != "parquet" or pa is not None]
+
+
+def spool(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Write chunks into temporary file at once and stream them from there.
+
+    Under ASGI, Django iterates streaming content within event loop, where ORM access is not allowed.
+    Thus, export is spooled within executor thread beforehand.
+    """
+    file = tempfile.TemporaryFile()
+    for chunk in chunks:
+        file.write(chunk)
+    return iter_file(file)
@@ -0,0 +1,291 @@
+"""
+Module to declare indicators per municipality once and derive all their variants.
+
+An indicator is declared by its base function per municipality for status quo and - optionally - for 2045 scenario.
+Variants per km² and per capita as well as region totals are derived from the same base frame via vectorized
+operations. Base frames are cached per data version (status quo) or per simulation (2045), thus each base frame is
+calculated once, regardless of how many choropleths, popups and charts are derived from it.
+"""
+
+import dataclasses
+from collections.abc import Callable, Iterator
+from typing import Any, Optional, Union
+
+import pandas as pd
+from django.core.cache import cache
+
+from digiplan.utils import timing
+
+from . import caching, calculations, models
+
+Values = Union[pd.DataFrame, pd.Series]
+
+SCENARIOS = ("statusquo", "2045")
+# Variants are related to status quo population
+POPULATION_YEAR = 2022
+
+
+@dataclasses.dataclass(frozen=True)
+class Indicator:
+    """
+    Indicator per municipality.
+
+    Attributes
+    ----------
+    name: str
+        Name of indicator, used as prefix of lookups
+    statusquo: Callable[[], Values]
+        Returns status quo values per municipality (index) and technology/sector (columns, if frame)
+    future: Optional[Callable[[int], Values]]
+        Returns 2045 values for given simulation ID, same shape as status quo values
+    future_factor: float
+        Converts 2045 values into unit of status quo values
+    variants: dict[str, float]
+        Factor per variant ("absolute", "square" or "capita") to convert values into unit of variant
+    region: Optional[Callable[[], pd.Series]]
+        Returns status quo region values, if they cannot be summed up from municipality values (i.e. shares)
+    region_future: Optional[Callable[[int], pd.Series]]
+        Returns 2045 region values for given simulation ID, if they cannot be summed up
+    lookups: dict[str, str]
+        Lookup prefix per variant, if it differs from "<name>_<variant>"
+    """
+
+    name: str
+    statusquo: Callable[[], Values]
+    future: Optional[Callable[[int], Values]] = None
+    future_factor: float = 1.0
+    variants: dict[str, float] = dataclasses.field(default_factory=lambda: {"absolute": 1.0})
+    region: Optional[Callable[[], pd.Series]] = None
+    region_future: Optional[Callable[[int], pd.Series]] = None
+    lookups: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @property
+    def scenarios(self) -> tuple[str, ...]:
+        """Return scenarios indicator is available for."""
+        return SCENARIOS if self.future else SCENARIOS[:1]
+
+    def get_lookup(self, variant: str, scenario: str) -> str:
+        """Return lookup of given variant and scenario, i.e. "energy_capita_2045"."""
+        prefix = self.lookups.get(variant, self.name if variant == "absolute" else f"{self.name}_{variant}")
+        return f"{prefix}_{scenario}"
+
+
+INDICATORS = {
+    indicator.name: indicator
+    for indicator in (
+        Indicator(
+            "population",
+            statusquo=lambda: get_population(POPULATION_YEAR),
+            variants={"absolute": 1.0, "square": 1.0},
+            lookups={"square": "population_density"},
+        ),
+        Indicator("employees", statusquo=calculations.employment_per_municipality),
+        Indicator("companies", statusquo=calculations.companies_per_municipality),
+        Indicator(
+            "capacity",
+            statusquo=calculations.capacities_per_municipality,
+            future=calculations.capacities_per_municipality_2045,
+            variants={"absolute": 1.0, "square": 1.0},
+        ),
+        Indicator(
+            "energy",
+            statusquo=calculations.energies_per_municipality,
+            future=calculations.energies_per_municipality_2045,
+            # Energies are given in GWh (status quo) and MWh (2045), variants are given in MWh
+            future_factor=1e-3,
+            variants={"absolute": 1.0, "capita": 1e3, "square": 1e3},
+        ),
+        Indicator(
+            "energy_share",
+            statusquo=calculations.energy_shares_per_municipality,
+            future=calculations.energy_shares_2045_per_municipality,
+            region=calculations.energy_shares_region,
+            region_future=calculations.energy_shares_2045_region,
+        ),
+        Indicator(
+            "wind_turbines",
+            statusquo=models.WindTurbine.quantity_per_municipality,
+            future=calculations.wind_turbines_per_municipality_2045,
+            variants={"absolute": 1.0, "square": 1.0},
+        ),
+        Indicator(
+            "electricity_demand",
+            statusquo=calculations.electricity_demand_per_municipality,
+            future=calculations.electricity_demand_per_municipality_2045,
+            # Demands are given in GWh, demands per capita in kWh
+            variants={"absolute": 1.0, "capita": 1e6},
+        ),
+        Indicator(
+            "heat_demand",
+            statusquo=calculations.heat_demand_per_municipality,
+            future=calculations.heat_demand_per_municipality_2045,
+            variants={"absolute": 1.0, "capita": 1e6},
+        ),
+        Indicator("batteries", statusquo=calculations.batteries_per_municipality),
+        Indicator("batteries_capacity", statusquo=calculations.battery_capacities_per_municipality),
+    )
+}
+
+
+def iter_lookups() -> Iterator[tuple[str, Indicator, str, str]]:
+    """Yield lookup, indicator, variant and scenario of all declared indicator variants."""
+    for indicator in INDICATORS.values():
+        for variant in indicator.variants:
+            for scenario in indicator.scenarios:
+                yield indicator.get_lookup(variant, scenario), indicator, variant, scenario
+
+
+def get_cached(func: Callable, *parts: Any, simulation_id: Optional[int] = None) -> Any:  # noqa: ANN401
+    """Return result of function from cache; result is calculated and cached, if it is not cached yet."""
+    key = caching.get_key("indicator", *parts, simulation_id)
+    result = cache.get(key)
+    if result is None:
+        result = func(simulation_id) if simulation_id is not None else func()
+        cache.set(key, result, timeout=caching.get_timeout(simulation_based=simulation_id is not None))
+    return result
+
+
+def get_areas() -> pd.Series:
+    """Return area per municipality in km²."""
+    return get_cached(
+        lambda: pd.Series(dict(models.Municipality.objects.values_list("id", "area")), dtype=float),
+        "areas",
+    )
+
+
+def get_population_per_year() -> pd.DataFrame:
+    """Return population per municipality (index) and year (column)."""
+    return get_cached(models.Population.quantity_per_municipality_per_year, "population_per_year")
+
+
+def get_population(year: int = POPULATION_YEAR) -> pd.Series:
+    """Return population per municipality in given year (defaults to status quo year) without building full matrix."""
+    return get_cached(lambda: models.Population.quantity_per_municipality(year).astype(float), "population", year)
+
+
+@timing.timed("calc")
+def get_base(name: str, scenario: str = "statusquo", simulation_id: Optional[int] = None) -> Values:
+    """
+    Return base values of indicator per municipality in unit of status quo values.
+
+    Parameters
+    ----------
+    name: str
+        Name of indicator
+    scenario: str
+        "statusquo" or "2045"
+    simulation_id: Optional[int]
+        Simulation ID, needed for scenario "2045"
+
+    Returns
+    -------
+    Values
+        Values per municipality (index) and technology/sector (columns, if frame)
+    """
+    indicator = INDICATORS[name]
+    if scenario == "statusquo":
+        return get_cached(indicator.statusquo, name, scenario)
+    return get_cached(
+        lambda simulation: indicator.future(simulation).astype(float) * indicator.future_factor,
+        name,
+        scenario,
+        simulation_id=simulation_id,
+    )
+
+
+def get_divisor(variant: str) -> Optional[pd.Series]:
+    """Return values per municipality to relate indicator values to; None for absolute values."""
+    if variant == "square":
+        return get_areas()
+    if variant == "capita":
+        return get_population()
+    return None
+
+
+def get_values(
+    name: str,
+    variant: str = "absolute",
+    scenario: str = "statusquo",
+    simulation_id: Optional[int] = None,
+) -> Values:
+    """
+    Return variant of indicator per municipality.
+
+    Parameters
+    ----------
+    name: str
+        Name of indicator
+    variant: str
+        "absolute", "square" (per km²) or "capita" (per capita)
+    scenario: str
+        "statusquo" or "2045"
+    simulation_id: Optional[int]
+        Simulation ID, needed for scenario "2045"
+
+    Returns
+    -------
+    Values
+        Values per municipality (index) and technology/sector (columns, if frame)
+    """
+    values = get_base(name, scenario, simulation_id)
+    divisor = get_divisor(variant)
+    if divisor is not None:
+        values = values.div(divisor, axis=0)
+    return values * INDICATORS[name].variants[variant]
+
+
+def get_region_values(
+    name: str,
+    variant: str = "absolute",
+    scenario: str = "statusquo",
+    simulation_id: Optional[int] = None,
+) -> Union[pd.Series, float]:
+    """
+    Return variant of indicator for whole region.
+
+    Parameters
+    ----------
+    name: str
+        Name of indicator
+    variant: str
+        "absolute", "square" (per km²) or "capita" (per capita)
+    scenario: str
+        "statusquo" or "2045"
+    simulation_id: Optional[int]
+        Simulation ID, needed for scenario "2045"
+
+    Returns
+    -------
+    Union[pd.Series, float]
+        Values per technology/sector, if indicator holds multiple columns, otherwise single value
+    """
+    indicator = INDICATORS[name]
+    if scenario == "statusquo" and indicator.region:
+        return get_cached(indicator.region, name, "region")
+    if scenario != "statusquo" and indicator.region_future:
+        return get_cached(indicator.region_future, name, "region", simulation_id=simulation_id).astype(float)
+    values = get_base(name, scenario, simulation_id).sum()
+    divisor = get_divisor(variant)
+    if divisor is not None:
+        values = values / divisor.sum()
+    return values * indicator.variants[variant]
+
+
+def get_region_total(
+    name: str,
+    variant: str = "absolute",
+    scenario: str = "statusquo",
+    simulation_id: Optional[int] = None,
+) -> float:
+    """Return variant of indicator for whole region summed up over all technologies/sectors."""
+    values = get_region_values(name, variant, scenario, simulation_id)
+    return float(values.sum()) if isinstance(values, pd.Series) else float(values)
+
+
+def round_values(values: Union[Values, float], decimals: int) -> Union[Values, float, int]:
+    """Round values to given decimals; single values are returned as integer, if no decimals are requested."""
+    if isinstance(values, (pd.DataFrame, pd.Series)):
+        return values.round(decimals)
+    if decimals == 0:
+        return int(round(values))
+    return round(float(values), decimals)
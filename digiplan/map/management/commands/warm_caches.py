@@ -0,0 +1,143 @@
+"""Command to warm caches after deploy."""
+
+import functools
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from django import db
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import Client
+from django.urls import reverse
+from django.utils import translation
+
+from digiplan.map import charts, choropleths, models, popups, tiles
+
+
+def get_host() -> str:
+    """Return host accepted by `settings.ALLOWED_HOSTS` for in-process requests."""
+    return next((host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"), "localhost")
+
+
+def fetch(url: str, base_url: Optional[str] = None) -> int:
+    """
+    Request URL and return status code.
+
+    Parameters
+    ----------
+    url: str
+        URL to request
+    base_url: Optional[str]
+        Base URL of running server; if not given, URL is requested in-process via Django test client
+
+    Returns
+    -------
+    int
+        HTTP status code, 0 if server could not be reached
+    """
+    if base_url:
+        try:
+            with urllib.request.urlopen(f"{base_url.rstrip('/')}{url}", timeout=300) as response:  # noqa: S310
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+        except urllib.error.URLError:
+            return 0
+    try:
+        return Client(raise_request_exception=False, HTTP_HOST=get_host()).get(url).status_code
+    finally:
+        db.connection.close()
+
+
+def is_simulation_based(lookup_class: type) -> bool:
+    """Return True if choropleth, chart or popup needs simulation."""
+    return getattr(lookup_class, "simulation_based", False) or (
+        isinstance(lookup_class, type) and issubclass(lookup_class, charts.SimulationChart)
+    )
+
+
+def get_urls(simulation_id: Optional[int], *, cluster_popups: bool) -> dict[str, list[str]]:
+    """
+    Return URLs to warm per group.
+
+    Parameters
+    ----------
+    simulation_id: Optional[int]
+        If given, simulation based choropleths, charts and popups are warmed for this simulation, otherwise skipped
+    cluster_popups: bool
+        If set, popups of all cluster features are warmed
+
+    Returns
+    -------
+    dict[str, list[str]]
+        URLs per group
+    """
+    query = f"?simulation_id={simulation_id}" if simulation_id else ""
+    layers = {choropleth.name: choropleth.layers for choropleth in settings.MAP_ENGINE_CHOROPLETHS}
+    municipality_id = models.Municipality.objects.order_by("pk").values_list("pk", flat=True).first()
+
+    def lookups(registry: dict) -> Iterator[str]:
+        return (lookup for lookup, item in registry.items() if simulation_id or not is_simulation_based(item))
+
+    urls = {"pages": [], "choropleths": [], "charts": [], "popups": []}
+    for language, _ in settings.LANGUAGES:
+        with translation.override(language):
+            urls["pages"].append(reverse("map:map"))
+            urls["choropleths"] += [
+                reverse("map:choropleth", kwargs={"lookup": lookup, "layer_id": layer_id}) + query
+                for lookup in lookups(choropleths.CHOROPLETHS)
+                for layer_id in layers.get(lookup, ["municipality"])
+            ]
+            urls["charts"] += [
+                f"{reverse('map:charts')}?charts[]={lookup}{query.replace('?', '&')}"
+                for lookup in lookups(charts.CHARTS)
+            ]
+            for lookup in lookups(popups.POPUPS):
+                if not issubclass(popups.POPUPS[lookup], popups.ClusterPopup):
+                    region_ids = [municipality_id]
+                elif cluster_popups:
+                    region_ids = popups.CLUSTER_MODELS[lookup].objects.values_list("pk", flat=True)
+                else:
+                    continue
+                urls["popups"] += [
+                    reverse("map:popup", kwargs={"lookup": lookup, "region": region_id}) + query
+                    for region_id in region_ids
+                ]
+    return urls
+
+
+class Command(BaseCommand):
+    """Warm caches by requesting page shells, choropleths, charts and popups in parallel and pre-rendering tiles."""
+
+    help = __doc__  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add arguments to command."""
+        parser.add_argument("--base-url", help="Request running server at given URL instead of in-process")
+        parser.add_argument("--workers", type=int, default=8, help="Number of parallel requests")
+        parser.add_argument("--simulation-id", type=int, help="Warm simulation based endpoints for given simulation")
+        parser.add_argument("--cluster-popups", action="store_true", help="Warm popups of all cluster features")
+
+    def handle(self, *args, **options) -> None:  # noqa: ARG002, ANN002
+        """Request all URLs group by group, pre-render startup tiles and report duration per group."""
+        urls = get_urls(options["simulation_id"], cluster_popups=options["cluster_popups"])
+        request = functools.partial(fetch, base_url=options["base_url"])
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            for group, group_urls in urls.items():
+                start = time.perf_counter()
+                status_codes = list(pool.map(request, group_urls))
+                duration = time.perf_counter() - start
+                failed = [
+                    url for url, status in zip(group_urls, status_codes) if not 200 <= status < 400  # noqa: PLR2004
+                ]
+                self.stdout.write(f"{group}: {len(group_urls)} requests in {duration:.1f}s ({len(failed)} failed)")
+                for url in failed:
+                    self.stderr.write(f"  failed: {url}")
+        # Startup tiles are served from cache by middleware, thus they are pre-rendered instead of requested
+        start = time.perf_counter()
+        count = tiles.prerender_startup_tiles()
+        self.stdout.write(f"tiles: {count} pre-rendered in {time.perf_counter() - start:.1f}s")
@@ -35,12 +35,30 @@ class MVTManager(models.Manager):
         *args,  # noqa: ANN002
         geo_col: str = "geom",
         columns: Optional[list[str]] = None,
+        zoom_columns: Optional[dict[int, list[str]]] = None,
         **kwargs,
     ) -> None:
-        """Init."""
+        """
+        Init.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to Django manager
+        geo_col: str
+            Geometry column
+        columns: Optional[list[str]]
+            Columns used as feature attributes in MVT, defaults to all non-geometry columns
+        zoom_columns: Optional[dict[int, list[str]]]
+            Columns added to feature attributes from given zoom level on; attributes of columns not added at requested
+            zoom level are left empty and not encoded into tile. If not set, all columns are used at all zoom levels.
+        **kwargs
+            Keyword arguments passed to Django manager
+        """
         super().__init__(*args, **kwargs)
         self.geo_col = geo_col
         self.columns = columns
+        self.zoom_columns = zoom_columns
 
     def get_mvt_query(self, x: int, y: int, z: int, filters: Optional[dict] = None) -> tuple:
         """Build MVT query; might be overwritten in child class."""
@@ -51,6 +69,13 @@ class MVTManager(models.Manager):
         """Return columns to use as features in MVT."""
         return self.columns or self._get_non_geom_columns()
 
+    def get_tile_columns(self, z: int) -> list[str]:
+        """Return columns holding attributes at given zoom level."""
+        if self.zoom_columns is None:
+            return self.get_columns()
+        added = {column for min_zoom, columns in self.zoom_columns.items() if min_zoom <= z for column in columns}
+        return [column for column in self.get_columns() if column in added]
+
     # pylint: disable=W0613,R0913
     def _filter_query(  # noqa: PLR0913
         self,
@@ -106,13 +131,21 @@ class MVTManager(models.Manager):
         """
         query = self._get_mvt_geom_query(x, y, z)
         query = self._filter_query(query, x, y, z, filters)
+        tile_columns = self.get_tile_columns(z)
 
         try:
-            sql, params = query.query.sql_with_params()
+            sql, params = query.values(*tile_columns, "mvt_geom").query.sql_with_params()
         except FieldError as error:
             raise ValidationError(str(error)) from error
         with connection.cursor() as cursor:
-            return cursor.mogrify(sql, params).decode("utf-8")
+            sql = cursor.mogrify(sql, params).decode("utf-8")
+        # Columns selected by MVT view must exist, but are not encoded if empty
+        empty_columns = [column for column in self.get_columns() if column not in tile_columns]
+        if not empty_columns:
+            return sql
+        # Column names are declared in code (see `get_columns`), thus formatting them into query is safe
+        nulls = ", ".join(f"NULL AS {column}" for column in empty_columns)
+        return f"SELECT *, {nulls} FROM ({sql}) AS tile"  # noqa: S608
 
     def _get_non_geom_columns(self) -> list[str]:
         """
@@ -132,14 +165,6 @@ class MVTManager(models.Manager):
         return columns
 
 
-class RegionMVTManager(MVTManager):
-    """Manager which adds bbox to layer features to better show regions in frontend."""
-
-    def get_queryset(self) -> django.db.models.QuerySet:
-        """Annotate bbox to queryset."""
-        return super().get_queryset().annotate(bbox=models.functions.AsGeoJSON(models.functions.Envelope("geom")))
-
-
 class StaticMVTManager(MVTManager):
     """Manager which does nothing?."""
 
@@ -154,11 +179,3 @@ class StaticMVTManager(MVTManager):
     ) -> django.db.models.QuerySet:
         query = super()._filter_query(query, x, y, z, filters)
         return query
-
-
-class LabelMVTManager(MVTManager):
-    """Manager which adds centroid of geom to place label."""
-
-    def get_queryset(self) -> django.db.models.QuerySet:
-        """Return queryset with added centroid."""
-        return super().get_queryset().annotate(geom_label=models.functions.Centroid("geom"))
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-19 09:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_oemof', '0002_simulation'),
+        ('map', '0029_auto_20230829_0626'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimulationUsage',
+            fields=[
+                ('simulation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='usage', serialize=False, to='django_oemof.simulation')),
+                ('last_used', models.DateTimeField(default=django.utils.timezone.now)),
+                ('pinned', models.BooleanField(default=False)),
+                ('compacted', models.BooleanField(default=False)),
+            ],
+            options={
+                'verbose_name': 'Simulation usage',
+                'verbose_name_plural': 'Simulation usages',
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 3.2.25 on 2026-10-19 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+TECHNOLOGY_TABLES = {
+    "wind": "map_windturbine",
+    "pv_roof": "map_pvroof",
+    "pv_ground": "map_pvground",
+    "hydro": "map_hydro",
+    "biomass": "map_biomass",
+    "combustion": "map_combustion",
+    "gsgk": "map_gsgk",
+    "storage": "map_storage",
+}
+
+AGGREGATES = " UNION ALL ".join(
+    f"""
+    SELECT
+        '{technology}'::varchar(20) AS technology,
+        mun_id_id AS municipality_id,
+        COALESCE(status, '')::varchar(50) AS status,
+        COALESCE(SUM(unit_count), 0)::bigint AS unit_count,
+        COALESCE(SUM(capacity_net), 0)::double precision AS capacity_net,
+        COALESCE(SUM(capacity_gross), 0)::double precision AS capacity_gross
+    FROM {table}
+    GROUP BY mun_id_id, COALESCE(status, '')
+    """
+    for technology, table in TECHNOLOGY_TABLES.items()
+)
+
+CREATE_VIEW = f"""
+CREATE MATERIALIZED VIEW map_renewablestats AS
+SELECT row_number() OVER (ORDER BY technology, municipality_id, status) AS id, stats.*
+FROM ({AGGREGATES}) AS stats;
+CREATE UNIQUE INDEX map_renewablestats_unique ON map_renewablestats (technology, municipality_id, status);
+CREATE INDEX map_renewablestats_municipality ON map_renewablestats (municipality_id);
+"""
+
+DROP_VIEW = "DROP MATERIALIZED VIEW IF EXISTS map_renewablestats;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0031_dataversion'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+        migrations.CreateModel(
+            name='RenewableStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('technology', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=50)),
+                ('unit_count', models.BigIntegerField()),
+                ('capacity_net', models.FloatField()),
+                ('capacity_gross', models.FloatField()),
+                ('municipality', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='map.municipality')),
+            ],
+            options={
+                'verbose_name': 'Renewable statistics',
+                'verbose_name_plural': 'Renewable statistics',
+                'db_table': 'map_renewablestats',
+                'managed': False,
+            },
+        ),
+    ]
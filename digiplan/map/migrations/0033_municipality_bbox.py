@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:00
+
+from django.db import migrations, models
+
+
+def set_bboxes(apps, schema_editor):
+    Municipality = apps.get_model("map", "Municipality")
+    municipalities = list(Municipality.objects.all())
+    for municipality in municipalities:
+        municipality.bbox = list(municipality.geom.extent)
+    Municipality.objects.bulk_update(municipalities, ["bbox"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0032_renewablestats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='municipality',
+            name='bbox',
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(set_bboxes, migrations.RunPython.noop),
+    ]
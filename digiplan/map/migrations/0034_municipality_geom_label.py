@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-19 13:30
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+def set_label_points(apps, schema_editor):
+    Municipality = apps.get_model("map", "Municipality")
+    municipalities = list(Municipality.objects.all())
+    for municipality in municipalities:
+        municipality.geom_label = municipality.geom.point_on_surface
+    Municipality.objects.bulk_update(municipalities, ["geom_label"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0033_municipality_bbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='municipality',
+            name='geom_label',
+            field=django.contrib.gis.db.models.fields.PointField(null=True, srid=4326),
+        ),
+        migrations.RunPython(set_label_points, migrations.RunPython.noop),
+    ]
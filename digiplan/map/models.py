@@ -1,12 +1,16 @@
 """Digiplan models."""
 
+from typing import Optional, Union
 
 import pandas as pd
 from django.contrib.gis.db import models
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q, Sum
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from .managers import LabelMVTManager, RegionMVTManager, StaticMVTManager
+from .managers import MVTManager, StaticMVTManager
 
 # REGIONS
 
@@ -35,12 +39,16 @@ class Municipality(models.Model):
     geom = models.MultiPolygonField(srid=4326)
     name = models.CharField(max_length=50, unique=True)
     area = models.FloatField()
+    # Extent of geom as [xmin, ymin, xmax, ymax] and point within geom to place label, both set on save
+    bbox = models.JSONField(null=True)
+    geom_label = models.PointField(srid=4326, null=True)
 
     region = models.OneToOneField("Region", on_delete=models.DO_NOTHING, null=True)
 
     objects = models.Manager()
-    vector_tiles = RegionMVTManager(columns=["id", "name", "bbox"])
-    label_tiles = LabelMVTManager(geo_col="geom_label", columns=["id", "name"])
+    # Name is only needed when zoomed in (fill layer is styled via ID and feature state)
+    vector_tiles = MVTManager(columns=["id", "name"], zoom_columns={0: ["id"], 11: ["name"]})
+    label_tiles = MVTManager(geo_col="geom_label", columns=["id", "name"])
 
     data_file = "bkg_vg250_muns_region"
     layer = "vg250_gem"
@@ -54,6 +62,17 @@ class Municipality(models.Model):
         """Return string representation of model."""
         return self.name
 
+    def save(self, *args, **kwargs) -> None:  # noqa: ANN002
+        """Store extent and label point (guaranteed to lie within geometry, unlike centroid) along with municipality."""
+        self.bbox = list(self.geom.extent) if self.geom else None
+        self.geom_label = self.geom.point_on_surface if self.geom else None
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def bboxes(cls) -> dict[int, list[float]]:
+        """Return bounding box [xmin, ymin, xmax, ymax] per municipality."""
+        return dict(cls.objects.order_by("id").values_list("id", "bbox"))
+
     @classmethod
     def area_whole_region(cls) -> float:
         """
@@ -82,20 +101,44 @@ class Population(models.Model):
     @classmethod
     def quantity_per_municipality_per_year(cls) -> pd.DataFrame:
         """
-        Return population in 2022 per municipality and year.
+        Return population per municipality and year.
+
+        Matrix is pivoted in DB (one conditional sum per year), thus only one row per municipality is transferred.
 
         Returns
         -------
         pd.DataFrame
             Population per municipality (index) and year (column)
         """
-        population_per_year = (
-            pd.DataFrame.from_records(cls.objects.all().values("municipality__id", "year", "value"))  # noqa: PD010
-            .set_index("municipality__id")
-            .pivot(columns="year")
+        years = sorted(cls.objects.values_list("year", flat=True).distinct())
+        rows = (
+            cls.objects.values("municipality_id")
+            .annotate(**{f"year_{year}": Sum("value", filter=Q(year=year)) for year in years})
+            .order_by("municipality_id")
+            .values_list("municipality_id", *(f"year_{year}" for year in years))
         )
-        population_per_year.columns = population_per_year.columns.droplevel(0)
-        return population_per_year
+        population_per_year = pd.DataFrame.from_records(list(rows), columns=["municipality_id", *years])
+        return population_per_year.set_index("municipality_id").rename_axis(columns="year")
+
+    @classmethod
+    def quantity_per_municipality(cls, year: int) -> pd.Series:
+        """
+        Return population per municipality for given year only.
+
+        Parameters
+        ----------
+        year: int
+            Year to return population for
+
+        Returns
+        -------
+        pd.Series
+            Population per municipality
+        """
+        rows = cls.objects.filter(year=year).order_by("municipality_id").values_list("municipality_id", "value")
+        population = pd.Series(dict(rows), name=year)
+        population.index.name = "municipality_id"
+        return population
 
 
 class RenewableModel(models.Model):
@@ -120,6 +163,20 @@ class RenewableModel(models.Model):
 
     objects = models.Manager()
 
+    # Columns shown in cluster popup ("mun_name" is annotated from related municipality)
+    popup_columns = [
+        "name",
+        "mun_name",
+        "geometry_approximated",
+        "unit_count",
+        "capacity_net",
+        "status",
+        "city",
+        "commissioning_date",
+        "commissioning_date_planned",
+        "voltage_level",
+    ]
+
     class Meta:  # noqa: D106
         abstract = True
 
@@ -143,6 +200,22 @@ class WindTurbine(RenewableModel):
 
     data_file = "bnetza_mastr_wind_agg_region"
     layer = "bnetza_mastr_wind"
+
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "citizens_unit",
+        "hub_height",
+        "rotor_diameter",
+        "manufacturer_name",
+        "type_name",
+        "constraint_deactivation_sound_emission",
+        "constraint_deactivation_sound_emission_night",
+        "constraint_deactivation_sound_emission_day",
+        "constraint_deactivation_shadowing",
+        "constraint_deactivation_animals",
+        "constraint_deactivation_ice",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -189,12 +262,10 @@ class WindTurbine(RenewableModel):
 
         Returns
         -------
-        dpd.DataFrame
+        pd.Series
             wind turbines per municipality
         """
-        queryset = cls.objects.values("mun_id").annotate(units=Sum("unit_count")).values("mun_id", "units")
-        wind_turbines = pd.DataFrame.from_records(queryset).set_index("mun_id")
-        return wind_turbines["units"].reindex(Municipality.objects.all().values_list("id", flat=True), fill_value=0)
+        return RenewableStats.per_municipality("wind", "unit_count")
 
 
 class PVroof(RenewableModel):
@@ -215,6 +286,13 @@ class PVroof(RenewableModel):
     data_file = "bnetza_mastr_pv_roof_agg_region"
     layer = "bnetza_mastr_pv_roof"
 
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "citizens_unit",
+        "feedin_type",
+        "landlord_to_tenant_electricity",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -271,6 +349,13 @@ class PVground(RenewableModel):
     data_file = "bnetza_mastr_pv_ground_agg_region"
     layer = "bnetza_mastr_pv_ground"
 
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "citizens_unit",
+        "feedin_type",
+        "landlord_to_tenant_electricity",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -316,6 +401,13 @@ class Hydro(RenewableModel):
     data_file = "bnetza_mastr_hydro_agg_region"
     layer = "bnetza_mastr_hydro"
 
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "feedin_type",
+        "water_origin",
+        "plant_type",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -358,6 +450,15 @@ class Biomass(RenewableModel):
     data_file = "bnetza_mastr_biomass_agg_region"
     layer = "bnetza_mastr_biomass"
 
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "technology",
+        "feedin_type",
+        "th_capacity",
+        "fuel_type",
+        "fuel",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -405,6 +506,17 @@ class Combustion(RenewableModel):
     data_file = "bnetza_mastr_combustion_agg_region"
     layer = "bnetza_mastr_combustion"
 
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "technology",
+        "feedin_type",
+        "th_capacity",
+        "name_block",
+        "bnetza_id",
+        "fuels",
+        "fuel_other",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -449,6 +561,14 @@ class GSGK(RenewableModel):
     data_file = "bnetza_mastr_gsgk_agg_region"
     layer = "bnetza_mastr_gsgk"
 
+    popup_columns = [
+        *RenewableModel.popup_columns,
+        "technology",
+        "feedin_type",
+        "th_capacity",
+        "unit_type",
+    ]
+
     mapping = {
         "geom": "POINT",
         "name": "name",
@@ -505,6 +625,103 @@ class Storage(RenewableModel):
         verbose_name_plural = _("Battery storages")
 
 
+# RENEWABLE STATISTICS
+
+
+class RenewableStats(models.Model):
+    """
+    Unit count, net and gross capacity per technology, municipality and status.
+
+    Backed by materialized view aggregating all renewable cluster models (see migration 0032), which must be
+    refreshed via `RenewableStats.refresh()` after cluster data has been (re)loaded.
+    """
+
+    # Technology label per cluster model, as used in capacity columns of datapackage
+    TECHNOLOGIES = {
+        "wind": WindTurbine,
+        "pv_roof": PVroof,
+        "pv_ground": PVground,
+        "hydro": Hydro,
+        "biomass": Biomass,
+        "combustion": Combustion,
+        "gsgk": GSGK,
+        "storage": Storage,
+    }
+    # Status of units in operation, as counted in MaStR stats of datapackage
+    OPERATING = "In Betrieb"
+
+    technology = models.CharField(max_length=20)
+    municipality = models.ForeignKey(
+        Municipality,
+        on_delete=models.DO_NOTHING,
+        null=True,
+        db_constraint=False,
+        related_name="+",
+    )
+    status = models.CharField(max_length=50)
+    unit_count = models.BigIntegerField()
+    capacity_net = models.FloatField()
+    capacity_gross = models.FloatField()
+
+    objects = models.Manager()
+
+    class Meta:  # noqa: D106
+        managed = False
+        db_table = "map_renewablestats"
+        verbose_name = _("Renewable statistics")
+        verbose_name_plural = _("Renewable statistics")
+
+    def __str__(self) -> str:
+        """Return string representation of renewable statistics."""
+        return f"{self.technology} in {self.municipality_id} ({self.status})"
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Refresh materialized view; reads are not blocked during refresh."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}")
+
+    @classmethod
+    def per_municipality(
+        cls,
+        technologies: Union[str, list[str]],
+        value: str = "capacity_net",
+        status: Optional[str] = None,
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Return aggregated value per municipality.
+
+        Parameters
+        ----------
+        technologies: Union[str, list[str]]
+            Single technology (returns series) or list of technologies (returns frame with technology columns)
+        value: str
+            One of "unit_count", "capacity_net" or "capacity_gross"
+        status: Optional[str]
+            If given, only units of given status are counted, otherwise units of all status
+
+        Returns
+        -------
+        Union[pd.Series, pd.DataFrame]
+            Values per municipality, including municipalities without units
+        """
+        names = [technologies] if isinstance(technologies, str) else technologies
+        queryset = cls.objects.filter(technology__in=names, municipality__isnull=False)
+        if status is not None:
+            queryset = queryset.filter(status=status)
+        records = queryset.values("municipality_id", "technology").annotate(value=Sum(value))
+        values = (
+            pd.DataFrame.from_records(records, columns=["municipality_id", "technology", "value"])  # noqa: PD010
+            .set_index(["municipality_id", "technology"])["value"]
+            .unstack()
+            .reindex(index=Municipality.objects.values_list("id", flat=True), columns=names, fill_value=0)
+            .fillna(0)
+        )
+        values.index.name = "mun_id"
+        values.columns.name = None
+        return values[technologies] if isinstance(technologies, str) else values
+
+
 class StaticRegionModel(models.Model):
     """Base class for static region models."""
 
@@ -657,3 +874,63 @@ class PotentialareaWindSTP2027SearchAreaOpenArea(StaticRegionModel):  # noqa: D1
 class PotentialareaWindSTP2027VR(StaticRegionModel):  # noqa: D101
     data_file = "potentialarea_wind_stp_2027_vr"
     layer = "potentialarea_wind_stp_2027_vr"
+
+
+# DATA VERSION
+
+
+class DataVersion(models.Model):
+    """Holds fingerprint of loaded data, latest entry is current data version (see `digiplan.map.caching`)."""
+
+    fingerprint = models.CharField(max_length=40)
+    files = models.JSONField()
+    tables = models.JSONField()
+    created = models.DateTimeField(default=timezone.now)
+
+    class Meta:  # noqa: D106
+        verbose_name = _("Data version")
+        verbose_name_plural = _("Data versions")
+        get_latest_by = "created"
+
+    def __str__(self) -> str:
+        """Return string representation of data version."""
+        return f"{self.fingerprint} ({self.created:%Y-%m-%d %H:%M})"
+
+
+# SIMULATIONS
+
+
+class SimulationUsage(models.Model):
+    """Holds usage of a simulation, used by retention policy (see `digiplan.map.retention`)."""
+
+    # Last usage is written to DB at most once per interval (in seconds) per simulation
+    TOUCH_INTERVAL = 60 * 60
+
+    simulation = models.OneToOneField(
+        "django_oemof.Simulation",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="usage",
+    )
+    last_used = models.DateTimeField(default=timezone.now)
+    pinned = models.BooleanField(default=False)
+    compacted = models.BooleanField(default=False)
+
+    class Meta:  # noqa: D106
+        verbose_name = _("Simulation usage")
+        verbose_name_plural = _("Simulation usages")
+
+    def __str__(self) -> str:
+        """Return string representation of simulation usage."""
+        return f"Simulation {self.simulation_id} (last used {self.last_used:%Y-%m-%d})"
+
+    @classmethod
+    def touch(cls, simulation_id: int) -> None:
+        """Mark simulation as recently used."""
+        if cache.add(f"simulation_usage:{simulation_id}", value=True, timeout=cls.TOUCH_INTERVAL):
+            cls.objects.update_or_create(simulation_id=simulation_id, defaults={"last_used": timezone.now()})
+
+    @classmethod
+    def is_compacted(cls, simulation_id: int) -> bool:
+        """Return True if hourly sequences of simulation have been dropped by retention policy."""
+        return cls.objects.filter(simulation_id=simulation_id, compacted=True).exists()
@@ -3,17 +3,20 @@
 import abc
 from collections import namedtuple
 from collections.abc import Iterable
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
+from django.core.cache import cache
 from django.db.models import F
+from django.http import Http404, response
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from django_mapengine import popups
-from django_oemof import results
-from oemof.tabular.postprocessing import core
 
-from . import calculations, charts, models
+from digiplan.utils import timing
+
+from . import caching, charts, indicators, models
 
 Source = namedtuple("Source", ("name", "url"))
 
@@ -26,6 +29,7 @@ class RegionPopup(popups.ChartPopup):
     description: str = None
     unit: str = None
     sources: Optional[list[Source]] = None
+    simulation_based: bool = False
 
     def __init__(
         self,
@@ -34,11 +38,11 @@ class RegionPopup(popups.ChartPopup):
         map_state: Optional[dict] = None,
         template: Optional[str] = None,
     ) -> None:
-        """Initialize parent popup class and adds initialization of detailed data."""
+        """Initialize parent popup class and adds initialization of detailed data for selected municipality."""
         if self.lookup:
             lookup = self.lookup
         super().__init__(lookup, selected_id, map_state, template)
-        self.detailed_data = self.get_detailed_data()
+        self.region_value, self.detailed_data = self.get_index_entries()
 
     def get_context_data(self) -> dict:
         """
@@ -54,11 +58,14 @@ class RegionPopup(popups.ChartPopup):
             "title": self.title,
             "description": self.description,
             "unit": self.unit,
-            "region_value": self.get_region_value(),
+            "region_value": self.region_value,
             "municipality_value": self.get_municipality_value(),
             "municipality": models.Municipality.objects.get(pk=self.selected_id),
         }
 
+    def render(self) -> timing.JsonResponse:  # noqa: D102
+        return timing.JsonResponse(self.prepare_data())
+
     def get_chart_options(self) -> dict:
         """
         Return chart data to build chart from in JS.
@@ -80,8 +87,82 @@ class RegionPopup(popups.ChartPopup):
         Municipality IDs are stored in index, components/technologies/etc. are stored in columns
         """
 
+    def get_index_key(self, entry: Union[int, str]) -> str:
+        """
+        Return cache key for given entry of popup index.
+
+        Index is stored per popup class, data version and - if popup is simulation based - simulation ID.
+
+        Parameters
+        ----------
+        entry: Union[int, str]
+            Municipality ID or "region" for region entry
+
+        Returns
+        -------
+        str
+            cache key for index entry
+        """
+        simulation_id = self.map_state["simulation_id"] if self.simulation_based else None
+        return caching.get_key("popup", self.__class__.__name__, simulation_id, entry)
+
+    def build_index(self) -> dict[str, Any]:
+        """
+        Calculate detailed data for all municipalities once and store it as popup index in cache.
+
+        Index holds one entry per municipality containing related row of detailed data (or an empty frame for
+        municipalities without data) and one region entry holding region value (calculated from full detailed data),
+        an empty frame and IDs of all municipalities.
+
+        Returns
+        -------
+        dict[str, Any]
+            popup index entries by cache key
+        """
+        self.detailed_data = self.get_detailed_data()
+        empty_data = self.detailed_data.iloc[:0]
+        municipality_ids = frozenset(models.Municipality.objects.values_list("id", flat=True))
+        index = {self.get_index_key("region"): (self.get_region_value(), empty_data, municipality_ids)}
+        # Municipalities without data get an entry as well, thus a missing entry means that it has been evicted
+        for municipality_id in municipality_ids:
+            index[self.get_index_key(municipality_id)] = empty_data
+        for municipality_id in self.detailed_data.index:
+            index[self.get_index_key(municipality_id)] = self.detailed_data.loc[[municipality_id]]
+        cache.set_many(index, timeout=caching.get_timeout(simulation_based=self.simulation_based))
+        return index
+
+    def get_index_entries(self) -> tuple[float, pd.DataFrame]:
+        """
+        Return region value and detailed data of selected municipality from popup index.
+
+        Only the entries for selected municipality and region are read from cache. Index is (re)built if region entry
+        is not present (i.e. not built yet or evicted) or if entry of a known municipality has been evicted.
+
+        Returns
+        -------
+        tuple[float, pd.DataFrame]
+            region value and detailed data reduced to selected municipality
+
+        Raises
+        ------
+        Http404
+            if selected ID is no municipality ID
+        """
+        region_key = self.get_index_key("region")
+        municipality_key = self.get_index_key(self.selected_id)
+        entries = cache.get_many([region_key, municipality_key])
+        if region_key not in entries:
+            entries = self.build_index()
+        region_value, _, municipality_ids = entries[region_key]
+        if self.selected_id not in municipality_ids:
+            msg = f"Unknown municipality ID {self.selected_id}"
+            raise Http404(msg)
+        if municipality_key not in entries:
+            entries = self.build_index()
+        return region_value, entries[municipality_key]
+
     def get_region_value(self) -> float:
-        """Return aggregated data of all municipalities and technologies."""
+        """Return aggregated data of all municipalities and technologies (used when building index)."""
         return self.detailed_data.sum().sum()
 
     def get_municipality_value(self) -> Optional[float]:
@@ -98,35 +179,64 @@ class RegionPopup(popups.ChartPopup):
         return self.detailed_data.loc[self.selected_id]
 
 
-class SimulationPopup(RegionPopup, abc.ABC):
-    """Popup with simulation based context."""
-
-    calculation: Union[core.Calculation, core.ParametrizedCalculation] = None
-
-    def __init__(
-        self,
-        lookup: str,
-        selected_id: int,
-        map_state: Optional[dict] = None,
-        template: Optional[str] = None,
-    ) -> None:
-        """
-        Init simulation popup.
+CLUSTER_MODELS = {
+    "wind": models.WindTurbine,
+    "pvroof": models.PVroof,
+    "pvground": models.PVground,
+    "hydro": models.Hydro,
+    "biomass": models.Biomass,
+    "combustion": models.Combustion,
+    "gsgk": models.GSGK,
+    "storage": models.Storage,
+}
 
-        Parameters
-        ----------
-        lookup: str
-            Lookup name
-        selected_id: int
-            ID of selected feature
-        map_state: Optional[dict]
-            Current state of map. Includes current simulation ID
-        template: Optional[str]
-            Template to render popup. If not given template using lookup name is used
-        """
-        super().__init__(lookup, selected_id, map_state, template)
-        self.simulation_id = map_state["simulation_id"]
-        self.result = list(results.get_results(self.simulation_id, [self.calculation]).values())[0]
+# Some attributes have been removed, see
+# https://github.com/rl-institut/digiplan/issues/332
+# TODO(Hendrik Huyskens): Add mapping
+# https://github.com/rl-institut-private/digiplan/issues/153
+CLUSTER_ATTRIBUTES = {
+    "name": "Name",
+    "mun_name": "Gemeinde",
+    "geometry_approximated": "Standort geschätzt",
+    "unit_count": "Anlagenanzahl",
+    "capacity_net": "Nettonennleistung (kW)",
+    "status": "Betriebsstatus",
+    "city": "Ort",
+    "commissioning_date": "Inbetriebnahmedatum",
+    "commissioning_date_planned": "Geplantes Inbetriebnahmedatum",
+    "voltage_level": "Spannungsebene",
+    # multiple
+    "citizens_unit": "Bürgerenergieanlage",
+    "technology": "Technologie",
+    "feedin_type": "Einspeisungsart",
+    "th_capacity": "Thermische Nutzleistung",
+    # Wind Turbines
+    "hub_height": "Nabenhöhe",
+    "rotor_diameter": "Rotordurchmesser",
+    "manufacturer_name": "Hersteller",
+    "type_name": "Typenbezeichnung",
+    "constraint_deactivation_sound_emission": "Auflage Abschaltung Leistungsbegrenzung",
+    "constraint_deactivation_sound_emission_night": "Auflagen Abschaltung Schallimmissionsschutz Nachts",
+    "constraint_deactivation_sound_emission_day": "Auflagen Abschaltung Schallimmissionsschutz Tagsüber",
+    "constraint_deactivation_shadowing": "Auflagen Abschaltung Schattenwurf",
+    "constraint_deactivation_animals": "Auflagen Abschaltung Tierschutz",
+    "constraint_deactivation_ice": "Auflagen Abschaltung Eiswurf",
+    # PV Roof / Ground
+    "landlord_to_tenant_electricity": "Mieterstrom Zugeordnet",
+    # Hydro
+    "water_origin": "Art Des Zuflusses",
+    "plant_type": "Art Der Wasserkraftanlage",
+    # Biomass
+    "fuel_type": "Biomasseart",
+    "fuel": "Hauptbrennstoff",
+    # Combustion
+    "name_block": "Name Kraftwerksblock",
+    "bnetza_id": "Kraftwerksnummer",
+    "fuels": "Hauptbrennstoff",
+    "fuel_other": "Weitere Brennstoffe",
+    # GSGK
+    "unit_type": "Einheittyp",
+}
 
 
 class ClusterPopup(popups.Popup):
@@ -138,332 +248,190 @@ class ClusterPopup(popups.Popup):
         super().__init__(lookup="cluster", selected_id=selected_id)
 
     def get_context_data(self) -> dict:
-        """Return cluster data as context data."""
-        model = {
-            "wind": models.WindTurbine,
-            "pvroof": models.PVroof,
-            "pvground": models.PVground,
-            "hydro": models.Hydro,
-            "biomass": models.Biomass,
-            "combustion": models.Combustion,
-            "gsgk": models.GSGK,
-            "storage": models.Storage,
-        }[self.model_lookup]
-        # Some attributes have been removed, see
-        # https://github.com/rl-institut/digiplan/issues/332
-        # TODO(Hendrik Huyskens): Add mapping
-        # https://github.com/rl-institut-private/digiplan/issues/153
-        default_attributes = {
-            "name": "Name",
-            "mun_name": "Gemeinde",
-            "geometry_approximated": "Standort geschätzt",
-            "unit_count": "Anlagenanzahl",
-            "capacity_net": "Nettonennleistung (kW)",
-            "status": "Betriebsstatus",
-            "city": "Ort",
-            "commissioning_date": "Inbetriebnahmedatum",
-            "commissioning_date_planned": "Geplantes Inbetriebnahmedatum",
-            "voltage_level": "Spannungsebene",
-        }
-        specific_attributes = {
-            # multiple
-            "citizens_unit": "Bürgerenergieanlage",
-            "technology": "Technologie",
-            "feedin_type": "Einspeisungsart",
-            "th_capacity": "Thermische Nutzleistung",
-            # Wind Turbines
-            "hub_height": "Nabenhöhe",
-            "rotor_diameter": "Rotordurchmesser",
-            "manufacturer_name": "Hersteller",
-            "type_name": "Typenbezeichnung",
-            "constraint_deactivation_sound_emission": "Auflage Abschaltung Leistungsbegrenzung",
-            "constraint_deactivation_sound_emission_night": "Auflagen Abschaltung Schallimmissionsschutz Nachts",
-            "constraint_deactivation_sound_emission_day": "Auflagen Abschaltung Schallimmissionsschutz Tagsüber",
-            "constraint_deactivation_shadowing": "Auflagen Abschaltung Schattenwurf",
-            "constraint_deactivation_animals": "Auflagen Abschaltung Tierschutz",
-            "constraint_deactivation_ice": "Auflagen Abschaltung Eiswurf",
-            # PV Roof / Ground
-            "landlord_to_tenant_electricity": "Mieterstrom Zugeordnet",
-            # Hydro
-            "water_origin": "Art Des Zuflusses",
-            "plant_type": "Art Der Wasserkraftanlage",
-            # Biomass
-            "fuel_type": "Biomasseart",
-            "fuel": "Hauptbrennstoff",
-            # Combustion
-            "name_block": "Name Kraftwerksblock",
-            "bnetza_id": "Kraftwerksnummer",
-            "fuels": "Hauptbrennstoff",
-            "fuel_other": "Weitere Brennstoffe",
-            # GSGK
-            "unit_type": "Einheittyp",
-        }
-        instance = model.objects.annotate(mun_name=F("mun_id__name")).get(pk=self.selected_id)
-        data_dict = {
+        """Return cluster data as context data; only columns declared by cluster model are fetched."""
+        model = CLUSTER_MODELS[self.model_lookup]
+        instance = (
+            model.objects.annotate(mun_name=F("mun_id__name")).values(*model.popup_columns).get(pk=self.selected_id)
+        )
+        return {
             "title": model._meta.verbose_name,  # noqa: SLF001
-            "data": {name: getattr(instance, key) for key, name in default_attributes.items()},
+            "data": {name: instance[key] for key, name in CLUSTER_ATTRIBUTES.items() if key in instance},
         }
-        for key, name in specific_attributes.items():
-            if hasattr(instance, key):
-                value = getattr(instance, key)
-                data_dict["data"][name] = value
 
-        return data_dict
+    def render(self) -> response.HttpResponse:
+        """
+        Return rendered popup from cache or render and cache it.
 
+        Rendered popups are cached per cluster model, ID and language and invalidated when data is reloaded.
 
-class CapacityPopup(RegionPopup):
-    """Popup to show capacities."""
+        Returns
+        -------
+        HttpResponse
+            containing rendered popup as JSON
+        """
+        key = caching.get_key("cluster_popup", self.model_lookup, self.selected_id, translation.get_language())
+        content = cache.get(key)
+        if content is None:
+            content = super().render().content
+            cache.set(key, content, timeout=caching.get_timeout())
+        return response.HttpResponse(content, content_type="application/json")
 
-    lookup = "capacity"
-    title = "Installierte Leistung EE"
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.capacities_per_municipality().round(1)
+class IndicatorPopup(RegionPopup):
+    """
+    Popup showing variant of an indicator declared in `digiplan.map.indicators`.
 
+    Charts of simulation based popups compare status quo and simulation values.
+    """
 
-class Capacity2045Popup(RegionPopup):
-    """Popup to show capacities in 2045."""
+    indicator: str = None
+    variant: str = "absolute"
+    scenario: str = "statusquo"
+    decimals: int = 1
+    chart_title: Optional[str] = None
+    chart_unit: Optional[str] = None
+    chart_legend: bool = True
+    chart_scenarios: tuple[str, str] = ("2022", "Dein Szenario")
 
-    lookup = "capacity"
-    title = "Installierte Leistung EE"
+    def get_simulation_id(self) -> Optional[int]:
+        """Return simulation ID, if popup is simulation based."""
+        return self.map_state["simulation_id"] if self.simulation_based else None
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.capacities_per_municipality_2045(self.map_state["simulation_id"])
+    def get_detailed_data(self) -> Union[pd.DataFrame, pd.Series]:  # noqa: D102
+        return indicators.get_values(self.indicator, self.variant, self.scenario, self.get_simulation_id())
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+    def get_region_value(self) -> float:  # noqa: D102
+        return indicators.get_region_total(self.indicator, self.variant, self.scenario, self.get_simulation_id())
 
     def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = calculations.capacities_per_municipality().loc[self.selected_id].round(1)
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
-
-
-class CapacitySquarePopup(RegionPopup):
-    """Popup to show capacities per km²."""
-
-    lookup = "capacity"
-    title = "Installierte Leistung EE pro km²"
-
-    def get_detailed_data(self) -> pd.DataFrame:
-        """Return capacities per square kilometer."""
-        capacities = calculations.capacities_per_municipality()
-        return calculations.calculate_square_for_value(capacities).round(2)
+        """Return rounded data of municipality; simulation based popups add status quo data."""
+        data = indicators.round_values(super().get_chart_data(), self.decimals)
+        if not self.simulation_based:
+            return data if isinstance(data, pd.Series) else [data]
+        status_quo_data = indicators.round_values(
+            indicators.get_values(self.indicator, self.variant).loc[self.selected_id],
+            self.decimals,
+        )
+        if isinstance(data, pd.Series):
+            return list(zip(status_quo_data, data))
+        return [status_quo_data, data]
 
     def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
+        """Overwrite title, unit and scenario labels."""
         chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("installierte Leistung nach Typ")
-        chart_options["yAxis"]["name"] = _("MW/km²")
+        if self.chart_title is not None:
+            chart_options["title"]["text"] = self.chart_title
+        if self.chart_unit is not None:
+            chart_options["yAxis"]["name"] = self.chart_unit
+        if not self.chart_legend:
+            del chart_options["series"][0]["name"]
+        if self.simulation_based:
+            chart_options["xAxis"]["data"] = list(self.chart_scenarios)
         return chart_options
 
 
-class CapacitySquare2045Popup(RegionPopup):
-    """Popup to show capacities per km² in 2045."""
+class CapacityPopup(IndicatorPopup):
+    """Popup to show capacities."""
 
     lookup = "capacity"
-    title = "Installierte Leistung EE pro km²"
+    indicator = "capacity"
+    title = "Installierte Leistung EE"
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.calculate_square_for_value(
-            calculations.capacities_per_municipality_2045(self.map_state["simulation_id"]),
-        )
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("installierte Leistung nach Typ")
-        chart_options["yAxis"]["name"] = _("MW/km²")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+class Capacity2045Popup(CapacityPopup):
+    """Popup to show capacities in 2045."""
 
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = (
-            calculations.calculate_square_for_value(calculations.capacities_per_municipality())
-            .loc[self.selected_id]
-            .round(2)
-        )
-        future_data = super().get_chart_data().round(2)
-        return list(zip(status_quo_data, future_data))
+    simulation_based = True
+    scenario = "2045"
 
 
-class EnergyPopup(RegionPopup):
-    """Popup to show energies."""
+class CapacitySquarePopup(IndicatorPopup):
+    """Popup to show capacities per km²."""
 
     lookup = "capacity"
-    title = _("Gewonnene Energie aus EE")
+    indicator = "capacity"
+    variant = "square"
+    decimals = 2
+    title = "Installierte Leistung EE pro km²"
+    chart_title = _("installierte Leistung nach Typ")
+    chart_unit = _("MW/km²")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.energies_per_municipality().round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro Technologie")
-        chart_options["yAxis"]["name"] = _("GWh")
-        return chart_options
+class CapacitySquare2045Popup(CapacitySquarePopup):
+    """Popup to show capacities per km² in 2045."""
+
+    simulation_based = True
+    scenario = "2045"
 
 
-class Energy2045Popup(RegionPopup):
+class EnergyPopup(IndicatorPopup):
     """Popup to show energies."""
 
     lookup = "capacity"
+    indicator = "energy"
     title = _("Gewonnene Energie aus EE")
+    chart_title = _("Energieanteile pro Technologie")
+    chart_unit = _("GWh")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.energies_per_municipality_2045(self.map_state["simulation_id"])
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro Technologie")
-        chart_options["yAxis"]["name"] = _("GWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+class Energy2045Popup(EnergyPopup):
+    """Popup to show energies in 2045."""
 
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = calculations.energies_per_municipality().loc[self.selected_id].round(1)
-        future_data = (super().get_chart_data() * 1e-3).round(1)
-        return list(zip(status_quo_data, future_data))
+    simulation_based = True
+    scenario = "2045"
 
 
-class EnergySharePopup(RegionPopup):
+class EnergySharePopup(IndicatorPopup):
     """Popup to show energy shares."""
 
     lookup = "capacity"
+    indicator = "energy_share"
     title = _("Anteil Energie aus EE")
+    chart_title = _("Energieanteile pro Technologie")
+    chart_unit = _("%")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.energy_shares_per_municipality().round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro Technologie")
-        chart_options["yAxis"]["name"] = _("%")
-        return chart_options
-
-
-class EnergyShare2045Popup(RegionPopup):
-    """Popup to show energy shares."""
-
-    lookup = "capacity"
-    title = _("Anteil Energie aus EE")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.energy_shares_2045_per_municipality(self.map_state["simulation_id"])
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro Technologie")
-        chart_options["yAxis"]["name"] = _("%")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
-
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = calculations.energy_shares_per_municipality().loc[self.selected_id].round(1)
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
-
-
-class EnergyCapitaPopup(RegionPopup):
-    """Popup to show energy shares per population."""
-
-    lookup = "capacity"
-    title = _("Gewonnene Energie pro EW")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return (calculations.calculate_capita_for_value(calculations.energies_per_municipality()) * 1e3).round(1)
+class EnergyShare2045Popup(EnergySharePopup):
+    """Popup to show energy shares in 2045."""
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro Technologie")
-        chart_options["yAxis"]["name"] = _("MWh")
-        return chart_options
+    simulation_based = True
+    scenario = "2045"
 
 
-class EnergyCapita2045Popup(RegionPopup):
-    """Popup to show energies."""
+class EnergyCapitaPopup(IndicatorPopup):
+    """Popup to show energies per population."""
 
     lookup = "capacity"
+    indicator = "energy"
+    variant = "capita"
     title = _("Gewonnene Energie pro EW")
+    chart_title = _("Energieanteile pro Technologie")
+    chart_unit = _("MWh")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.calculate_capita_for_value(
-            calculations.energies_per_municipality_2045(self.map_state["simulation_id"]),
-        )
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro Technologie")
-        chart_options["yAxis"]["name"] = _("MWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+class EnergyCapita2045Popup(EnergyCapitaPopup):
+    """Popup to show energies per population in 2045."""
 
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = (
-            calculations.calculate_capita_for_value(calculations.energies_per_municipality()).loc[self.selected_id]
-            * 1e3
-        ).round(1)
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
+    simulation_based = True
+    scenario = "2045"
 
 
-class EnergySquarePopup(RegionPopup):
-    """Popup to show energy shares per km²."""
+class EnergySquarePopup(IndicatorPopup):
+    """Popup to show energies per km²."""
 
     lookup = "capacity"
+    indicator = "energy"
+    variant = "square"
     title = _("Gewonnene Energie pro km²")
+    chart_title = _("Energieanteile pro km²")
+    chart_unit = _("MWh")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return (calculations.calculate_square_for_value(calculations.energies_per_municipality()) * 1e3).round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro km²")
-        chart_options["yAxis"]["name"] = _("MWh")
-        return chart_options
-
-
-class EnergySquare2045Popup(RegionPopup):
-    """Popup to show energies."""
+class EnergySquare2045Popup(EnergySquarePopup):
+    """Popup to show energies per km² in 2045."""
 
-    lookup = "capacity"
-    title = _("Gewonnene Energie pro km²")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.calculate_square_for_value(
-            calculations.energies_per_municipality_2045(self.map_state["simulation_id"]),
-        )
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Energieanteile pro km²")
-        chart_options["yAxis"]["name"] = _("MWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
-
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = (
-            calculations.calculate_square_for_value(calculations.energies_per_municipality()).loc[self.selected_id]
-            * 1e3
-        ).round(1)
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
+    simulation_based = True
+    scenario = "2045"
 
 
 class PopulationPopup(RegionPopup):
@@ -474,7 +442,7 @@ class PopulationPopup(RegionPopup):
 
     def get_detailed_data(self) -> pd.DataFrame:
         """Return population data."""
-        return models.Population.quantity_per_municipality_per_year()
+        return indicators.get_population_per_year()
 
     def get_municipality_value(self) -> Optional[float]:
         """Return municipality value for status quo year."""
@@ -482,7 +450,7 @@ class PopulationPopup(RegionPopup):
 
     def get_region_value(self) -> float:
         """Return region value for status quo year."""
-        return self.detailed_data.sum()[2022]
+        return indicators.get_population().sum()
 
 
 class PopulationDensityPopup(RegionPopup):
@@ -493,8 +461,8 @@ class PopulationDensityPopup(RegionPopup):
 
     def get_detailed_data(self) -> pd.DataFrame:
         """Return population data squared."""
-        population = models.Population.quantity_per_municipality_per_year()
-        return calculations.calculate_square_for_value(population).round(1)
+        population = indicators.get_population_per_year()
+        return population.div(indicators.get_areas(), axis=0).round(1)
 
     def get_municipality_value(self) -> Optional[float]:
         """Return municipality value for status quo year."""
@@ -502,9 +470,7 @@ class PopulationDensityPopup(RegionPopup):
 
     def get_region_value(self) -> float:
         """Return region value for status quo year."""
-        return calculations.calculate_square_for_value(
-            pd.DataFrame(models.Population.quantity_per_municipality_per_year().sum()).transpose(),
-        ).sum()[2022]
+        return indicators.get_population().sum() / indicators.get_areas().sum()
 
     def get_chart_options(self) -> dict:
         """Overwrite title and unit."""
@@ -514,401 +480,158 @@ class PopulationDensityPopup(RegionPopup):
         return chart_options
 
 
-class EmployeesPopup(RegionPopup):
+class EmployeesPopup(IndicatorPopup):
     """Popup to show employees."""
 
     lookup = "wind_turbines"
+    indicator = "employees"
+    decimals = 0
     title = _("Beschäftigte")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.employment_per_municipality()
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for employeess in current municipality."""
-        return [int(self.detailed_data.loc[self.selected_id])]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Beschäftigte")
-        chart_options["yAxis"]["name"] = ""
-        del chart_options["series"][0]["name"]
-        return chart_options
+    chart_title = _("Beschäftigte")
+    chart_unit = ""
+    chart_legend = False
 
 
-class CompaniesPopup(RegionPopup):
+class CompaniesPopup(IndicatorPopup):
     """Popup to show companies."""
 
     lookup = "wind_turbines"
+    indicator = "companies"
+    decimals = 0
     title = _("Betriebe")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.companies_per_municipality()
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for companies in current municipality."""
-        return [int(self.detailed_data.loc[self.selected_id])]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Betriebe")
-        chart_options["yAxis"]["name"] = ""
-        del chart_options["series"][0]["name"]
-        return chart_options
+    chart_title = _("Betriebe")
+    chart_unit = ""
+    chart_legend = False
 
 
-class NumberWindturbinesPopup(RegionPopup):
+class NumberWindturbinesPopup(IndicatorPopup):
     """Popup to show the number of wind turbines."""
 
     lookup = "wind_turbines"
+    indicator = "wind_turbines"
+    decimals = 0
     title = _("Number of wind turbines")
     description = _("Description for number of wind turbines")
     unit = ""
 
-    def get_detailed_data(self) -> pd.DataFrame:
-        """Return quantity of wind turbines per municipality (index)."""
-        return models.WindTurbine.quantity_per_municipality()
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for wind turbines in current municipality."""
-        return [int(self.detailed_data.loc[self.selected_id])]
-
 
-class NumberWindturbines2045Popup(RegionPopup):
+class NumberWindturbines2045Popup(NumberWindturbinesPopup):
     """Popup to show the number of wind turbines in 2045."""
 
-    lookup = "wind_turbines"
-    title = _("Number of wind turbines")
-    description = _("Description for number of wind turbines")
-    unit = ""
-
-    def get_detailed_data(self) -> pd.DataFrame:
-        """Return quantity of wind turbines per municipality (index)."""
-        return calculations.wind_turbines_per_municipality_2045(self.map_state["simulation_id"])
-
-    def get_region_value(self) -> float:
-        """Return aggregated data of all municipalities and technologies."""
-        return self.detailed_data.sum()
+    simulation_based = True
+    scenario = "2045"
 
-    def get_municipality_value(self) -> Optional[float]:
-        """Return aggregated data for all technologies for given municipality ID."""
-        if self.selected_id not in self.detailed_data.index:
-            return 0
-        return self.detailed_data.loc[self.selected_id]
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
-
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = models.WindTurbine.quantity_per_municipality().loc[self.selected_id]
-        future_data = super().get_chart_data()
-        return [int(status_quo_data), int(future_data)]
-
-
-class NumberWindturbinesSquarePopup(RegionPopup):
+class NumberWindturbinesSquarePopup(IndicatorPopup):
     """Popup to show the number of wind turbines per km²."""
 
     lookup = "wind_turbines"
+    indicator = "wind_turbines"
+    variant = "square"
+    decimals = 2
     title = "Windenergieanlagen pro km²"
-
-    def get_detailed_data(self) -> pd.DataFrame:
-        """Return quantity of wind turbines per municipality (index)."""
-        wind_turbines = models.WindTurbine.quantity_per_municipality()
-        return calculations.calculate_square_for_value(wind_turbines)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit in chart options."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Windturbinen pro km²")
-        chart_options["yAxis"]["name"] = _("WT/km²")
-        return chart_options
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for wind turbines in current municipality."""
-        return [float(self.detailed_data.loc[self.selected_id])]
+    chart_title = _("Windturbinen pro km²")
+    chart_unit = _("WT/km²")
 
 
-class NumberWindturbinesSquare2045Popup(RegionPopup):
+class NumberWindturbinesSquare2045Popup(NumberWindturbinesSquarePopup):
     """Popup to show the number of wind turbines per km² in 2045."""
 
-    lookup = "wind_turbines"
-    title = "Windenergieanlagen pro km²"
-
-    def get_detailed_data(self) -> pd.DataFrame:
-        """Return quantity of wind turbines per municipality (index)."""
-        wind_turbines = calculations.wind_turbines_per_municipality_2045(self.map_state["simulation_id"])
-        return calculations.calculate_square_for_value(wind_turbines)
-
-    def get_region_value(self) -> float:
-        """Return aggregated data of all municipalities and technologies."""
-        return self.detailed_data.sum()
+    simulation_based = True
+    scenario = "2045"
 
-    def get_municipality_value(self) -> Optional[float]:
-        """Return aggregated data for all technologies for given municipality ID."""
-        if self.selected_id not in self.detailed_data.index:
-            return 0
-        return self.detailed_data.loc[self.selected_id]
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit in chart options."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Windturbinen pro km²")
-        chart_options["yAxis"]["name"] = _("WT/km²")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for wind turbines in current municipality."""
-        status_quo_data = (
-            calculations.calculate_square_for_value(models.WindTurbine.quantity_per_municipality())
-            .loc[self.selected_id]
-            .round(1)
-        )
-        future_data = super().get_chart_data().round(1)
-        return [float(status_quo_data), float(future_data)]
-
-
-class ElectricityDemandPopup(RegionPopup):
+class ElectricityDemandPopup(IndicatorPopup):
     """Popup to show electricity demand."""
 
     lookup = "electricity_demand"
+    indicator = "electricity_demand"
     title = _("Strombedarf")
+    chart_title = _("Strombedarf")
+    chart_unit = _("GWh")
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.electricity_demand_per_municipality().round(1)
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Strombedarf")
-        chart_options["yAxis"]["name"] = _("GWh")
-        return chart_options
-
-
-class ElectricityDemand2045Popup(RegionPopup):
+class ElectricityDemand2045Popup(ElectricityDemandPopup):
     """Popup to show electricity demand in 2045."""
 
-    lookup = "electricity_demand"
-    title = _("Strombedarf")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.electricity_demand_per_municipality_2045(self.map_state["simulation_id"])
-
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = calculations.electricity_demand_per_municipality().loc[self.selected_id].round(1)
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Strombedarf")
-        chart_options["yAxis"]["name"] = _("GWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+    simulation_based = True
+    scenario = "2045"
 
 
-class ElectricityDemandCapitaPopup(RegionPopup):
+class ElectricityDemandCapitaPopup(IndicatorPopup):
     """Popup to show electricity demand capita."""
 
     lookup = "electricity_demand"
+    indicator = "electricity_demand"
+    variant = "capita"
     title = _("Strombedarf je EinwohnerIn")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return (
-            calculations.calculate_capita_for_value(calculations.electricity_demand_per_municipality()) * 1e6
-        ).round(1)
-
-    def get_region_value(self) -> float:  # noqa: D102
-        return self.detailed_data.sum(axis=1).mean()
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Strombedarf je EinwohnerIn")
-        chart_options["yAxis"]["name"] = _("kWh")
-        return chart_options
+    chart_title = _("Strombedarf je EinwohnerIn")
+    chart_unit = _("kWh")
 
 
-class ElectricityDemandCapita2045Popup(RegionPopup):
+class ElectricityDemandCapita2045Popup(ElectricityDemandCapitaPopup):
     """Popup to show electricity demand capita in 2045."""
 
-    lookup = "electricity_demand"
-    title = _("Strombedarf je EinwohnerIn")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.calculate_capita_for_value(
-            calculations.electricity_demand_per_municipality_2045(self.map_state["simulation_id"]),
-        )
-
-    def get_region_value(self) -> float:  # noqa: D102
-        return self.detailed_data.sum(axis=1).mean()
+    simulation_based = True
+    scenario = "2045"
 
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = (
-            calculations.calculate_capita_for_value(
-                calculations.electricity_demand_per_municipality(),
-            ).loc[self.selected_id]
-            * 1e6
-        ).round(1)
-        future_data = (super().get_chart_data() * 1e6).round(1)
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Strombedarf je EinwohnerIn")
-        chart_options["yAxis"]["name"] = _("kWh")
-        chart_options["xAxis"]["data"] = ["Status Quo", "Mein Szenario"]
-        return chart_options
-
-
-class HeatDemandPopup(RegionPopup):
+class HeatDemandPopup(IndicatorPopup):
     """Popup to show heat demand."""
 
     lookup = "heat_demand"
+    indicator = "heat_demand"
     title = _("Wärmebedarf")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.heat_demand_per_municipality().round(1)
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Wärmebedarf")
-        chart_options["yAxis"]["name"] = _("GWh")
-        return chart_options
+    chart_title = _("Wärmebedarf")
+    chart_unit = _("GWh")
 
 
-class HeatDemand2045Popup(RegionPopup):
+class HeatDemand2045Popup(HeatDemandPopup):
     """Popup to show heat demand in 2045."""
 
-    lookup = "heat_demand"
-    title = _("Wärmebedarf")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.heat_demand_per_municipality_2045(self.map_state["simulation_id"])
-
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = calculations.heat_demand_per_municipality().loc[self.selected_id].round(1)
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Wärmebedarf")
-        chart_options["yAxis"]["name"] = _("GWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
+    simulation_based = True
+    scenario = "2045"
 
 
-class HeatDemandCapitaPopup(RegionPopup):
+class HeatDemandCapitaPopup(IndicatorPopup):
     """Popup to show heat demand capita."""
 
     lookup = "heat_demand"
+    indicator = "heat_demand"
+    variant = "capita"
     title = _("Wärmebedarf je EinwohnerIn")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return (calculations.calculate_capita_for_value(calculations.heat_demand_per_municipality()) * 1e6).round(1)
-
-    def get_region_value(self) -> float:  # noqa: D102
-        return self.detailed_data.sum(axis=1).mean()
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Wärmebedarf je EinwohnerIn")
-        chart_options["yAxis"]["name"] = _("kWh")
-        return chart_options
+    chart_title = _("Wärmebedarf je EinwohnerIn")
+    chart_unit = _("kWh")
 
 
-class HeatDemandCapita2045Popup(RegionPopup):
+class HeatDemandCapita2045Popup(HeatDemandCapitaPopup):
     """Popup to show heat demand capita in 2045."""
 
-    lookup = "heat_demand"
-    title = _("Wärmebedarf je EinwohnerIn")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.calculate_capita_for_value(
-            calculations.heat_demand_per_municipality_2045(self.map_state["simulation_id"]),
-        ).mul(1e6)
+    simulation_based = True
+    scenario = "2045"
 
-    def get_region_value(self) -> float:  # noqa: D102
-        return self.detailed_data.sum(axis=1).mean()
-
-    def get_chart_data(self) -> Iterable:
-        """Create capacity chart data for SQ and future scenario."""
-        status_quo_data = (
-            calculations.calculate_capita_for_value(
-                calculations.heat_demand_per_municipality(),
-            )
-            .loc[self.selected_id]
-            .mul(1e6)
-            .round(1)
-        )
-        future_data = super().get_chart_data().round(1)
-        return list(zip(status_quo_data, future_data))
 
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Wärmebedarf je EinwohnerIn")
-        chart_options["yAxis"]["name"] = _("kWh")
-        chart_options["xAxis"]["data"] = ["2022", "Dein Szenario"]
-        return chart_options
-
-
-class BatteriesPopup(RegionPopup):
+class BatteriesPopup(IndicatorPopup):
     """Popup to show battery count."""
 
     lookup = "wind_turbines"
+    indicator = "batteries"
+    decimals = 0
     title = _("Anzahl Batteriespeicher")
+    chart_title = _("Anzahl Batteriespeicher")
+    chart_unit = ""
+    chart_legend = False
 
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.batteries_per_municipality()
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for employeess in current municipality."""
-        return [int(self.detailed_data.loc[self.selected_id])]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Anzahl Batteriespeicher")
-        chart_options["yAxis"]["name"] = ""
-        del chart_options["series"][0]["name"]
-        return chart_options
 
-
-class BatteriesCapacityPopup(RegionPopup):
-    """Popup to show battery count."""
+class BatteriesCapacityPopup(IndicatorPopup):
+    """Popup to show battery capacity."""
 
     lookup = "wind_turbines"
+    indicator = "batteries_capacity"
     title = _("Kapazität Batteriespeicher")
-
-    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
-        return calculations.battery_capacities_per_municipality()
-
-    def get_chart_data(self) -> Iterable:
-        """Return single value for employeess in current municipality."""
-        return [self.detailed_data.loc[self.selected_id].round(1)]
-
-    def get_chart_options(self) -> dict:
-        """Overwrite title and unit."""
-        chart_options = super().get_chart_options()
-        chart_options["title"]["text"] = _("Kapazität Batteriespeicher")
-        chart_options["yAxis"]["name"] = _("MWh")
-        del chart_options["series"][0]["name"]
-        return chart_options
+    chart_title = _("Kapazität Batteriespeicher")
+    chart_unit = _("MWh")
+    chart_legend = False
 
 
 POPUPS: dict[str, type(popups.Popup)] = {
@@ -0,0 +1,95 @@
+"""
+Module to calculate potential areas per municipality in PostGIS.
+
+Each potential area layer is intersected with municipality geometries in its own DB connection, thus layers are
+calculated in parallel; intersections are pre-filtered via spatial index of both layers. Results are cached per data
+version and replace `potentialarea_*_area_stats_muns.csv` files of digipipe, if `settings.POTENTIAL_AREA_SOURCE` is
+set to "postgis". This way, changed exclusion criteria can be tested by loading new potential areas only.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from django import db
+from django.db.models import Model
+
+from digiplan.map import caching, models
+from digiplan.utils import timing
+
+# Potential area layers per technology; keys equal columns of digipipe stats files
+POTENTIAL_AREAS = {
+    "wind": {
+        "stp_2018_vreg": models.PotentialareaWindSTP2018Vreg,
+        "stp_2027_vr": models.PotentialareaWindSTP2027VR,
+        "stp_2027_repowering": models.PotentialareaWindSTP2027Repowering,
+        "stp_2027_search_area_open_area": models.PotentialareaWindSTP2027SearchAreaOpenArea,
+        "stp_2027_search_area_forest_area": models.PotentialareaWindSTP2027SearchAreaForestArea,
+    },
+    "pv_ground": {
+        "road_railway_region": models.PotentialareaPVRoadRailway,
+        "agriculture_lfa-off_region": models.PotentialareaPVAgricultureLFAOff,
+    },
+}
+
+# Overlapping potential areas are merged before measuring; area is measured on spheroid in km²
+AREA_SQL = """
+SELECT m.id, COALESCE(ST_Area(ST_Union(ST_Intersection(m.geom, p.geom))::geography) / 1e6, 0)
+FROM {municipality} AS m
+LEFT JOIN {potential} AS p ON ST_Intersects(m.geom, p.geom)
+GROUP BY m.id
+ORDER BY m.id
+"""
+
+
+def calculate_area_per_municipality(model: type[Model]) -> pd.Series:
+    """
+    Return area of potential area layer per municipality.
+
+    Parameters
+    ----------
+    model: type[Model]
+        Potential area model
+
+    Returns
+    -------
+    pd.Series
+        Area in km² per municipality
+    """
+    sql = AREA_SQL.format(
+        municipality=models.Municipality._meta.db_table,  # noqa: SLF001
+        potential=model._meta.db_table,  # noqa: SLF001
+    )
+    with db.connection.cursor() as cursor:
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+    return pd.Series(dict(rows), dtype=float).rename_axis("municipality_id")
+
+
+def _calculate_in_thread(model: type[Model]) -> pd.Series:
+    """Calculate area in executor thread and close connection of thread afterwards."""
+    try:
+        return calculate_area_per_municipality(model)
+    finally:
+        db.connection.close()
+
+
+@caching.cached
+@timing.timed("db")
+def get_areas(technology: str) -> pd.DataFrame:
+    """
+    Return potential areas of technology per municipality (cached per data version).
+
+    Parameters
+    ----------
+    technology: str
+        "wind" or "pv_ground"
+
+    Returns
+    -------
+    pd.DataFrame
+        Area in km² per municipality (index) and potential area layer (column)
+    """
+    layers = POTENTIAL_AREAS[technology]
+    with ThreadPoolExecutor(max_workers=len(layers), thread_name_prefix="potentials") as pool:
+        areas = pool.map(_calculate_in_thread, layers.values())
+    return pd.concat(dict(zip(layers, areas)), axis=1)
@@ -0,0 +1,287 @@
+"""
+Columnar store for oemof results per simulation.
+
+django-oemof stores each calculation result as JSON in database, which has to be parsed completely on each access.
+This is expensive for sequences (8760 rows per flow), especially if only sums are needed.
+Therefore, results are additionally stored in a folder per simulation holding a compressed zip file per calculation
+(named by its URL-quoted dependency name) with one numpy array per index level and column. Additionally, column sums
+and hourly sums (summed over all columns) are precomputed for frames. Readers only decompress the members they need,
+i.e. only requested flows or only precomputed sums. As each calculation is written into its own file, concurrent
+writers of different calculations (e.g. processes of comparison pool) do not interfere and adding a calculation does
+not rewrite stored ones.
+
+Layout of members for each calculation file:
+
+- `meta.json`: type of result (series/frame), index names and time zones and column labels
+- `index/<level>.npy`: index values per level
+- `values.npy`: values of series
+- `columns/<position>.npy`: values per column of frame
+- `sums.npy`, `row_sums.npy`: column sums and hourly sums of frame
+
+Stores of old simulations are compacted by retention policy (see `digiplan.map.retention`), which drops columns of
+frames and keeps precomputed sums only.
+"""
+
+import contextlib
+import json
+import os
+import pathlib
+import shutil
+import threading
+import zipfile
+from collections.abc import Iterator
+from typing import Optional, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django_oemof import results as oemof_results
+from django_oemof.models import Simulation
+from oemof.tabular.postprocessing import core
+
+from digiplan.map import models
+from digiplan.utils import timing
+
+Calculation = Union[str, type[core.Calculation], core.ParametrizedCalculation]
+Result = Union[pd.Series, pd.DataFrame]
+
+
+def get_name(calculation: Calculation) -> str:
+    """Return name of calculation as used by django-oemof."""
+    return calculation if isinstance(calculation, str) else core.get_dependency_name(calculation)
+
+
+class ResultStore:
+    """Columnar result files of a simulation."""
+
+    def __init__(self, simulation_id: int) -> None:
+        """Init store for given simulation."""
+        self.simulation_id = simulation_id
+        self.path = pathlib.Path(settings.RESULT_STORE_DIR) / f"simulation_{simulation_id}"
+
+    def names(self) -> set[str]:
+        """Return names of stored calculations."""
+        return {unquote(path.stem) for path in self.path.glob("*.zip")}
+
+    def write(self, results: dict[str, Result]) -> None:
+        """
+        Add results to store; already stored results are kept.
+
+        Each result is written into a temporary file which replaces the file of its calculation afterwards,
+        thus readers are never affected by unfinished writes.
+
+        Parameters
+        ----------
+        results: dict[str, Result]
+            Results by calculation name
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        for name, result in results.items():
+            path = self._get_path(name)
+            if path.exists():
+                continue
+            with _replace(path) as archive:
+                self._write_result(archive, result)
+
+    def read(self, calculation: Calculation, columns: Optional[list] = None) -> Result:
+        """
+        Read result from store.
+
+        Parameters
+        ----------
+        calculation: Calculation
+            Calculation (or its name) to read
+        columns: Optional[list]
+            Only read given columns (i.e. flows) of frame; all columns are read if not set
+
+        Returns
+        -------
+        Result
+            Series or frame as returned by calculation
+        """
+        name = get_name(calculation)
+        with zipfile.ZipFile(self._get_path(name)) as archive:
+            meta = json.loads(archive.read("meta.json"))
+            index = self._read_index(archive, meta)
+            if meta["type"] == "series":
+                return pd.Series(_read_array(archive, "values.npy"), index=index, name=meta["name"])
+            if meta.get("compacted"):
+                msg = f"Flows of '{name}' are not available, as store of simulation {self.simulation_id} is compacted."
+                raise ValueError(msg)
+            labels = _get_labels(meta["columns"])
+            positions = range(len(labels)) if columns is None else [labels.index(column) for column in columns]
+            return pd.DataFrame(
+                {labels[position]: _read_array(archive, f"columns/{position}.npy") for position in positions},
+                index=index,
+            )
+
+    def columns(self, calculation: Calculation) -> list:
+        """Return column labels (i.e. flows) of frame result without reading any values."""
+        with zipfile.ZipFile(self._get_path(get_name(calculation))) as archive:
+            return _get_labels(json.loads(archive.read("meta.json"))["columns"])
+
+    def read_sums(self, calculation: Calculation) -> pd.Series:
+        """Return precomputed sum per column of frame result."""
+        with zipfile.ZipFile(self._get_path(get_name(calculation))) as archive:
+            meta = json.loads(archive.read("meta.json"))
+            return pd.Series(_read_array(archive, "sums.npy"), index=_get_labels(meta["columns"]))
+
+    def read_row_sums(self, calculation: Calculation) -> pd.Series:
+        """Return precomputed sum over all columns per row (i.e. per hour) of frame result."""
+        with zipfile.ZipFile(self._get_path(get_name(calculation))) as archive:
+            meta = json.loads(archive.read("meta.json"))
+            return pd.Series(_read_array(archive, "row_sums.npy"), index=self._read_index(archive, meta))
+
+    def size(self) -> int:
+        """Return size of store files in bytes."""
+        return sum(path.stat().st_size for path in self.path.glob("*.zip"))
+
+    def compact(self) -> None:
+        """Drop columns of all frame results and keep precomputed sums, index and meta data only."""
+        for path in self.path.glob("*.zip"):
+            with zipfile.ZipFile(path) as archive:
+                meta = json.loads(archive.read("meta.json"))
+                if meta["type"] != "frame" or meta.get("compacted"):
+                    continue
+                meta["compacted"] = True
+                with _replace(path) as compacted:
+                    for member in archive.namelist():
+                        if member.startswith("columns/"):
+                            continue
+                        content = json.dumps(meta, default=str) if member == "meta.json" else archive.read(member)
+                        compacted.writestr(member, content)
+
+    def delete(self) -> None:
+        """Delete store files."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _get_path(self, name: str) -> pathlib.Path:
+        """Return path of file holding given calculation."""
+        return self.path / f"{quote(name, safe='')}.zip"
+
+    @staticmethod
+    def _write_result(archive: zipfile.ZipFile, result: Result) -> None:
+        index_names, index_tz = [], []
+        for level in range(result.index.nlevels):
+            values = result.index.get_level_values(level)
+            tz = getattr(values, "tz", None)
+            if tz is not None:
+                values = values.tz_convert("UTC").tz_localize(None)
+            index_names.append(values.name)
+            index_tz.append(str(tz) if tz is not None else None)
+            _write_array(archive, f"index/{level}.npy", values.to_numpy())
+
+        meta = {"index_names": index_names, "index_tz": index_tz}
+        if isinstance(result, pd.Series):
+            meta.update({"type": "series", "name": result.name})
+            _write_array(archive, "values.npy", result.to_numpy())
+        else:
+            meta.update({"type": "frame", "columns": list(result.columns)})
+            for position in range(len(result.columns)):
+                _write_array(archive, f"columns/{position}.npy", result.iloc[:, position].to_numpy())
+            _write_array(archive, "sums.npy", result.sum().to_numpy())
+            _write_array(archive, "row_sums.npy", result.sum(axis=1).to_numpy())
+        archive.writestr("meta.json", json.dumps(meta, default=str))
+
+    @staticmethod
+    def _read_index(archive: zipfile.ZipFile, meta: dict) -> pd.Index:
+        levels = []
+        for level, (level_name, tz) in enumerate(zip(meta["index_names"], meta["index_tz"])):
+            values = pd.Index(_read_array(archive, f"index/{level}.npy"), name=level_name)
+            if tz is not None:
+                values = values.tz_localize("UTC").tz_convert(tz)
+            levels.append(values)
+        if len(levels) == 1:
+            return levels[0]
+        return pd.MultiIndex.from_arrays(levels)
+
+
+@contextlib.contextmanager
+def _replace(path: pathlib.Path) -> Iterator[zipfile.ZipFile]:
+    """Yield archive written into temporary file, which replaces given file after archive is closed."""
+    tmp_path = path.with_suffix(f".{os.getpid()}_{threading.get_ident()}.tmp")
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            yield archive
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _write_array(archive: zipfile.ZipFile, member: str, values: np.ndarray) -> None:
+    """Write array as npy member; objects (i.e. labels) are stored as strings, as pickling is not allowed."""
+    if values.dtype == object:
+        values = values.astype(str)
+    with archive.open(member, "w") as member_file:
+        np.lib.format.write_array(member_file, values, allow_pickle=False)
+
+
+def _read_array(archive: zipfile.ZipFile, member: str) -> np.ndarray:
+    with archive.open(member) as member_file:
+        return np.lib.format.read_array(member_file, allow_pickle=False)
+
+
+def _get_labels(columns: list) -> list:
+    """Restore column labels from JSON (tuples of multiindex columns are stored as lists)."""
+    return [tuple(column) if isinstance(column, list) else column for column in columns]
+
+
+@timing.timed("results")
+def get_store(simulation_id: int, calculations: list[Calculation]) -> ResultStore:
+    """
+    Return result store of simulation and make sure given calculations are stored.
+
+    Missing calculations are read from (or calculated and stored in) database via django-oemof and added to store.
+
+    Parameters
+    ----------
+    simulation_id: int
+        Simulation ID
+    calculations: list[Calculation]
+        Calculations which must be present in store
+
+    Returns
+    -------
+    ResultStore
+        Store holding at least given calculations
+    """
+    models.SimulationUsage.touch(simulation_id)
+    store = ResultStore(simulation_id)
+    stored = store.names()
+    missing = {get_name(calculation): calculation for calculation in calculations}
+    missing = {name: calculation for name, calculation in missing.items() if name not in stored}
+    if missing:
+        store.write(oemof_results.get_results(simulation_id, missing))
+    return store
+
+
+@timing.timed("results")
+def get_results(
+    simulation_id: int,
+    calculations: Union[list[Calculation], dict[str, Calculation]],
+) -> dict[str, Result]:
+    """
+    Return results for given calculations from result store (drop-in replacement for django-oemof's `get_results`).
+
+    Parameters
+    ----------
+    simulation_id: int
+        Simulation ID
+    calculations: Union[list[Calculation], dict[str, Calculation]]
+        Either list or dict of calculations; if dict is given, its keys are used as keys of returned results
+
+    Returns
+    -------
+    dict[str, Result]
+        Results by calculation name or given key
+    """
+    if isinstance(calculations, list):
+        calculations = {get_name(calculation): calculation for calculation in calculations}
+    store = get_store(simulation_id, list(calculations.values()))
+    return {key: store.read(calculation) for key, calculation in calculations.items()}
+
+
+def delete_results(sender, instance: Simulation, **kwargs) -> None:  # noqa: ARG001, ANN001
+    """Delete result store of simulation when simulation is deleted (connected to `post_delete` signal)."""
+    ResultStore(instance.id).delete()
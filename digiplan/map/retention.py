@@ -0,0 +1,181 @@
+"""
+Module to apply retention policy to stored simulations.
+
+Each submitted slider state leaves a simulation with full oemof inputs and results in DB. To limit DB size:
+
+- pinned simulations and simulations used within `settings.SIMULATION_KEEP_DAYS` are kept untouched,
+- older simulations are compacted: all results needed by the app are precomputed into result store, afterwards
+  oemof dataset (scalars and sequences) and frame results are deleted from DB and flows are dropped from result store,
+- simulations not used within `settings.SIMULATION_TTL_DAYS` are purged completely.
+"""
+
+import datetime as dt
+import logging
+from collections.abc import Callable
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Func, IntegerField, QuerySet, Sum
+from django.utils import timezone
+from django_oemof.models import (
+    OemofData,
+    OemofScalar,
+    OemofSequence,
+    Result,
+    Simulation,
+)
+
+from digiplan.map import comparison, models, popups, result_store
+
+logger = logging.getLogger(__name__)
+
+
+def get_size(queryset: QuerySet, field: str) -> int:
+    """Return stored (compressed) size of given field of all rows in queryset in bytes."""
+    size = queryset.aggregate(size=Sum(Func(field, function="pg_column_size", output_field=IntegerField())))["size"]
+    return size or 0
+
+
+def pin(simulation_id: int, *, pinned: bool = True) -> None:
+    """Pin simulation to exclude it from retention policy (or unpin it)."""
+    models.SimulationUsage.objects.update_or_create(simulation_id=simulation_id, defaults={"pinned": pinned})
+
+
+def precompute(simulation_id: int) -> None:
+    """Store all results used by indicators, charts and popups of simulation in result store."""
+    for indicator in comparison.INDICATORS.values():
+        indicator(simulation_id)
+    popup_calculations = [popup.calculation for popup in popups.POPUPS.values() if getattr(popup, "calculation", None)]
+    result_store.get_store(simulation_id, popup_calculations)
+
+
+def delete_dataset(simulation: Simulation) -> int:
+    """
+    Delete oemof inputs and results of simulation from DB.
+
+    Parameters
+    ----------
+    simulation: Simulation
+        Simulation to delete oemof dataset from
+
+    Returns
+    -------
+    int
+        Reclaimed size in bytes
+    """
+    dataset = simulation.dataset
+    if dataset is None or Simulation.objects.filter(dataset=dataset).exclude(pk=simulation.pk).exists():
+        return 0
+    data_ids = [dataset.input_id, dataset.result_id]
+    sequences = OemofSequence.objects.filter(oemofdata__in=data_ids)
+    scalars = OemofScalar.objects.filter(oemofdata__in=data_ids)
+    reclaimed = get_size(sequences, "value")
+    # Simulation would be deleted together with dataset otherwise
+    Simulation.objects.filter(pk=simulation.pk).update(dataset=None)
+    sequences.delete()
+    scalars.delete()
+    # Deleting oemof data cascades to dataset
+    OemofData.objects.filter(pk__in=data_ids).delete()
+    return reclaimed
+
+
+def compact(simulation: Simulation) -> dict[str, int]:
+    """
+    Compact simulation down to scalar results and precomputed sums.
+
+    Parameters
+    ----------
+    simulation: Simulation
+        Simulation to compact
+
+    Returns
+    -------
+    dict[str, int]
+        Reclaimed size in bytes in DB and result store
+    """
+    # Precomputation marks simulation as used, thus last usage is restored afterwards
+    last_used = models.SimulationUsage.objects.get(simulation=simulation).last_used
+    precompute(simulation.pk)
+    store = result_store.ResultStore(simulation.pk)
+    store_size = store.size()
+    with transaction.atomic():
+        frames = Result.objects.filter(simulation=simulation, data_type="frame")
+        database = get_size(frames, "data")
+        frames.delete()
+        database += delete_dataset(simulation)
+        models.SimulationUsage.objects.filter(simulation=simulation).update(compacted=True, last_used=last_used)
+    store.compact()
+    return {"database": database, "result_store": store_size - store.size()}
+
+
+def purge(simulation: Simulation) -> dict[str, int]:
+    """
+    Delete simulation including its oemof dataset, results and result store.
+
+    Parameters
+    ----------
+    simulation: Simulation
+        Simulation to delete
+
+    Returns
+    -------
+    dict[str, int]
+        Reclaimed size in bytes in DB and result store
+    """
+    store_size = result_store.ResultStore(simulation.pk).size()
+    with transaction.atomic():
+        database = get_size(Result.objects.filter(simulation=simulation), "data") + delete_dataset(simulation)
+        # Result store is deleted via post_delete signal
+        simulation.delete()
+    return {"database": database, "result_store": store_size}
+
+
+def try_retention(
+    action: Callable[[Simulation], dict[str, int]],
+    simulation: Simulation,
+) -> Optional[dict[str, int]]:
+    """Apply retention action to simulation; failures are logged only, thus other simulations are still processed."""
+    try:
+        return action(simulation)
+    except Exception:
+        logger.exception(f"Retention failed for simulation {simulation.pk}.")
+        return None
+
+
+def apply_retention() -> dict[str, int]:
+    """
+    Compact and purge simulations according to retention policy.
+
+    Simulations without usage information (i.e. stored before usage was tracked) are treated as used now.
+
+    Returns
+    -------
+    dict[str, int]
+        Number of compacted and purged simulations and reclaimed bytes in DB and result store
+    """
+    models.SimulationUsage.objects.bulk_create(
+        [
+            models.SimulationUsage(simulation_id=simulation_id)
+            for simulation_id in Simulation.objects.filter(usage__isnull=True).values_list("pk", flat=True)
+        ],
+    )
+    now = timezone.now()
+    keep_until = now - dt.timedelta(days=settings.SIMULATION_KEEP_DAYS)
+    ttl = now - dt.timedelta(days=settings.SIMULATION_TTL_DAYS)
+    unpinned = models.SimulationUsage.objects.filter(pinned=False).select_related("simulation")
+
+    report = {"compacted": 0, "purged": 0, "database_bytes": 0, "result_store_bytes": 0}
+    for action, usages in (
+        ("purged", unpinned.filter(last_used__lt=ttl)),
+        ("compacted", unpinned.filter(last_used__lt=keep_until, last_used__gte=ttl, compacted=False)),
+    ):
+        for usage in usages:
+            reclaimed = try_retention(purge if action == "purged" else compact, usage.simulation)
+            if reclaimed is None:
+                continue
+            report[action] += 1
+            report["database_bytes"] += reclaimed["database"]
+            report["result_store_bytes"] += reclaimed["result_store"]
+    logger.info(f"Simulation retention applied: {report}")
+    return report
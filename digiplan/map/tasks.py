@@ -0,0 +1,11 @@
+"""Celery tasks of map app."""
+
+from celery import shared_task
+
+from digiplan.map import retention
+
+
+@shared_task
+def apply_simulation_retention() -> dict[str, int]:
+    """Compact and purge stored simulations according to retention policy and report reclaimed space."""
+    return retention.apply_retention()
@@ -0,0 +1,112 @@
+"""
+Module to calculate vector tiles around map center at startup and to pre-render them.
+
+Tiles of sources shown at startup are rendered at deploy time and stored in cache per data version. They are served
+by `digiplan.utils.middleware.PrerenderedTileMiddleware` before any view is called, thus first map paint needs no DB
+work. Pages announce tiles of startup viewport via preload hints, so browsers fetch them in parallel to map setup.
+"""
+
+import math
+import re
+from collections.abc import Iterator
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import resolve
+
+from digiplan.map import caching
+
+# Tiles within given radius around center tile cover viewport on common screens
+STARTUP_TILE_RADIUS = 2
+# Users mostly zoom in once after startup
+STARTUP_ZOOM_OFFSETS = (0, 1)
+# MVT sources visible at startup (municipality source holds municipality and label layer)
+STARTUP_SOURCES = ("municipality",)
+
+MVT_PATH = re.compile(r"^/map/(?P<source>[\w-]+)_mvt/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)/$")
+
+
+def get_tile(lon: float, lat: float, z: int) -> tuple[int, int, int]:
+    """Return x, y and z of tile containing given coordinates at given zoom level."""
+    x = int((lon + 180) / 360 * 2**z)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * 2**z)
+    return x, y, z
+
+
+def get_startup_tile() -> tuple[int, int, int]:
+    """Return x, y and z of tile at map center at startup."""
+    lon, lat = settings.MAP_ENGINE_CENTER_AT_STARTUP
+    return get_tile(lon, lat, settings.MAP_ENGINE_ZOOM_AT_STARTUP)
+
+
+def get_startup_tiles(offsets: tuple[int, ...] = STARTUP_ZOOM_OFFSETS) -> Iterator[tuple[int, int, int]]:
+    """Yield x, y and z of all tiles of startup viewport and given zoom offsets (defaults to startup zoom levels)."""
+    lon, lat = settings.MAP_ENGINE_CENTER_AT_STARTUP
+    for offset in offsets:
+        center_x, center_y, z = get_tile(lon, lat, settings.MAP_ENGINE_ZOOM_AT_STARTUP + offset)
+        for x in range(center_x - STARTUP_TILE_RADIUS, center_x + STARTUP_TILE_RADIUS + 1):
+            for y in range(center_y - STARTUP_TILE_RADIUS, center_y + STARTUP_TILE_RADIUS + 1):
+                yield x, y, z
+
+
+def get_mvt_url(source: str, x: int, y: int, z: int) -> str:
+    """Return URL of MVT served by django-mapengine for given source."""
+    return f"/map/{source}_mvt/{z}/{x}/{y}/"
+
+
+def get_preload_urls() -> list[str]:
+    """Return URLs of tiles needed for first map paint (startup sources in startup viewport at startup zoom)."""
+    return [get_mvt_url(source, *tile) for source in STARTUP_SOURCES for tile in get_startup_tiles(offsets=(0,))]
+
+
+def get_tile_key(source: str, x: int, y: int, z: int) -> str:
+    """Return cache key of pre-rendered tile."""
+    return caching.get_key("tile", source, z, x, y)
+
+
+def render_tile(source: str, x: int, y: int, z: int) -> bytes:
+    """Render tile in-process via MVT view of django-mapengine; returns empty bytes for empty or invalid tiles."""
+    url = get_mvt_url(source, x, y, z)
+    match = resolve(url)
+    tile_response = match.func(RequestFactory().get(url), *match.args, **match.kwargs)
+    tile_response.render()
+    return tile_response.content if tile_response.status_code == 200 else b""  # noqa: PLR2004
+
+
+def prerender_startup_tiles() -> int:
+    """
+    Render tiles of startup sources for all startup tiles and store them in cache for current data version.
+
+    Returns
+    -------
+    int
+        Number of pre-rendered tiles
+    """
+    count = 0
+    for source in STARTUP_SOURCES:
+        for tile in get_startup_tiles():
+            cache.set(get_tile_key(source, *tile), render_tile(source, *tile), timeout=caching.DATA_TIMEOUT)
+            count += 1
+    return count
+
+
+def get_prerendered_tile(path: str) -> Optional[bytes]:
+    """
+    Return pre-rendered tile for given request path.
+
+    Parameters
+    ----------
+    path: str
+        Request path of MVT
+
+    Returns
+    -------
+    Optional[bytes]
+        Tile content (empty for tiles without features); None, if path is no pre-rendered tile
+    """
+    match = MVT_PATH.match(path)
+    if not match or match["source"] not in STARTUP_SOURCES:
+        return None
+    return cache.get(get_tile_key(match["source"], int(match["x"]), int(match["y"]), int(match["z"])))
@@ -0,0 +1,119 @@
+"""
+Module to provide downsampled hourly time series of simulation results.
+
+Sequences of selected flows are read from result store and downsampled to a point budget via
+Largest-Triangle-Three-Buckets (LTTB), which keeps peaks and shape of a series visible in charts.
+Each flow is downsampled independently and returned as columnar arrays of hour offsets and values.
+"""
+
+from typing import Optional
+
+import numpy as np
+from django.core.cache import cache
+
+from digiplan.map import caching, calculations, result_store
+
+TIMESERIES = {
+    "renewables": calculations.renewable_flows,
+    "demand": calculations.demand_flows,
+    "exchange": calculations.electricity_exchange_flows,
+    "heatpumps": calculations.heatpump_flows,
+}
+
+DEFAULT_POINTS = 500
+MIN_POINTS = 3
+MAX_POINTS = 8760
+
+
+def lttb(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Return indices of points selected by Largest-Triangle-Three-Buckets downsampling.
+
+    First and last points are always kept; inner points are split into buckets and from each bucket the point forming
+    the largest triangle with the previously selected point and the average of the next bucket is selected.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Equidistant values of series
+    points: int
+        Number of points to keep
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of selected points
+    """
+    length = len(values)
+    if points >= length or points < MIN_POINTS:
+        return np.arange(length)
+    edges = np.linspace(1, length - 1, points - 1).astype(int)
+    indices = np.empty(points, dtype=int)
+    indices[0], indices[-1] = 0, length - 1
+    selected = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        average_x = (end + next_end - 1) / 2
+        average_y = values[end:next_end].mean()
+        bucket_x = np.arange(start, end)
+        areas = np.abs(
+            (selected - average_x) * (values[start:end] - values[selected])
+            - (selected - bucket_x) * (average_y - values[selected]),
+        )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def get_flows(simulation_id: int, lookup: str) -> list[str]:
+    """Return names of flows available for given time series of simulation."""
+    calculation = TIMESERIES[lookup]
+    return result_store.get_store(simulation_id, [calculation]).columns(calculation)
+
+
+def get_timeseries(
+    simulation_id: int,
+    lookup: str,
+    points: int = DEFAULT_POINTS,
+    flows: Optional[list[str]] = None,
+) -> dict:
+    """
+    Return downsampled flow sequences of simulation (cached per simulation).
+
+    Parameters
+    ----------
+    simulation_id: int
+        Simulation ID
+    lookup: str
+        Name of time series, see `TIMESERIES`
+    points: int
+        Point budget per flow
+    flows: Optional[list[str]]
+        Only return given flows; all flows of time series are returned if not set
+
+    Returns
+    -------
+    dict
+        Start of time index, step in seconds and hour offsets and values per flow
+    """
+    points = min(max(points, MIN_POINTS), MAX_POINTS)
+    key = caching.get_key("timeseries", lookup, simulation_id, points, *(flows or []))
+    timeseries = cache.get(key)
+    if timeseries is not None:
+        return timeseries
+
+    calculation = TIMESERIES[lookup]
+    sequences = result_store.get_store(simulation_id, [calculation]).read(calculation, columns=flows)
+    series = {}
+    for flow in sequences.columns:
+        values = sequences[flow].to_numpy(dtype=float)
+        indices = lttb(values, points)
+        series[flow] = {"hours": indices.tolist(), "values": np.round(values[indices], 3).tolist()}
+    timeseries = {
+        "start": sequences.index[0].isoformat() if len(sequences.index) else None,
+        "step": 3600,
+        "series": series,
+    }
+    cache.set(key, timeseries, timeout=caching.get_timeout(simulation_based=True))
+    return timeseries
@@ -1,6 +1,7 @@
 """URLs for map app, including main view and API points."""
 
 
+from django.conf import settings
 from django.urls import path
 
 from . import views
@@ -9,7 +10,24 @@ app_name = "map"
 
 urlpatterns = [
     path("", views.MapGLView.as_view(), name="map"),
-    path("choropleth/<str:lookup>/<str:layer_id>", views.get_choropleth, name="choropleth"),
-    path("popup/<str:lookup>/<int:region>", views.get_popup, name="popup"),
-    path("charts", views.get_charts, name="charts"),
+    path(
+        "choropleth/<str:lookup>/<str:layer_id>",
+        views.get_choropleth_async if settings.ASYNC_VIEWS else views.get_choropleth,
+        name="choropleth",
+    ),
+    path(
+        "popup/<str:lookup>/<int:region>",
+        views.get_popup_async if settings.ASYNC_VIEWS else views.get_popup,
+        name="popup",
+    ),
+    path("charts", views.get_charts_async if settings.ASYNC_VIEWS else views.get_charts, name="charts"),
+    path(
+        "timeseries/<str:lookup>",
+        views.get_timeseries_async if settings.ASYNC_VIEWS else views.get_timeseries,
+        name="timeseries",
+    ),
+    path("comparison", views.get_comparison_async if settings.ASYNC_VIEWS else views.get_comparison, name="comparison"),
+    path("export", views.get_export_async if settings.ASYNC_VIEWS else views.get_export, name="export"),
+    path("analysis", views.get_analysis_async if settings.ASYNC_VIEWS else views.get_analysis, name="analysis"),
+    path("bboxes", views.get_bboxes_async if settings.ASYNC_VIEWS else views.get_bboxes, name="bboxes"),
 ]
@@ -4,15 +4,39 @@ Views for map app.
 As map app is SPA, this module contains main view and various API points.
 """
 
+import functools
+from collections.abc import Callable
+from typing import Optional
+
 from django.conf import settings
 from django.http import HttpRequest, response
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_POST
 from django.views.generic import TemplateView
 from django_mapengine import views
 
 from digiplan import __version__
 from digiplan.map import config
+from digiplan.utils import executor, timing
+
+from . import (
+    analysis,
+    caching,
+    charts,
+    choropleths,
+    comparison,
+    export,
+    forms,
+    map_config,
+    models,
+    popups,
+    tiles,
+    timeseries,
+    utils,
+)
 
-from . import charts, choropleths, forms, map_config, popups, utils
+# Returned if hourly sequences of simulation are requested after retention policy has compacted it
+COMPACTED_MESSAGE = "Hourly sequences of simulation are no longer available, as simulation has been compacted."
 
 
 class MapGLView(TemplateView, views.MapEngineMixin):
@@ -29,6 +53,7 @@ class MapGLView(TemplateView, views.MapEngineMixin):
         },
         "store_hot_init": config.STORE_HOT_INIT,
         "oemof_scenario": settings.OEMOF_SCENARIO,
+        "preload_tiles": tiles.get_preload_urls(),
     }
 
     def get_context_data(self, **kwargs) -> dict:
@@ -75,7 +100,7 @@ class MapGLView(TemplateView, views.MapEngineMixin):
             for category, layers in map_config.LEGEND.items()
         }
         context["sources"] = categorized_sources
-        context["store_cold_init"] = config.STORE_COLD_INIT
+        context["store_cold_init"] = config.get_store_cold_init()
         context["detailed_overview"] = charts.Chart("detailed_overview").render()
         context["ghg_overview"] = charts.Chart("ghg_overview").render()
         context["electricity_overview"] = charts.Chart("electricity_overview").render()
@@ -93,6 +118,107 @@ class MapGLView(TemplateView, views.MapEngineMixin):
         return context
 
 
+def get_simulation_id(request: HttpRequest) -> Optional[int]:
+    """Return simulation ID from map state in request (if given)."""
+    simulation_id = request.GET.get("simulation_id", request.GET.get("map_state[simulation_id]"))
+    return int(simulation_id) if simulation_id else None
+
+
+def simulation_cache_control(is_simulation_based: Callable[..., bool]) -> Callable:
+    """
+    Set cache control for responses depending on whether they are simulation based or not.
+
+    Simulation based responses never change for given simulation ID and are marked as immutable.
+    All other responses must be revalidated via ETag, as underlying data might change.
+
+    Parameters
+    ----------
+    is_simulation_based: Callable[..., bool]
+        Called with request and view arguments, must return True if response is simulation based
+
+    Returns
+    -------
+    Callable
+        view decorator
+    """
+
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def inner(request: HttpRequest, *args, **kwargs) -> response.HttpResponse:  # noqa: ANN002
+            view_response = view(request, *args, **kwargs)
+            if get_simulation_id(request) is not None and is_simulation_based(request, *args, **kwargs):
+                patch_cache_control(view_response, max_age=caching.SIMULATION_TIMEOUT, immutable=True)
+            else:
+                patch_cache_control(view_response, no_cache=True)
+            return view_response
+
+        return inner
+
+    return decorator
+
+
+def get_popup_etag(request: HttpRequest, lookup: str, region: int) -> str:
+    """Return ETag for popup."""
+    return caching.get_etag("popup", lookup, region, get_simulation_id(request))
+
+
+def get_choropleth_etag(request: HttpRequest, lookup: str, layer_id: str) -> str:
+    """Return ETag for choropleth."""
+    return caching.get_etag("choropleth", lookup, layer_id, get_simulation_id(request))
+
+
+def get_charts_etag(request: HttpRequest) -> str:
+    """Return ETag for charts."""
+    return caching.get_etag("charts", *request.GET.getlist("charts[]"), get_simulation_id(request))
+
+
+def get_timeseries_etag(request: HttpRequest, lookup: str) -> str:
+    """Return ETag for time series."""
+    return caching.get_etag(
+        "timeseries",
+        lookup,
+        request.GET.get("points"),
+        *request.GET.getlist("flows[]"),
+        get_simulation_id(request),
+    )
+
+
+def get_comparison_etag(request: HttpRequest) -> str:
+    """Return ETag for comparison."""
+    return caching.get_etag(
+        "comparison",
+        *request.GET.getlist("simulation_ids[]"),
+        *request.GET.getlist("indicators[]"),
+    )
+
+
+def get_bboxes_etag(request: HttpRequest) -> str:  # noqa: ARG001
+    """Return ETag for municipality bounding boxes."""
+    return caching.get_etag("bboxes")
+
+
+def is_simulation_popup(request: HttpRequest, lookup: str, region: int) -> bool:  # noqa: ARG001
+    """Return True if popup is simulation based."""
+    return getattr(popups.POPUPS[lookup], "simulation_based", False)
+
+
+def is_simulation_choropleth(request: HttpRequest, lookup: str, layer_id: str) -> bool:  # noqa: ARG001
+    """Return True if choropleth is simulation based."""
+    return choropleths.CHOROPLETHS[lookup].simulation_based
+
+
+def is_simulation_timeseries(request: HttpRequest, lookup: str) -> bool:  # noqa: ARG001
+    """Return True, as time series are always simulation based."""
+    return True
+
+
+def are_simulation_charts(request: HttpRequest) -> bool:
+    """Return True if all requested charts are simulation based."""
+    return all(issubclass(charts.CHARTS[lookup], charts.SimulationChart) for lookup in request.GET.getlist("charts[]"))
+
+
+@simulation_cache_control(is_simulation_popup)
+@condition(etag_func=get_popup_etag)
 def get_popup(request: HttpRequest, lookup: str, region: int) -> response.JsonResponse:
     """
     Return popup as html and chart options to render chart on popup.
@@ -117,6 +243,8 @@ def get_popup(request: HttpRequest, lookup: str, region: int) -> response.JsonRe
 
 
 # pylint: disable=W0613
+@simulation_cache_control(is_simulation_choropleth)
+@condition(etag_func=get_choropleth_etag)
 def get_choropleth(request: HttpRequest, lookup: str, layer_id: str) -> response.JsonResponse:  # noqa: ARG001
     """
     Read scenario results from database, aggregate data and send back data.
@@ -139,6 +267,8 @@ def get_choropleth(request: HttpRequest, lookup: str, layer_id: str) -> response
     return choropleths.CHOROPLETHS[lookup](lookup, map_state)
 
 
+@simulation_cache_control(are_simulation_charts)
+@condition(etag_func=get_charts_etag)
 def get_charts(request: HttpRequest) -> response.JsonResponse:
     """
     Return all result charts at once.
@@ -155,9 +285,172 @@ def get_charts(request: HttpRequest) -> response.JsonResponse:
         `div_id` is used in frontend to detect chart container.
     """
     lookups = request.GET.getlist("charts[]")
-    simulation_id = None
-    if "map_state[simulation_id]" in request.GET.dict():
-        simulation_id = int(request.GET.dict()["map_state[simulation_id]"])
-    return response.JsonResponse(
+    simulation_id = get_simulation_id(request)
+    return timing.JsonResponse(
         {lookup: charts.CHARTS[lookup](simulation_id=simulation_id).render() for lookup in lookups},
     )
+
+
+@simulation_cache_control(is_simulation_timeseries)
+@condition(etag_func=get_timeseries_etag)
+def get_timeseries(request: HttpRequest, lookup: str) -> response.HttpResponse:
+    """
+    Return downsampled hourly sequences of flows for simulation.
+
+    Parameters
+    ----------
+    request: HttpRequest
+        request holding simulation ID, optional point budget `points` and optional selection of flows `flows[]`
+    lookup: str
+        Name of time series (i.e. "renewables", "demand", "exchange", "heatpumps")
+
+    Returns
+    -------
+    HttpResponse
+        JsonResponse holding start, step in seconds and hour offsets and values per flow.
+        Bad request, if simulation ID or point budget is missing or invalid or if time series or flows are unknown.
+        Gone, if hourly sequences of simulation have been dropped by retention policy.
+    """
+    simulation_id = get_simulation_id(request)
+    points = request.GET.get("points", str(timeseries.DEFAULT_POINTS))
+    flows = request.GET.getlist("flows[]")
+    if simulation_id is None or not points.isdigit():
+        return response.HttpResponseBadRequest("Simulation ID and valid point budget are required")
+    if lookup not in timeseries.TIMESERIES:
+        return response.HttpResponseBadRequest(f"Time series must be out of: {', '.join(timeseries.TIMESERIES)}")
+    if models.SimulationUsage.is_compacted(simulation_id):
+        return response.HttpResponseGone(COMPACTED_MESSAGE)
+    if flows and not set(flows) <= set(timeseries.get_flows(simulation_id, lookup)):
+        return response.HttpResponseBadRequest("Unknown flows")
+    return timing.JsonResponse(timeseries.get_timeseries(simulation_id, lookup, int(points), flows or None))
+
+
+@condition(etag_func=get_comparison_etag)
+def get_comparison(request: HttpRequest) -> response.HttpResponse:
+    """
+    Return indicators of multiple simulations side by side.
+
+    Parameters
+    ----------
+    request: HttpRequest
+        request holding list of simulation IDs `simulation_ids[]` and list of indicators `indicators[]`
+
+    Returns
+    -------
+    HttpResponse
+        JsonResponse holding table per indicator in split orientation (index, columns and data),
+        with one column per simulation. Bad request, if simulations or indicators are missing or invalid.
+    """
+    simulation_ids = request.GET.getlist("simulation_ids[]")
+    indicators = request.GET.getlist("indicators[]")
+    if (
+        not simulation_ids
+        or len(simulation_ids) > comparison.MAX_SIMULATIONS
+        or not all(simulation_id.isdigit() for simulation_id in simulation_ids)
+    ):
+        return response.HttpResponseBadRequest(f"Between 1 and {comparison.MAX_SIMULATIONS} simulation IDs required")
+    if not indicators or not set(indicators) <= comparison.INDICATORS.keys():
+        return response.HttpResponseBadRequest(f"Indicators must be out of: {', '.join(comparison.INDICATORS)}")
+    tables = comparison.compare([int(simulation_id) for simulation_id in simulation_ids], indicators)
+    comparison_response = timing.JsonResponse(
+        {indicator: comparison.to_json(table) for indicator, table in tables.items()},
+    )
+    patch_cache_control(comparison_response, max_age=caching.SIMULATION_TIMEOUT, immutable=True)
+    return comparison_response
+
+
+@condition(etag_func=get_bboxes_etag)
+def get_bboxes(request: HttpRequest) -> response.JsonResponse:  # noqa: ARG001
+    """
+    Return bounding boxes of all municipalities at once (not repeated in each municipality tile).
+
+    Parameters
+    ----------
+    request: HttpRequest
+        request without parameters
+
+    Returns
+    -------
+    JsonResponse
+        holding [xmin, ymin, xmax, ymax] per municipality ID
+    """
+    bboxes_response = timing.JsonResponse(models.Municipality.bboxes())
+    patch_cache_control(bboxes_response, no_cache=True)
+    return bboxes_response
+
+
+# Polygon is sent in POST body, as GeoJSON of detailed polygons exceeds request line limit of gunicorn
+@require_POST
+def get_analysis(request: HttpRequest) -> response.HttpResponse:
+    """
+    Return installed renewables and potential areas within user-drawn polygon.
+
+    Answers are cached per data version and polygon hash (see `analysis.analyse`).
+
+    Parameters
+    ----------
+    request: HttpRequest
+        POST request holding polygon as GeoJSON geometry in WGS84 (`polygon`) and CSRF token
+
+    Returns
+    -------
+    HttpResponse
+        JsonResponse holding area of polygon, unit count and capacities per technology and potential areas per layer.
+        Bad request, if polygon is missing or invalid.
+    """
+    try:
+        polygon = analysis.parse_polygon(request.POST.get("polygon", ""))
+    except ValueError as error:
+        return response.HttpResponseBadRequest(str(error))
+    return timing.JsonResponse(analysis.analyse(polygon))
+
+
+def get_export(request: HttpRequest) -> response.HttpResponse:
+    """
+    Stream per-municipality indicators and optional hourly sequences of simulation as file.
+
+    Parameters
+    ----------
+    request: HttpRequest
+        request holding simulation ID, `format` (csv, xlsx or parquet), optional list of indicators `indicators[]`
+        (defaults to all indicators) and optional list of hourly sequences `sequences[]`
+
+    Returns
+    -------
+    HttpResponse
+        StreamingHttpResponse holding export as attachment.
+        Bad request, if simulation ID, format, indicators or sequences are invalid.
+        Gone, if sequences are requested but have been dropped by retention policy.
+    """
+    simulation_id = get_simulation_id(request)
+    export_format = request.GET.get("format", "csv")
+    indicators = request.GET.getlist("indicators[]") or list(export.INDICATORS)
+    sequences = request.GET.getlist("sequences[]")
+    if simulation_id is None:
+        return response.HttpResponseBadRequest("Simulation ID is required")
+    if export_format not in export.get_formats():
+        return response.HttpResponseBadRequest(f"Format must be out of: {', '.join(export.get_formats())}")
+    if not set(indicators) <= export.INDICATORS.keys() or not set(sequences) <= timeseries.TIMESERIES.keys():
+        return response.HttpResponseBadRequest("Unknown indicators or sequences")
+    if sequences and models.SimulationUsage.is_compacted(simulation_id):
+        return response.HttpResponseGone(COMPACTED_MESSAGE)
+
+    content_type, to_format = export.FORMATS[export_format]
+    content = to_format(export.iter_rows(simulation_id, indicators, sequences))
+    if settings.ASYNC_VIEWS:
+        content = export.spool(content)
+    export_response = response.StreamingHttpResponse(content, content_type=content_type)
+    filename = f"digiplan_simulation_{simulation_id}.{export_format}"
+    export_response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return export_response
+
+
+# Async variants of endpoints used if `settings.ASYNC_VIEWS` is set (see config/asgi.py)
+get_popup_async = executor.async_view(get_popup)
+get_choropleth_async = executor.async_view(get_choropleth)
+get_charts_async = executor.async_view(get_charts)
+get_timeseries_async = executor.async_view(get_timeseries)
+get_comparison_async = executor.async_view(get_comparison)
+get_export_async = executor.async_view(get_export)
+get_analysis_async = executor.async_view(get_analysis)
+get_bboxes_async = executor.async_view(get_bboxes)
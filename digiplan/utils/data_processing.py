@@ -9,7 +9,7 @@ import pandas as pd
 from django.db.models import Model
 
 from config.settings.base import DIGIPIPE_DIR, DIGIPIPE_GEODATA_DIR
-from digiplan.map import models
+from digiplan.map import caching, models
 from digiplan.utils.ogr_layer_mapping import RelatedModelLayerMapping
 
 REGIONS = [models.Municipality]
@@ -82,6 +82,12 @@ def load_regions(regions: Optional[list[Model]] = None, *, verbose: bool = True)
         )
         instance.region = region_model
         instance.save(strict=True, verbose=verbose)
+    caching.bump_data_version()
+
+
+def refresh_stats() -> None:
+    """Refresh statistics aggregated from cluster models."""
+    models.RenewableStats.refresh()
 
 
 def load_data(models: Optional[list[Model]] = None) -> None:
@@ -106,6 +112,8 @@ def load_data(models: Optional[list[Model]] = None) -> None:
             transform=4326,
         )
         instance.save(strict=True)
+    refresh_stats()
+    caching.bump_data_version()
 
 
 def load_population() -> None:
@@ -132,6 +140,7 @@ def load_population() -> None:
                 municipality=municipality,
             )
             entry.save()
+    caching.bump_data_version()
 
 
 def empty_data(models: Optional[list[Model]] = None) -> None:
@@ -139,3 +148,5 @@ def empty_data(models: Optional[list[Model]] = None) -> None:
     models = models or MODELS
     for model in models:
         model.objects.all().delete()
+    refresh_stats()
+    caching.bump_data_version()
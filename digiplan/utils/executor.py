@@ -0,0 +1,75 @@
+"""
+Bounded executor to run blocking code from async views.
+
+Django 3.2 offers no async API for ORM and cache, and pandas calculations are CPU-bound. Thus, async views offload
+this work into a thread pool limited to `settings.ASYNC_EXECUTOR_WORKERS` threads. The event loop stays responsive
+for further map interactions, while the number of concurrent calculations per worker process is bounded.
+"""
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from django import db
+from django.conf import settings
+
+from digiplan.utils import timing
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return executor of current process (created on first use)."""
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.ASYNC_EXECUTOR_WORKERS, thread_name_prefix="digiplan")
+    return _executor
+
+
+def _call(func: Callable, *args, **kwargs) -> Any:  # noqa: ANN002, ANN401
+    """Call function within executor thread; queries are timed for current request and connections are cleaned up."""
+    try:
+        with timing.track_queries():
+            return func(*args, **kwargs)
+    finally:
+        db.close_old_connections()
+
+
+async def run(func: Callable, *args, **kwargs) -> Any:  # noqa: ANN002, ANN401
+    """
+    Run blocking function in bounded executor and await its result.
+
+    Context (i.e. request timing and active language) is copied into executor thread.
+
+    Parameters
+    ----------
+    func: Callable
+        Blocking function
+    args
+        Positional arguments passed to function
+    kwargs
+        Keyword arguments passed to function
+
+    Returns
+    -------
+    Any
+        Result of function
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        get_executor(),
+        functools.partial(context.run, _call, func, *args, **kwargs),
+    )
+
+
+def async_view(view: Callable) -> Callable:
+    """Return async variant of given sync view, running it in bounded executor."""
+
+    @functools.wraps(view)
+    async def inner(*args, **kwargs) -> Any:  # noqa: ANN002, ANN401
+        return await run(view, *args, **kwargs)
+
+    return inner
@@ -0,0 +1,83 @@
+"""Middleware adaptions to support async views and pre-rendered tiles."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse
+from whitenoise import middleware
+
+from digiplan.map import tiles
+from digiplan.utils import executor
+
+
+class WhiteNoiseMiddleware(middleware.WhiteNoiseMiddleware):
+    """
+    WhiteNoise middleware supporting async requests.
+
+    WhiteNoise 5 is sync only, which would force Django to run all async views in a sync thread.
+    Static files are still served synchronously, all other requests are passed on asynchronously.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        """Init middleware and mark it as coroutine function if following handler is async."""
+        super().__init__(get_response)
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine  # noqa: SLF001
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Serve static file or pass request on."""
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Serve static file or pass request on asynchronously."""
+        static_response = self.process_request(request)
+        if static_response is not None:
+            return static_response
+        return await self.get_response(request)
+
+
+class PrerenderedTileMiddleware:
+    """
+    Serve pre-rendered startup tiles from cache without calling MVT view (see `digiplan.map.tiles`).
+
+    Requests for all other tiles, tiles with filters and tiles not rendered yet are passed on.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        """Init middleware and mark it as coroutine function if following handler is async."""
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine  # noqa: SLF001
+
+    @staticmethod
+    def get_tile_response(request: HttpRequest) -> Optional[HttpResponse]:
+        """Return response holding pre-rendered tile, if requested tile is pre-rendered."""
+        if request.method != "GET" or request.GET or not request.path.startswith("/map/"):
+            return None
+        tile = tiles.get_prerendered_tile(request.path)
+        if tile is None:
+            return None
+        return HttpResponse(tile, content_type="application/vnd.mapbox-vector-tile", status=200 if tile else 204)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Serve pre-rendered tile or pass request on."""
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        return self.get_tile_response(request) or self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Serve pre-rendered tile or pass request on asynchronously; cache is read in executor."""
+        if request.path.startswith("/map/"):
+            tile_response = await executor.run(self.get_tile_response, request)
+            if tile_response is not None:
+                return tile_response
+        return await self.get_response(request)
@@ -0,0 +1,392 @@
+"""
+Module to build a synthetic digipipe datapackage for a given number of municipalities.
+
+Synthetic datapackage is used to test and benchmark digiplan for regions with more municipalities than the original
+region. It is based on a template data folder (original data folder by default) and is set up as follows:
+
+- geopackages for regions and all models loaded via `data_processing` are built from model mappings.
+  Municipalities are arranged in a grid within `MAP_ENGINE_MAX_BOUNDS`, cluster units and static areas are placed
+  randomly within their municipality.
+- scalars holding one row per municipality (first column is "municipality_id") are resampled from template rows and
+  randomly scaled. Capacities and unit counts in MaStR stats are aggregated from generated cluster units.
+- all other scalars, settings and the oemof scenario are copied from template, as they hold data for whole region.
+  Regional demands and capacities are adapted from synthetic scalars by parameter hooks during simulation.
+
+Use the synthetic datapackage by setting env variable `DIGIPLAN_DATA_DIR` to the output folder
+and loading data as usual.
+"""
+
+import logging
+import math
+import pathlib
+import shutil
+import sqlite3
+import struct
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.contrib.gis.db.models import GeometryField
+from django.contrib.gis.gdal import SpatialReference
+from django.contrib.gis.geos import GEOSGeometry, MultiPolygon, Point, Polygon
+from django.db import models as django_models
+from django.db.models import Model
+
+from digiplan.map import models
+from digiplan.utils import data_processing
+
+SRID = 4326
+POPULATION_FILE = "population.csv"
+MUNICIPALITY_COLUMN = "municipality_id"
+
+# Maximum number of cluster units per municipality (number is drawn randomly for each municipality)
+MAX_UNITS_PER_MUNICIPALITY = {
+    models.WindTurbine: 10,
+    models.PVroof: 50,
+    models.PVground: 5,
+    models.Hydro: 2,
+    models.Biomass: 3,
+    models.Combustion: 3,
+    models.GSGK: 2,
+    models.Storage: 50,
+}
+# Technology names used in MaStR stats files
+MASTR_STATS_MODELS = {
+    "wind": models.WindTurbine,
+    "pv_roof": models.PVroof,
+    "pv_ground": models.PVground,
+    "hydro": models.Hydro,
+    "biomass": models.Biomass,
+    "combustion": models.Combustion,
+    "gsgk": models.GSGK,
+    "storage": models.Storage,
+}
+
+# Approximate length of one degree in km
+KM_PER_DEGREE_LAT = 110.57
+KM_PER_DEGREE_LON = 111.32
+
+
+def create_datapackage(
+    municipalities: int,
+    path: pathlib.Path,
+    *,
+    template: Optional[pathlib.Path] = None,
+    seed: int = 0,
+) -> None:
+    """
+    Create synthetic data folder holding digipipe and oemof datapackage for given number of municipalities.
+
+    Parameters
+    ----------
+    municipalities: int
+        Number of municipalities
+    path: pathlib.Path
+        Output folder; digipipe datapackage is stored in subfolder "digipipe", oemof scenario in subfolder "oemof"
+    template: Optional[pathlib.Path]
+        Data folder used as template; defaults to current data folder
+    seed: int
+        Seed for random number generator, same seed results in same datapackage
+    """
+    template = pathlib.Path(template or settings.DATA_DIR)
+    path = pathlib.Path(path)
+    rng = np.random.default_rng(seed)
+
+    logging.info(f"Creating synthetic datapackage for {municipalities} municipalities at '{path}'.")
+    cells = get_municipality_cells(municipalities)
+    units = create_geodata(cells, path / "digipipe" / "geodata", rng)
+    create_scalars(municipalities, template / "digipipe" / "scalars", path / "digipipe" / "scalars", units, rng)
+    shutil.copytree(template / "digipipe" / "settings", path / "digipipe" / "settings", dirs_exist_ok=True)
+    oemof_scenario = pathlib.Path("oemof") / settings.OEMOF_SCENARIO
+    shutil.copytree(template / oemof_scenario, path / oemof_scenario, dirs_exist_ok=True)
+
+
+def get_municipality_cells(municipalities: int) -> list[tuple[float, float, float, float]]:
+    """
+    Split map bounds into grid cells, one cell per municipality.
+
+    Parameters
+    ----------
+    municipalities: int
+        Number of municipalities
+
+    Returns
+    -------
+    list[tuple[float, float, float, float]]
+        Bounding box (xmin, ymin, xmax, ymax) per municipality
+    """
+    (xmin, ymin), (xmax, ymax) = settings.MAP_ENGINE_MAX_BOUNDS
+    columns = math.ceil(math.sqrt(municipalities))
+    rows = math.ceil(municipalities / columns)
+    width = (xmax - xmin) / columns
+    height = (ymax - ymin) / rows
+    return [
+        (
+            xmin + (i % columns) * width,
+            ymin + (i // columns) * height,
+            xmin + (i % columns + 1) * width,
+            ymin + (i // columns + 1) * height,
+        )
+        for i in range(municipalities)
+    ]
+
+
+def create_geodata(
+    cells: list[tuple[float, float, float, float]],
+    path: pathlib.Path,
+    rng: np.random.Generator,
+) -> dict[type[Model], pd.DataFrame]:
+    """
+    Create geopackages for all regions and models loaded via `data_processing`.
+
+    Parameters
+    ----------
+    cells: list[tuple[float, float, float, float]]
+        Bounding box per municipality
+    path: pathlib.Path
+        Geodata folder
+    rng: np.random.Generator
+        Random number generator
+
+    Returns
+    -------
+    dict[type[Model], pd.DataFrame]
+        Generated cluster units (without geometry) per model
+    """
+    units = {}
+    for model in data_processing.REGIONS + data_processing.MODELS:
+        if model is models.Municipality:
+            features = [
+                (MultiPolygon(Polygon.from_bbox(cell)), get_municipality_properties(municipality_id, cell))
+                for municipality_id, cell in enumerate(cells)
+            ]
+        elif model in MAX_UNITS_PER_MUNICIPALITY:
+            features = []
+            for municipality_id, cell in enumerate(cells):
+                for _ in range(rng.integers(1, MAX_UNITS_PER_MUNICIPALITY[model] + 1)):
+                    properties = get_random_properties(model, rng)
+                    properties[model.mapping["mun_id"]["id"]] = municipality_id
+                    features.append((get_random_point(cell, rng), properties))
+            units[model] = pd.DataFrame.from_records([properties for _, properties in features])
+        else:
+            features = [(MultiPolygon(get_random_area(cell, rng)), {}) for cell in cells]
+
+        if hasattr(model, "data_folder"):
+            filename = path / model.data_folder / f"{model.data_file}.gpkg"
+        else:
+            filename = path / f"{model.data_file}.gpkg"
+        write_geopackage(filename, model.layer, get_ogr_fields(model), features)
+    return units
+
+
+def create_scalars(
+    municipalities: int,
+    template: pathlib.Path,
+    path: pathlib.Path,
+    units: dict[type[Model], pd.DataFrame],
+    rng: np.random.Generator,
+) -> None:
+    """
+    Resample per-municipality scalars from template and copy regional scalars.
+
+    Parameters
+    ----------
+    municipalities: int
+        Number of municipalities
+    template: pathlib.Path
+        Scalars folder of template datapackage
+    path: pathlib.Path
+        Scalars folder of synthetic datapackage
+    units: dict[type[Model], pd.DataFrame]
+        Generated cluster units per model
+    rng: np.random.Generator
+        Random number generator
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    for filename in template.iterdir():
+        if filename.is_dir():
+            shutil.copytree(filename, path / filename.name, dirs_exist_ok=True)
+        elif filename.name == POPULATION_FILE:
+            population = pd.read_csv(filename, header=[0, 1], index_col=0)
+            resample(population, municipalities, rng).round().to_csv(path / filename.name)
+        elif filename.suffix == ".csv" and pd.read_csv(filename, nrows=0).columns[0] == MUNICIPALITY_COLUMN:
+            scalars = resample(pd.read_csv(filename, index_col=0), municipalities, rng)
+            technology = filename.name.removeprefix("bnetza_mastr_").removesuffix("_stats_muns.csv")
+            if technology in MASTR_STATS_MODELS:
+                scalars = aggregate_units(scalars, units[MASTR_STATS_MODELS[technology]])
+            scalars.to_csv(path / filename.name)
+        else:
+            shutil.copy(filename, path / filename.name)
+
+
+def resample(data: pd.DataFrame, municipalities: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Draw rows for given number of municipalities from template rows and scale numeric values randomly."""
+    sample = data.iloc[rng.integers(0, len(data), municipalities)].reset_index(drop=True)
+    sample.index.name = MUNICIPALITY_COLUMN
+    numeric = sample.select_dtypes("number").columns
+    sample[numeric] = sample[numeric].mul(rng.uniform(0.5, 1.5, municipalities), axis=0)
+    return sample
+
+
+def aggregate_units(scalars: pd.DataFrame, units: pd.DataFrame) -> pd.DataFrame:
+    """Overwrite capacities and unit counts in MaStR stats by aggregated values from generated units."""
+    aggregated = units.groupby(MUNICIPALITY_COLUMN).sum(numeric_only=True).reindex(scalars.index, fill_value=0)
+    for column in ("capacity_net", "capacity_gross", "unit_count"):
+        if column in scalars.columns:
+            scalars[column] = aggregated[column]
+    if "count" in scalars.columns:
+        scalars["count"] = aggregated["unit_count"]
+    return scalars
+
+
+def get_municipality_properties(municipality_id: int, cell: tuple[float, float, float, float]) -> dict:
+    """Return properties of municipality including its area in km²."""
+    xmin, ymin, xmax, ymax = cell
+    area = (xmax - xmin) * KM_PER_DEGREE_LON * math.cos(math.radians((ymin + ymax) / 2)) * (ymax - ymin)
+    return {"id": municipality_id, "name": f"Gemeinde {municipality_id}", "area_km2": area * KM_PER_DEGREE_LAT}
+
+
+def get_random_point(cell: tuple[float, float, float, float], rng: np.random.Generator) -> Point:
+    """Return random point within given cell."""
+    xmin, ymin, xmax, ymax = cell
+    return Point(rng.uniform(xmin, xmax), rng.uniform(ymin, ymax))
+
+
+def get_random_area(cell: tuple[float, float, float, float], rng: np.random.Generator) -> Polygon:
+    """Return random rectangle covering a quarter of given cell."""
+    xmin, ymin, xmax, ymax = cell
+    width, height = (xmax - xmin) / 2, (ymax - ymin) / 2
+    x, y = rng.uniform(xmin, xmin + width), rng.uniform(ymin, ymin + height)
+    return Polygon.from_bbox((x, y, x + width, y + height))
+
+
+def get_random_properties(model: type[Model], rng: np.random.Generator) -> dict:
+    """Return random value for each (non geometry and non related) field in model mapping."""
+    properties = {}
+    for field_name, ogr_name in model.mapping.items():
+        field = model._meta.get_field(field_name)  # noqa: SLF001
+        if isinstance(field, (GeometryField, django_models.ForeignKey)):
+            continue
+        if isinstance(field, django_models.BooleanField):
+            properties[ogr_name] = bool(rng.integers(0, 2))
+        elif isinstance(field, django_models.IntegerField):
+            properties[ogr_name] = int(rng.integers(1, 5))
+        elif isinstance(field, django_models.FloatField):
+            properties[ogr_name] = float(rng.uniform(1, 5000))
+        else:
+            properties[ogr_name] = f"{field_name} {rng.integers(1, 5)}"
+    return properties
+
+
+def get_ogr_fields(model: type[Model]) -> dict[str, str]:
+    """Return geopackage column type per field in model mapping."""
+    fields = {}
+    for field_name, ogr_name in model.mapping.items():
+        field = model._meta.get_field(field_name)  # noqa: SLF001
+        if isinstance(field, GeometryField):
+            continue
+        if isinstance(field, django_models.ForeignKey):
+            fields.update({related_name: "INTEGER" for related_name in ogr_name.values()})
+        elif isinstance(field, django_models.BooleanField):
+            fields[ogr_name] = "BOOLEAN"
+        elif isinstance(field, (django_models.IntegerField, django_models.AutoField)):
+            fields[ogr_name] = "INTEGER"
+        elif isinstance(field, django_models.FloatField):
+            fields[ogr_name] = "REAL"
+        else:
+            fields[ogr_name] = "TEXT"
+    return fields
+
+
+def write_geopackage(
+    filename: pathlib.Path,
+    layer: str,
+    fields: dict[str, str],
+    features: list[tuple[GEOSGeometry, dict]],
+) -> None:
+    """
+    Write features into a single-layer geopackage.
+
+    Geopackage is written via sqlite directly (see http://www.geopackage.org/spec/), as no OGR writer is available.
+
+    Parameters
+    ----------
+    filename: pathlib.Path
+        Geopackage file, is overwritten if existing
+    layer: str
+        Name of layer
+    fields: dict[str, str]
+        Column type per property name
+    features: list[tuple[GEOSGeometry, dict]]
+        Geometry and properties per feature
+    """
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    filename.unlink(missing_ok=True)
+    geometry_type = "GEOMETRY"
+    extent = (None, None, None, None)
+    if features:
+        geometry_type = features[0][0].geom_type.upper()
+        extents = np.array([geom.extent for geom, _ in features])
+        extent = (*extents[:, :2].min(axis=0), *extents[:, 2:].max(axis=0))
+
+    connection = sqlite3.connect(filename)
+    with connection:
+        connection.execute("PRAGMA application_id = 1196444487")  # "GPKG"
+        connection.execute("PRAGMA user_version = 10200")
+        connection.executescript(
+            """
+            CREATE TABLE gpkg_spatial_ref_sys (
+                srs_name TEXT NOT NULL, srs_id INTEGER NOT NULL PRIMARY KEY, organization TEXT NOT NULL,
+                organization_coordsys_id INTEGER NOT NULL, definition TEXT NOT NULL, description TEXT
+            );
+            CREATE TABLE gpkg_contents (
+                table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL, identifier TEXT UNIQUE,
+                description TEXT DEFAULT '',
+                last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+                min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER
+            );
+            CREATE TABLE gpkg_geometry_columns (
+                table_name TEXT NOT NULL, column_name TEXT NOT NULL, geometry_type_name TEXT NOT NULL,
+                srs_id INTEGER NOT NULL, z TINYINT NOT NULL, m TINYINT NOT NULL,
+                CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name)
+            );
+            """,
+        )
+        connection.executemany(
+            "INSERT INTO gpkg_spatial_ref_sys VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                ("Undefined cartesian SRS", -1, "NONE", -1, "undefined", None),
+                ("Undefined geographic SRS", 0, "NONE", 0, "undefined", None),
+                ("WGS 84 geodetic", SRID, "EPSG", SRID, SpatialReference(SRID).wkt, None),
+            ],
+        )
+        connection.execute(
+            "INSERT INTO gpkg_contents (table_name, data_type, identifier, min_x, min_y, max_x, max_y, srs_id) "
+            "VALUES (?, 'features', ?, ?, ?, ?, ?, ?)",
+            (layer, layer, *extent, SRID),
+        )
+        connection.execute(
+            "INSERT INTO gpkg_geometry_columns VALUES (?, 'geom', ?, ?, 0, 0)",
+            (layer, geometry_type, SRID),
+        )
+
+        columns = "".join(f', "{name}" {column_type}' for name, column_type in fields.items())
+        connection.execute(
+            f'CREATE TABLE "{layer}" (fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, geom {geometry_type}{columns})',
+        )
+        placeholders = ", ".join("?" * (len(fields) + 1))
+        names = "".join(f', "{name}"' for name in fields)
+        connection.executemany(
+            f'INSERT INTO "{layer}" (geom{names}) VALUES ({placeholders})',  # noqa: S608
+            [
+                (get_geopackage_geometry(geom), *(properties.get(name) for name in fields))
+                for geom, properties in features
+            ],
+        )
+    connection.close()
+
+
+def get_geopackage_geometry(geom: GEOSGeometry) -> bytes:
+    """Return geometry as geopackage binary (header without envelope followed by WKB)."""
+    return b"GP" + struct.pack("<BBi", 0, 1, SRID) + bytes(geom.wkb)
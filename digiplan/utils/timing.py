@@ -0,0 +1,291 @@
+"""
+Module to attribute wall time of requests to categories like ORM, CSV reading, oemof results and serialization.
+
+Time is measured per request by `ServerTimingMiddleware` and emitted as structured log line and - if
+`settings.SERVER_TIMING` is set - as `Server-Timing` header. Code parts are attributed to a category via `measure` or
+`timed`; nested measurements are exclusive, i.e. time spent in an inner category is not counted for the outer one.
+Time not attributed to any category is counted as "calc".
+
+Additionally, a sampling profiler can be switched on at runtime (see `enable_profiling`); each process reads the
+profiling rate from cache at most once per `PROFILE_RATE_INTERVAL` seconds. For sampled requests, call stacks of the
+request thread are collected periodically and dumped as collapsed stacks (usable by flamegraph.pl or speedscope) into
+`settings.PROFILE_DIR`. Profiling is only available for sync requests, as the event loop thread of async requests is
+shared by all requests.
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import pathlib
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, response
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = {
+    "db": "ORM queries",
+    "csv": "Datapackage CSV",
+    "results": "oemof results",
+    "calc": "Calculations",
+    "json": "Serialization",
+}
+DEFAULT_CATEGORY = "calc"
+PROFILE_RATE_KEY = "timing_profile_rate"
+# Profiling rate is read from cache at most once per interval (in seconds) per process
+PROFILE_RATE_INTERVAL = 10
+
+
+class Timer:
+    """Sums up exclusive wall time per category."""
+
+    def __init__(self) -> None:
+        """Init empty timer."""
+        self.durations = defaultdict(float)
+        self._stack: list[tuple[str, float]] = []
+
+    @contextlib.contextmanager
+    def measure(self, category: str) -> Iterator[None]:
+        """Attribute time of context to given category and pause outer category meanwhile."""
+        start = time.perf_counter()
+        if self._stack:
+            outer, outer_start = self._stack[-1]
+            self.durations[outer] += start - outer_start
+        self._stack.append((category, start))
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            _, start = self._stack.pop()
+            self.durations[category] += end - start
+            if self._stack:
+                self._stack[-1] = (self._stack[-1][0], end)
+
+    def query_wrapper(  # noqa: PLR0913
+        self,
+        execute: Callable,
+        sql: str,
+        params: Any,  # noqa: ANN401
+        many: bool,  # noqa: FBT001
+        context: dict,
+    ) -> Any:  # noqa: ANN401
+        """Database execute wrapper attributing queries to category "db"."""
+        with self.measure("db"):
+            return execute(sql, params, many, context)
+
+    def get_server_timing(self) -> str:
+        """Return durations in milliseconds formatted as `Server-Timing` header."""
+        return ", ".join(
+            f'{category};dur={duration * 1000:.1f};desc="{CATEGORIES.get(category, category)}"'
+            for category, duration in self.durations.items()
+        )
+
+
+_timer: ContextVar[Optional[Timer]] = ContextVar("timer", default=None)
+
+
+def measure(category: str) -> contextlib.AbstractContextManager:
+    """
+    Return context manager attributing its wall time to given category for current request.
+
+    Parameters
+    ----------
+    category: str
+        Category to attribute time to, see `CATEGORIES`
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        Measuring context, or null context if no request is timed currently
+    """
+    timer = _timer.get()
+    if timer is None:
+        return contextlib.nullcontext()
+    return timer.measure(category)
+
+
+def track_queries() -> contextlib.AbstractContextManager:
+    """Return context attributing queries of DB connection of current thread to category "db" of current request."""
+    timer = _timer.get()
+    if timer is None:
+        return contextlib.nullcontext()
+    return connection.execute_wrapper(timer.query_wrapper)
+
+
+def timed(category: str) -> Callable:
+    """Decorate function to attribute its wall time to given category."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:  # noqa: ANN002, ANN401
+            with measure(category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class JsonResponse(response.JsonResponse):
+    """JsonResponse attributing serialization to category "json"."""
+
+    def __init__(self, data: Any, *args, **kwargs) -> None:  # noqa: ANN401, ANN002
+        """Serialize data within timing category."""
+        with measure("json"):
+            super().__init__(data, *args, **kwargs)
+
+
+class StackSampler:
+    """Collect call stacks of given thread periodically in a background thread."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        """Init sampler for thread."""
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self) -> "StackSampler":
+        """Start sampling."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:  # noqa: ANN002
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # noqa: SLF001
+            stack = []
+            while frame is not None:
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def dump(self, filename: pathlib.Path) -> None:
+        """Write collapsed stacks to file."""
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        with filename.open("w", encoding="utf-8") as profile_file:
+            profile_file.writelines(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def enable_profiling(rate: float = 1.0) -> None:
+    """
+    Switch on sampling profiler for all workers.
+
+    Parameters
+    ----------
+    rate: float
+        Share of requests (0-1) to be profiled
+    """
+    cache.set(PROFILE_RATE_KEY, rate, timeout=None)
+    _profile_rate.clear()
+
+
+def disable_profiling() -> None:
+    """Switch off sampling profiler for all workers."""
+    cache.delete(PROFILE_RATE_KEY)
+    _profile_rate.clear()
+
+
+# Profiling rate and time of last read from cache in current process
+_profile_rate: dict[str, Optional[float]] = {}
+
+
+def get_profile_rate() -> Optional[float]:
+    """Return share of requests to be profiled, refreshed from cache at most once per `PROFILE_RATE_INTERVAL`."""
+    now = time.monotonic()
+    if now - _profile_rate.get("read", -PROFILE_RATE_INTERVAL) >= PROFILE_RATE_INTERVAL:
+        _profile_rate.update(rate=cache.get(PROFILE_RATE_KEY), read=now)
+    return _profile_rate["rate"]
+
+
+def get_sampler() -> Optional[StackSampler]:
+    """Return stack sampler for current thread if request shall be profiled."""
+    rate = get_profile_rate()
+    if not rate or random.random() >= rate:  # noqa: S311
+        return None
+    return StackSampler(threading.get_ident(), settings.PROFILE_INTERVAL)
+
+
+class ServerTimingMiddleware:
+    """Measure wall time per category for each request and emit it as log line and (optionally) as header."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        """Init middleware."""
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Mark middleware as coroutine function, so that Django awaits it
+            self._is_coroutine = asyncio.coroutines._is_coroutine  # noqa: SLF001
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Time request and log timings."""
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        timer = Timer()
+        token = _timer.set(timer)
+        sampler = get_sampler()
+        profiling = sampler or contextlib.nullcontext()
+        start = time.perf_counter()
+        try:
+            with track_queries(), profiling, timer.measure(DEFAULT_CATEGORY):
+                http_response = self.get_response(request)
+        finally:
+            _timer.reset(token)
+        self.finish(request, http_response, timer, time.perf_counter() - start)
+        if sampler:
+            filename = f"{time.strftime('%Y%m%d-%H%M%S')}_{request.path.strip('/').replace('/', '_') or 'index'}.txt"
+            sampler.dump(pathlib.Path(settings.PROFILE_DIR) / filename)
+        return http_response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Time async request; queries are timed within executor threads (see `digiplan.utils.executor`)."""
+        timer = Timer()
+        token = _timer.set(timer)
+        start = time.perf_counter()
+        try:
+            with timer.measure(DEFAULT_CATEGORY):
+                http_response = await self.get_response(request)
+        finally:
+            _timer.reset(token)
+        self.finish(request, http_response, timer, time.perf_counter() - start)
+        return http_response
+
+    @staticmethod
+    def finish(request: HttpRequest, http_response: HttpResponse, timer: Timer, total: float) -> None:
+        """Log timings and add them as `Server-Timing` header to response, if enabled."""
+        if settings.SERVER_TIMING:
+            http_response["Server-Timing"] = ", ".join(
+                filter(None, [timer.get_server_timing(), f'total;dur={total * 1000:.1f};desc="Total"']),
+            )
+        timings = {category: round(duration * 1000, 1) for category, duration in timer.durations.items()}
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": http_response.status_code,
+                    "total_ms": round(total * 1000, 1),
+                    "timings_ms": timings,
+                },
+            ),
+        )
@@ -0,0 +1,92 @@
+"""Benchmarks for calculations."""
+
+import inspect
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from django_oemof.models import Simulation
+
+from digiplan.map import calculations
+
+from .conftest import PARAMETERS
+
+pytestmark = pytest.mark.django_db
+
+# Hourly arrays for one year, used for calculations which are fed with timeseries instead of reading them
+HOURS = 8760
+HOURLY_RENEWABLES = np.linspace(0, 2, HOURS)
+HOURLY_DEMAND = np.ones(HOURS)
+
+# Functions without simulation results; functions expecting data are fed by related calculation
+STATUSQUO_CALCULATIONS: dict[str, Callable] = {
+    "calculate_square_for_value": lambda: calculations.calculate_square_for_value(
+        calculations.capacities_per_municipality(),
+    ),
+    "value_per_municipality": lambda: calculations.value_per_municipality(calculations.energy_shares_region()),
+    "calculate_capita_for_value": lambda: calculations.calculate_capita_for_value(
+        calculations.energies_per_municipality(),
+    ),
+    "employment_per_municipality": calculations.employment_per_municipality,
+    "companies_per_municipality": calculations.companies_per_municipality,
+    "batteries_per_municipality": calculations.batteries_per_municipality,
+    "battery_capacities_per_municipality": calculations.battery_capacities_per_municipality,
+    "capacities_per_municipality": calculations.capacities_per_municipality,
+    "energies_per_municipality": calculations.energies_per_municipality,
+    "energy_shares_per_municipality": calculations.energy_shares_per_municipality,
+    "energy_shares_region": calculations.energy_shares_region,
+    "electricity_demand_per_municipality": calculations.electricity_demand_per_municipality,
+    "heat_demand_per_municipality": calculations.heat_demand_per_municipality,
+    "calculate_potential_shares": lambda: calculations.calculate_potential_shares(PARAMETERS),
+    "electricity_overview": lambda: calculations.electricity_overview(2045),
+    "get_heat_production": lambda: calculations.get_heat_production("decentral", 2045),
+    "get_autarky": lambda: calculations.get_autarky(HOURLY_RENEWABLES, HOURLY_DEMAND),
+    "get_regional_independency_2022": calculations.get_regional_independency_2022,
+    "heat_overview_statusquo": lambda: calculations.heat_overview_statusquo("decentral"),
+}
+
+# Functions depending on simulation results, called with simulation ID
+SIMULATION_CALCULATIONS: dict[str, Callable[[int], object]] = {
+    "capacities_per_municipality_2045": calculations.capacities_per_municipality_2045,
+    "energies_per_municipality_2045": calculations.energies_per_municipality_2045,
+    "energy_shares_2045_per_municipality": calculations.energy_shares_2045_per_municipality,
+    "energy_shares_2045_region": calculations.energy_shares_2045_region,
+    "electricity_demand_per_municipality_2045": calculations.electricity_demand_per_municipality_2045,
+    "heat_demand_per_municipality_2045": calculations.heat_demand_per_municipality_2045,
+    "ghg_reduction": calculations.ghg_reduction,
+    "electricity_from_from_biomass": calculations.electricity_from_from_biomass,
+    "wind_turbines_per_municipality_2045": calculations.wind_turbines_per_municipality_2045,
+    "electricity_heat_demand": calculations.electricity_heat_demand,
+    "electricity_overview_from_user": calculations.electricity_overview_from_user,
+    "renewable_electricity_production": calculations.renewable_electricity_production,
+    "get_regional_independency": calculations.get_regional_independency,
+    "get_reduction": calculations.get_reduction,
+    "heat_overview": lambda simulation_id: calculations.heat_overview(simulation_id, "decentral"),
+}
+
+
+def test_all_calculations_are_benchmarked() -> None:
+    """Make sure that newly added public calculations are added to benchmarks."""
+    public_functions = {
+        name
+        for name, function in inspect.getmembers(calculations, inspect.isfunction)
+        if not name.startswith("_") and function.__module__ == calculations.__name__
+    }
+    assert public_functions == set(STATUSQUO_CALCULATIONS) | set(SIMULATION_CALCULATIONS)
+
+
+@pytest.mark.parametrize("name", STATUSQUO_CALCULATIONS)
+def test_statusquo_calculation(run_uncached, name: str) -> None:  # noqa: ANN001
+    """Benchmark calculations without simulation results."""
+    run_uncached(STATUSQUO_CALCULATIONS[name])
+
+
+@pytest.mark.parametrize("name", SIMULATION_CALCULATIONS)
+def test_simulation_calculation(run_uncached, simulation_id: int, name: str) -> None:  # noqa: ANN001
+    """Benchmark calculations based on simulation results."""
+    run_uncached(SIMULATION_CALCULATIONS[name], simulation_id)
+
+
+def test_simulation_parameters(simulation_id: int) -> None:
+    """Make sure fixed simulation is used, otherwise results are not comparable."""
+    assert Simulation.objects.get(pk=simulation_id).parameters == PARAMETERS
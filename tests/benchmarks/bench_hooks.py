@@ -0,0 +1,37 @@
+"""Benchmarks for django-oemof parameter hooks."""
+
+import copy
+
+import pytest
+
+from digiplan.map import hooks
+
+from .conftest import PARAMETERS, ROUNDS, SCENARIO
+
+pytestmark = pytest.mark.django_db
+
+# Same order as registered in `digiplan.map.apps.MapConfig.ready`
+PARAMETER_HOOKS = [hooks.adapt_electricity_demand, hooks.adapt_heat_settings, hooks.adapt_renewable_capacities]
+
+
+def run_pipeline(data: dict) -> dict:
+    """Run all parameter hooks on given parameters."""
+    for hook in PARAMETER_HOOKS:
+        data = hook(SCENARIO, data, None)
+    return data
+
+
+def setup_parameters() -> tuple[tuple, dict]:
+    """Return fresh copy of parameters for each round, as hooks alter given parameters."""
+    return (copy.deepcopy(PARAMETERS),), {}
+
+
+@pytest.mark.parametrize("hook", PARAMETER_HOOKS, ids=lambda hook: hook.__name__)
+def test_parameter_hook(benchmark, hook) -> None:  # noqa: ANN001
+    """Benchmark single parameter hooks."""
+    benchmark.pedantic(lambda data: hook(SCENARIO, data, None), setup=setup_parameters, rounds=ROUNDS)
+
+
+def test_parameter_pipeline(benchmark) -> None:  # noqa: ANN001
+    """Benchmark parameter hooks pipeline as applied by django-oemof."""
+    benchmark.pedantic(run_pipeline, setup=setup_parameters, rounds=ROUNDS)
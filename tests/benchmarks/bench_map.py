@@ -0,0 +1,86 @@
+"""Benchmarks for choropleths, popups, charts and tiles as served by map views."""
+
+import pytest
+from django.db import connection
+
+from digiplan.map import charts, choropleths, models, popups, tiles
+from digiplan.map.managers import MVTManager
+from digiplan.utils import data_processing
+
+pytestmark = pytest.mark.django_db
+
+REGION_POPUPS = [lookup for lookup, popup in popups.POPUPS.items() if popup is not popups.ClusterPopup]
+
+MVT_LAYERS = {
+    "municipality": models.Municipality.vector_tiles,
+    "municipalitylabel": models.Municipality.label_tiles,
+    **{
+        model.__name__.lower(): model.vector_tiles for model in data_processing.MODELS if hasattr(model, "vector_tiles")
+    },
+}
+
+# Broken charts are benchmarked nevertheless, to notice when they are fixed
+BROKEN_CHARTS = {"detailed_overview": "DetailedOverviewChart calls electricity_overview() with simulation ID"}
+
+
+def get_chart_params() -> list:
+    """Return chart lookups, broken charts are marked as expected failures."""
+    return [
+        pytest.param(lookup, marks=pytest.mark.xfail(reason=BROKEN_CHARTS[lookup], strict=True))
+        if lookup in BROKEN_CHARTS
+        else lookup
+        for lookup in charts.CHARTS
+    ]
+
+
+def render_tile(manager: MVTManager, x: int, y: int, z: int) -> bytes:
+    """Render MVT via postgres from MVT query of given manager."""
+    query = manager.get_mvt_query(x, y, z)
+    columns = ", ".join(manager.get_columns())
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT ST_AsMVT(tile, 'layer', 4096, 'mvt_geom') "  # noqa: S608
+            f"FROM (SELECT {columns}, mvt_geom FROM ({query}) AS q) AS tile",
+        )
+        return bytes(cursor.fetchone()[0])
+
+
+@pytest.fixture(scope="module")
+def municipality_id(django_db_blocker) -> int:  # noqa: ANN001
+    """Return ID of first municipality."""
+    with django_db_blocker.unblock():
+        return models.Municipality.objects.order_by("pk").values_list("pk", flat=True).first()
+
+
+@pytest.mark.parametrize("lookup", choropleths.CHOROPLETHS)
+def test_choropleth(run_uncached, simulation_id: int, lookup: str) -> None:  # noqa: ANN001
+    """Benchmark choropleths."""
+    choropleth = choropleths.CHOROPLETHS[lookup]
+    run_uncached(lambda: choropleth(lookup, {"simulation_id": simulation_id}).render())
+
+
+@pytest.mark.parametrize("lookup", REGION_POPUPS)
+def test_region_popup(run_uncached, simulation_id: int, municipality_id: int, lookup: str) -> None:  # noqa: ANN001
+    """Benchmark region popups for first municipality."""
+    popup = popups.POPUPS[lookup]
+    run_uncached(lambda: popup(lookup, municipality_id, map_state={"simulation_id": simulation_id}).render())
+
+
+@pytest.mark.parametrize("lookup", popups.CLUSTER_MODELS)
+def test_cluster_popup(run_uncached, lookup: str) -> None:  # noqa: ANN001
+    """Benchmark cluster popups for first unit of each cluster model."""
+    unit_id = popups.CLUSTER_MODELS[lookup].objects.order_by("pk").values_list("pk", flat=True).first()
+    run_uncached(lambda: popups.POPUPS[lookup](lookup, unit_id).render())
+
+
+@pytest.mark.parametrize("lookup", get_chart_params())
+def test_chart(run_uncached, simulation_id: int, lookup: str) -> None:  # noqa: ANN001
+    """Benchmark charts."""
+    chart = charts.CHARTS[lookup]
+    run_uncached(lambda: chart(simulation_id=simulation_id).render())
+
+
+@pytest.mark.parametrize("layer", MVT_LAYERS)
+def test_tile(benchmark, layer: str) -> None:  # noqa: ANN001
+    """Benchmark MVT of startup tile."""
+    benchmark(render_tile, MVT_LAYERS[layer], *tiles.get_startup_tile())
@@ -0,0 +1,55 @@
+"""
+Fixtures for benchmark suite.
+
+Benchmarks run against the datapackage configured in `DIGIPIPE_DIR` and a simulation for fixed parameters.
+Instead of an empty test database, the configured database holding loaded data is used.
+To measure how benchmarks scale with number of municipalities, run them against synthetic datapackages
+(see `digiplan.utils.synthetic_data`).
+Caches are cleared before each round, so that measured times cover the full calculation and not a cache hit.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django_oemof import simulation
+
+from digiplan.map import models
+from tests.test_calculations import SimulationTest
+
+SCENARIO = settings.OEMOF_SCENARIO
+PARAMETERS = SimulationTest.parameters
+ROUNDS = 5
+
+
+def pytest_benchmark_update_machine_info(config, machine_info: dict) -> None:  # noqa: ARG001, ANN001
+    """Store used datapackage and scenario, as benchmarks are only comparable for same data."""
+    machine_info["digipipe_dir"] = str(settings.DIGIPIPE_DIR)
+    machine_info["scenario"] = SCENARIO
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_blocker) -> None:  # noqa: ANN001, PT004
+    """Use configured database with loaded data instead of creating an empty test database."""
+    with django_db_blocker.unblock():
+        assert models.Municipality.objects.exists(), "No municipalities found, load regions before running benchmarks"
+        assert models.WindTurbine.objects.exists(), "No cluster data found, load data before running benchmarks"
+
+
+@pytest.fixture(scope="session")
+def simulation_id(django_db_setup, django_db_blocker) -> int:  # noqa: ANN001, ARG001
+    """Start/load oemof simulation for fixed parameters once per session."""
+    with django_db_blocker.unblock():
+        return simulation.simulate_scenario(SCENARIO, PARAMETERS)
+
+
+@pytest.fixture()
+def run_uncached(benchmark) -> Callable:  # noqa: ANN001
+    """Return function to benchmark given function with cleared cache in every round."""
+
+    def run(func: Callable, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return benchmark.pedantic(func, args=args, kwargs=kwargs, setup=cache.clear, rounds=ROUNDS)
+
+    return run
@@ -0,0 +1,43 @@
+"""Module to test aggregation within user-drawn polygons."""
+
+import json
+
+import pytest
+from django.urls import reverse
+
+from digiplan.map import analysis
+
+SQUARE = {"type": "Polygon", "coordinates": [[[12.0, 51.0], [12.1, 51.0], [12.1, 51.1], [12.0, 51.1], [12.0, 51.0]]]}
+BOWTIE = {"type": "Polygon", "coordinates": [[[12.0, 51.0], [12.1, 51.1], [12.1, 51.0], [12.0, 51.1], [12.0, 51.0]]]}
+
+
+def test_polygon_hash_ignores_formatting():
+    """Test that equal polygons result in same hash, regardless of their GeoJSON formatting."""
+    polygon = analysis.parse_polygon(json.dumps(SQUARE))
+    assert polygon.srid == 4326
+    assert analysis.get_polygon_hash(polygon) == analysis.get_polygon_hash(
+        analysis.parse_polygon(json.dumps(SQUARE, indent=2)),
+    )
+
+
+@pytest.mark.parametrize(
+    "geojson",
+    [
+        "",
+        "no geojson",
+        json.dumps({"type": "Point", "coordinates": [12.0, 51.0]}),
+        json.dumps(BOWTIE),
+    ],
+)
+def test_invalid_polygons_are_rejected(geojson):  # noqa: ANN001
+    """Test that missing, non-polygon and self-intersecting geometries are rejected."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        analysis.parse_polygon(geojson)
+
+
+@pytest.mark.django_db()
+def test_analysis_expects_polygon_in_post_body(client):  # noqa: ANN001
+    """Test that polygon is only accepted via POST and invalid polygons are rejected."""
+    url = reverse("map:analysis")
+    assert client.get(url, {"polygon": json.dumps(SQUARE)}).status_code == 405
+    assert client.post(url, {"polygon": json.dumps(BOWTIE)}).status_code == 400
@@ -0,0 +1,69 @@
+"""Module to test caching helpers."""
+
+import pytest
+from django.core.cache import cache
+from django.utils import translation
+
+from digiplan.map import caching, models
+
+
+@pytest.mark.django_db()
+def test_key_changes_with_data_version():
+    """Test that cache keys are invalidated if loaded data changes."""
+    cache.delete(caching.DATA_VERSION_KEY)
+    initial_key = caching.get_key("popup", "CapacityPopup", None, 1)
+    assert caching.INITIAL_DATA_VERSION in initial_key
+    assert not models.DataVersion.objects.exists()
+
+    caching.bump_data_version()
+    key = caching.get_key("popup", "CapacityPopup", None, 1)
+    assert "None" not in key
+    assert key != initial_key
+    caching.bump_data_version()
+    assert caching.get_key("popup", "CapacityPopup", None, 1) == key
+    assert models.DataVersion.objects.count() == 1
+
+    models.Region.objects.create(layer_type=models.Region.LayerType.MUNICIPALITY)
+    caching.bump_data_version()
+    assert caching.get_key("popup", "CapacityPopup", None, 1) != key
+    assert models.DataVersion.objects.count() == 2
+
+
+def test_file_hash_depends_on_content(tmp_path):  # noqa: ANN001
+    """Test that file hash changes with content of all files, including geodata in subfolder."""
+    (tmp_path / "geodata").mkdir()
+    (tmp_path / "scalars.csv").write_text("a,b\n1,2\n")
+    file_hash = caching.get_file_hash(tmp_path)
+
+    assert caching.get_file_hash(tmp_path) == file_hash
+    (tmp_path / "geodata" / "regions.gpkg").write_text("geodata")
+    geodata_hash = caching.get_file_hash(tmp_path)
+    assert geodata_hash != file_hash
+    (tmp_path / "scalars.csv").write_text("a,b\n1,3\n")
+    assert caching.get_file_hash(tmp_path) not in (file_hash, geodata_hash)
+
+
+@pytest.mark.django_db()
+def test_etag_depends_on_parts_and_language():
+    """Test that ETags differ for simulations and languages."""
+    etag = caching.get_etag("choropleth", "energy_2045", "municipality", 1)
+    assert etag == caching.get_etag("choropleth", "energy_2045", "municipality", 1)
+    assert etag != caching.get_etag("choropleth", "energy_2045", "municipality", 2)
+    with translation.override("en"):
+        assert etag != caching.get_etag("choropleth", "energy_2045", "municipality", 1)
+
+
+@pytest.mark.django_db()
+def test_cached_function_is_called_once_per_arguments():
+    """Test that results of data based functions are cached per arguments."""
+    calls = []
+
+    @caching.cached
+    def overview(year: int, distribution: str = "central") -> list:
+        calls.append((year, distribution))
+        return [year, distribution]
+
+    assert overview(2022) == [2022, "central"]
+    assert overview(2022) == [2022, "central"]
+    assert overview(2022, distribution="decentral") == [2022, "decentral"]
+    assert calls == [(2022, "central"), (2022, "decentral")]
@@ -1,6 +1,7 @@
 """Module to test oemof simulation results."""
 import os
 
+import numpy as np
 import pandas as pd
 from django.test import SimpleTestCase
 from django_oemof import models
@@ -10,6 +11,7 @@ from oemof.tabular.postprocessing import calculations as oc
 from oemof.tabular.postprocessing import core
 
 from digiplan.map import calculations, charts
+from digiplan.map.models import Municipality
 
 
 class SimulationTest(SimpleTestCase):
@@ -240,7 +242,9 @@ class MunicipalityTest(SimpleTestCase):
     def test_square(self):
         """Test."""
         series = pd.Series([1, 2, 3], index=["a", "b", "c"])
-        calculations.value_per_municipality(series)
+        result = calculations.value_per_municipality(series)
+        assert len(result) == Municipality.objects.count()
+        assert list(result.columns) == ["a", "b", "c"]
 
 
 class HeatStructureTest(SimulationTest):
@@ -277,3 +281,13 @@ class CapacityTest(SimulationTest):
         """Test capacity reading from oemof results."""
         results = oemof_results.get_results(self.simulation_id, {"capacities": calculations.Capacities})
         assert results["capacities"].loc["ABW-wind-onshore", "None"] == 1000.0
+
+
+class AutarkyTest(SimpleTestCase):
+    """Test vectorized autarky calculation."""
+
+    def test_autarky(self):
+        """Test share of renewables in demand and share of hours with surplus."""
+        renewables = np.array([0.0, 2.0, 3.0, 1.0])
+        demand = np.array([1.0, 1.0, 1.0, 1.0])
+        assert calculations.get_autarky(renewables, demand) == (150.0, 50.0)
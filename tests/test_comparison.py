@@ -0,0 +1,23 @@
+"""Module to test comparison of simulations."""
+
+import pandas as pd
+
+from digiplan.map import comparison
+
+
+def test_flatten_results():
+    """Test that results of different shape are flattened into series."""
+    frame = pd.DataFrame({"wind": [1.0, 2.0], "pv": [3.0, 4.0]}, index=[0, 1])
+    assert comparison.flatten(frame)[(1, "pv")] == 4.0
+    assert comparison.flatten({"2045": {"hh": 1.0, "cts": 2.0}})["2045.cts"] == 2.0
+    assert comparison.flatten((10.5, 20.5)).tolist() == [10.5, 20.5]
+    assert comparison.flatten(3.0).tolist() == [3.0]
+
+
+def test_tables_are_aligned():
+    """Test that values of simulations are aligned by labels and missing values are returned as None."""
+    table = pd.concat({1: pd.Series({"wind": 1.0, "pv": 2.0}), 2: pd.Series({"wind": 3.0})}, axis=1)
+    data = comparison.to_json(table)
+    assert data["columns"] == [1, 2]
+    assert data["index"] == ["wind", "pv"]
+    assert data["data"] == [[1.0, 3.0], [2.0, None]]
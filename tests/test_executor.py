@@ -0,0 +1,40 @@
+"""Module to test async views running in bounded executor."""
+
+import asyncio
+import threading
+import time
+
+from django.test import RequestFactory
+
+from digiplan.utils import executor, timing
+
+
+def view(request):  # noqa: ANN001, ARG001
+    """Return thread name of blocking view."""
+    with timing.measure("csv"):
+        time.sleep(0.01)
+    return timing.JsonResponse({"thread": threading.current_thread().name})
+
+
+def test_async_view_runs_in_executor(settings):  # noqa: ANN001
+    """Test that async view is run within executor thread and timing is kept across threads."""
+    settings.SERVER_TIMING = True
+    async_view = executor.async_view(view)
+    assert asyncio.iscoroutinefunction(async_view)
+
+    middleware = timing.ServerTimingMiddleware(async_view)
+    assert asyncio.iscoroutinefunction(middleware)
+    response = asyncio.run(middleware(RequestFactory().get("/charts")))
+    assert b"digiplan" in response.content
+    assert "csv;dur=" in response["Server-Timing"]
+
+
+def test_concurrent_requests_share_event_loop():
+    """Test that blocking views do not block event loop for other requests."""
+
+    async def run_requests() -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(executor.run(time.sleep, 0.1) for _ in range(2)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(run_requests()) < 0.2
@@ -0,0 +1,50 @@
+"""Module to test streaming export."""
+
+import csv
+import io
+
+import openpyxl
+import pytest
+from django.urls import reverse
+
+from digiplan.map import export, models
+
+ROWS = [
+    ("capacities", 1, None, "wind", 10.0),
+    ("capacities", 2, None, "wind", 20.0),
+    ("renewables", None, "2045-01-01T00:00:00", "ABW-wind-onshore", 1.5),
+]
+
+
+def test_csv_is_streamed_in_batches(monkeypatch):  # noqa: ANN001
+    """Test that CSV header and rows are streamed in batches."""
+    monkeypatch.setattr(export, "BATCH_SIZE", 2)
+    chunks = list(export.to_csv(iter(ROWS)))
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert rows[0] == export.COLUMNS
+    assert rows[3] == ["renewables", "", "2045-01-01T00:00:00", "ABW-wind-onshore", "1.5"]
+
+
+def test_xlsx_export():
+    """Test that XLSX holds header and all rows."""
+    content = b"".join(export.to_xlsx(iter(ROWS)))
+    sheet = openpyxl.load_workbook(io.BytesIO(content))["export"]
+    rows = list(sheet.iter_rows(values_only=True))
+    assert list(rows[0]) == export.COLUMNS
+    assert rows[1] == ROWS[0]
+
+
+def test_spool_keeps_content():
+    """Test that spooled content equals streamed content."""
+    chunks = [b"a" * export.CHUNK_SIZE, b"b"]
+    assert b"".join(export.spool(chunks)) == b"".join(chunks)
+
+
+@pytest.mark.django_db()
+def test_sequences_of_compacted_simulation_are_gone(client, monkeypatch):  # noqa: ANN001
+    """Test that export of sequences of compacted simulation is refused before streaming starts."""
+    monkeypatch.setattr(models.SimulationUsage, "is_compacted", lambda simulation_id: simulation_id == 1)
+    response = client.get(reverse("map:export"), {"simulation_id": 1, "sequences[]": ["renewables"]})
+    assert response.status_code == 410
+    assert not response.streaming
@@ -0,0 +1,67 @@
+"""Module to test declarative indicator registry."""
+
+import pandas as pd
+import pytest
+
+from digiplan.map import choropleths, indicators
+
+
+@pytest.fixture()
+def indicator(monkeypatch):  # noqa: ANN001
+    """Register indicator with two municipalities and fixed areas and population."""
+    statusquo = pd.DataFrame({"wind": [1.0, 3.0], "pv": [2.0, 2.0]}, index=[1, 2])
+    indicator = indicators.Indicator(
+        "test_energy",
+        statusquo=lambda: statusquo,
+        future=lambda simulation_id: statusquo * 1e3 * simulation_id,
+        future_factor=1e-3,
+        variants={"absolute": 1.0, "capita": 1e3, "square": 1.0},
+    )
+    monkeypatch.setitem(indicators.INDICATORS, indicator.name, indicator)
+    monkeypatch.setattr(indicators, "get_areas", lambda: pd.Series({1: 2.0, 2: 4.0}))
+    monkeypatch.setattr(indicators, "get_population", lambda: pd.Series({1: 1000.0, 2: 3000.0}))
+    return indicator
+
+
+def test_lookups_cover_existing_choropleths():
+    """Test that each declared variant results in a choropleth."""
+    lookups = [lookup for lookup, *_ in indicators.iter_lookups()]
+    assert len(lookups) == len(set(lookups))
+    assert "energy_capita_2045" in lookups
+    assert "population_density_statusquo" in lookups
+    assert set(lookups) == set(choropleths.CHOROPLETHS)
+
+
+@pytest.mark.django_db()
+def test_variants_are_derived_from_base(indicator):  # noqa: ANN001
+    """Test that variants and region values are derived from base frame."""
+    name = indicator.name
+    pd.testing.assert_frame_equal(
+        indicators.get_values(name, "square"),
+        pd.DataFrame({"wind": [0.5, 0.75], "pv": [1.0, 0.5]}, index=[1, 2]),
+    )
+    pd.testing.assert_series_equal(
+        indicators.get_values(name, "capita")["wind"],
+        pd.Series({1: 1.0, 2: 1.0}, name="wind"),
+    )
+    pd.testing.assert_series_equal(
+        indicators.get_region_values(name, "square"),
+        pd.Series({"wind": 4 / 6, "pv": 4 / 6}),
+    )
+    assert indicators.get_region_total(name, "capita") == pytest.approx(2.0)
+
+
+@pytest.mark.django_db()
+def test_future_values_are_converted(indicator):  # noqa: ANN001
+    """Test that 2045 values are converted into unit of status quo values."""
+    pd.testing.assert_frame_equal(
+        indicators.get_values(indicator.name, scenario="2045", simulation_id=2),
+        indicators.get_values(indicator.name) * 2,
+    )
+
+
+def test_round_values():
+    """Test that single values are rounded to integers if no decimals are requested."""
+    assert indicators.round_values(2.6, 0) == 3
+    assert isinstance(indicators.round_values(2.6, 0), int)
+    assert indicators.round_values(2.345, 1) == 2.3
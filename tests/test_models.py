@@ -0,0 +1,134 @@
+"""Module to test digiplan models."""
+
+import environ
+import pandas as pd
+import pytest
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+
+from digiplan.map import calculations, datapackage, models
+
+
+@pytest.fixture()
+def municipalities():
+    """Create two municipalities."""
+    polygon = MultiPolygon(Polygon.from_bbox((0, 0, 1, 1)))
+    return [
+        models.Municipality.objects.create(id=municipality_id, name=f"Gemeinde {municipality_id}", geom=polygon, area=1)
+        for municipality_id in (1, 2)
+    ]
+
+
+@pytest.mark.django_db()
+def test_renewable_stats_per_municipality(municipalities):  # noqa: ANN001
+    """Test that materialized stats aggregate units per municipality and status after refresh."""
+    for status, unit_count, capacity in (("In Betrieb", 2, 3.0), ("In Planung", 1, 4.0)):
+        models.WindTurbine.objects.create(
+            geom=Point(0.5, 0.5),
+            geometry_approximated=False,
+            unit_count=unit_count,
+            capacity_net=capacity,
+            status=status,
+            mun_id=municipalities[0],
+        )
+    models.Storage.objects.create(
+        geom=Point(0.5, 0.5),
+        geometry_approximated=False,
+        unit_count=5,
+        mun_id=municipalities[1],
+    )
+    models.RenewableStats.refresh()
+
+    pd.testing.assert_series_equal(
+        models.RenewableStats.per_municipality("wind", "unit_count"),
+        pd.Series([3, 0], index=pd.Index([1, 2], name="mun_id"), name="wind"),
+        check_dtype=False,
+    )
+    assert models.RenewableStats.per_municipality("wind", status="In Betrieb").tolist() == [3.0, 0.0]
+    capacities = models.RenewableStats.per_municipality(["wind", "storage"])
+    assert capacities.columns.tolist() == ["wind", "storage"]
+    assert capacities["wind"].tolist() == [7.0, 0.0]
+    assert models.RenewableStats.per_municipality("storage", "unit_count").tolist() == [0, 5]
+
+
+@pytest.mark.django_db()
+def test_capacities_match_mastr_stats(municipalities, settings, tmp_path):  # noqa: ANN001
+    """Test that capacities from stats equal MaStR stats of datapackage (units in operation only, in MW)."""
+    for model, municipality, status, capacity in (
+        (models.WindTurbine, municipalities[0], "In Betrieb", 3000.0),
+        (models.WindTurbine, municipalities[0], "In Planung", 4000.0),
+        (models.PVground, municipalities[1], "In Betrieb", 1500.0),
+    ):
+        model.objects.create(
+            geom=Point(0.5, 0.5),
+            geometry_approximated=False,
+            unit_count=1,
+            capacity_net=capacity,
+            status=status,
+            mun_id=municipality,
+        )
+    models.RenewableStats.refresh()
+
+    mastr_stats = {
+        "wind": [3.0, 0.0],
+        "pv_roof": [0.0, 0.0],
+        "pv_ground": [0.0, 1.5],
+        "hydro": [0.0, 0.0],
+        "biomass": [0.0, 0.0],
+    }
+    (tmp_path / "scalars").mkdir()
+    for technology, capacities in mastr_stats.items():
+        pd.DataFrame({"municipality_id": [1, 2], "capacity_net": capacities}).to_csv(
+            tmp_path / "scalars" / f"bnetza_mastr_{technology}_stats_muns.csv",
+            index=False,
+        )
+    settings.DIGIPIPE_DIR = environ.Path(str(tmp_path))
+
+    pd.testing.assert_frame_equal(
+        calculations.capacities_per_municipality(),
+        datapackage.get_capacities_from_datapackage(),
+        check_dtype=False,
+        check_index_type=False,
+    )
+
+
+@pytest.mark.django_db()
+def test_population_per_year(municipalities):  # noqa: ANN001
+    """Test that population matrix is pivoted in DB and year slice matches matrix column."""
+    for municipality, values in zip(municipalities, ((100, 110), (200, 190))):
+        for year, value in zip((2022, 2045), values):
+            models.Population.objects.create(year=year, value=value, entry_type="value", municipality=municipality)
+
+    population = models.Population.quantity_per_municipality_per_year()
+    assert population.columns.tolist() == [2022, 2045]
+    assert population.loc[2, 2045] == 190
+    pd.testing.assert_series_equal(
+        models.Population.quantity_per_municipality(2022),
+        population[2022],
+        check_dtype=False,
+        check_names=False,
+        check_index_type=False,
+    )
+
+
+@pytest.mark.django_db()
+def test_municipality_bbox_is_stored(municipalities):  # noqa: ANN001
+    """Test that bounding box is stored on save and served per municipality."""
+    assert municipalities[0].bbox == [0.0, 0.0, 1.0, 1.0]
+    assert models.Municipality.bboxes() == {1: [0.0, 0.0, 1.0, 1.0], 2: [0.0, 0.0, 1.0, 1.0]}
+
+
+@pytest.mark.django_db()
+def test_municipality_label_point_lies_within_geometry():
+    """Test that label point of concave municipality lies within its geometry, unlike its centroid."""
+    concave = MultiPolygon(Polygon(((0, 0), (3, 0), (3, 1), (1, 1), (1, 3), (3, 3), (3, 4), (0, 4), (0, 0))))
+    municipality = models.Municipality.objects.create(id=3, name="Gemeinde 3", geom=concave, area=1)
+
+    assert not concave.contains(concave.centroid)
+    assert concave.contains(models.Municipality.objects.get(pk=municipality.pk).geom_label)
+
+
+def test_tile_columns_depend_on_zoom():
+    """Test that municipality tiles only carry ID at low zoom levels and all columns when zoomed in."""
+    assert models.Municipality.vector_tiles.get_tile_columns(8) == ["id"]
+    assert models.Municipality.vector_tiles.get_tile_columns(12) == ["id", "name"]
+    assert models.Municipality.label_tiles.get_tile_columns(8) == ["id", "name"]
@@ -0,0 +1,53 @@
+"""Module to test popups of map app."""
+
+import pandas as pd
+import pytest
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.core.cache import cache
+from django.http import Http404
+from django.urls import reverse
+
+from digiplan.map import models, popups
+
+
+class WindPopup(popups.RegionPopup):
+    """Region popup with fixed detailed data for municipalities 1 and 2."""
+
+    lookup = "capacity"
+
+    def get_detailed_data(self) -> pd.DataFrame:  # noqa: D102
+        return pd.DataFrame({"wind": [1.0, 2.0]}, index=[1, 2])
+
+
+@pytest.mark.django_db()
+def test_popup_index_is_rebuilt_if_municipality_entry_is_evicted():
+    """Test that evicted municipality entry leads to rebuilt index instead of empty data."""
+    polygon = MultiPolygon(Polygon.from_bbox((0, 0, 1, 1)))
+    for municipality_id in (1, 2, 3):
+        models.Municipality.objects.create(id=municipality_id, name=f"Gemeinde {municipality_id}", geom=polygon, area=1)
+
+    popup = WindPopup("capacity", 2)
+    cache.delete(popup.get_index_key(2))
+    popup = WindPopup("capacity", 2)
+    assert popup.region_value == 3.0
+    assert popup.get_municipality_value() == 2.0
+    assert WindPopup("capacity", 3).get_municipality_value() == 0
+    assert cache.get(popup.get_index_key(3)).empty
+
+
+@pytest.mark.django_db()
+def test_popup_returns_404_for_unknown_municipality_without_rebuilding_index(client, monkeypatch):  # noqa: ANN001
+    """Test that unknown municipality ID is answered with 404 and does not trigger rebuild of existing index."""
+    polygon = MultiPolygon(Polygon.from_bbox((0, 0, 1, 1)))
+    models.Municipality.objects.create(id=1, name="Gemeinde 1", geom=polygon, area=1)
+    WindPopup("capacity", 1)
+
+    def build_index(self):  # noqa: ANN001, ANN202, ARG001
+        msg = "Index must not be rebuilt for unknown ID"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(WindPopup, "build_index", build_index)
+    with pytest.raises(Http404):
+        WindPopup("capacity", 99)
+    monkeypatch.setitem(popups.POPUPS, "wind", WindPopup)
+    assert client.get(reverse("map:popup", kwargs={"lookup": "wind", "region": 99})).status_code == 404
@@ -0,0 +1,19 @@
+"""Module to test potential areas calculated in PostGIS."""
+
+import pandas as pd
+import pytest
+
+from digiplan.map import datapackage, potentials
+
+
+@pytest.mark.django_db()
+def test_potential_areas_replace_stats_files(settings, monkeypatch):  # noqa: ANN001
+    """Test that areas of all layers are combined into frame with columns of digipipe stats files."""
+    settings.POTENTIAL_AREA_SOURCE = "postgis"
+    layers = potentials.POTENTIAL_AREAS["wind"]
+    areas = {model: pd.Series({1: float(i), 2: 2.0 * i}) for i, model in enumerate(layers.values())}
+    monkeypatch.setattr(potentials, "calculate_area_per_municipality", areas.get)
+
+    wind_areas = datapackage.get_potential_areas("wind")
+    assert wind_areas.columns.tolist() == list(layers)
+    pd.testing.assert_series_equal(wind_areas["stp_2027_vr"], areas[layers["stp_2027_vr"]], check_names=False)
@@ -0,0 +1,101 @@
+"""Module to test columnar result store."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from digiplan.map import result_store
+
+
+@pytest.fixture()
+def store(settings, tmp_path):  # noqa: ANN001
+    """Return empty result store in temporary folder."""
+    settings.RESULT_STORE_DIR = str(tmp_path)
+    return result_store.ResultStore(1)
+
+
+@pytest.fixture()
+def flows():
+    """Return hourly flows."""
+    index = pd.date_range("2045-01-01", periods=8760, freq="H", name="timeindex")
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"ABW-wind-onshore": rng.random(8760), "ABW-solar-pv_ground": rng.random(8760)},
+        index=index,
+    )
+
+
+def test_series_roundtrip(store):  # noqa: ANN001
+    """Test that series with multiindex is restored from store."""
+    index = pd.MultiIndex.from_tuples(
+        [("ABW-electricity-demand_hh", "ABW-electricity"), ("ABW-wind-onshore", "ABW-electricity")],
+        names=["source", "target"],
+    )
+    series = pd.Series([1.5, 2.5], index=index, name="values")
+    store.write({"electricity_demand": series})
+
+    assert store.names() == {"electricity_demand"}
+    pd.testing.assert_series_equal(store.read("electricity_demand"), series)
+
+
+def test_frame_roundtrip(store, flows):  # noqa: ANN001
+    """Test that frame is restored completely or for requested flows only."""
+    store.write({"renewable_flows": flows})
+
+    pd.testing.assert_frame_equal(store.read("renewable_flows"), flows, check_freq=False)
+    pd.testing.assert_frame_equal(
+        store.read("renewable_flows", columns=["ABW-solar-pv_ground"]),
+        flows[["ABW-solar-pv_ground"]],
+        check_freq=False,
+    )
+
+
+def test_precomputed_sums(store, flows):  # noqa: ANN001
+    """Test that column sums and hourly sums are precomputed."""
+    store.write({"renewable_flows": flows})
+
+    pd.testing.assert_series_equal(store.read_sums("renewable_flows"), flows.sum())
+    pd.testing.assert_series_equal(store.read_row_sums("renewable_flows"), flows.sum(axis=1), check_freq=False)
+
+
+def test_write_appends_results(store, flows):  # noqa: ANN001
+    """Test that further results are added to existing store and stored results are kept."""
+    store.write({"renewable_flows": flows})
+    store.write({"demand_flows": flows, "renewable_flows": flows * 2})
+
+    assert store.names() == {"renewable_flows", "demand_flows"}
+    pd.testing.assert_frame_equal(store.read("renewable_flows"), flows, check_freq=False)
+    store.delete()
+    assert store.names() == set()
+
+
+def test_concurrent_writers_keep_results(store, flows):  # noqa: ANN001
+    """Test that writers adding different results in parallel do not overwrite each other or stored results."""
+    store.write({"renewable_flows": flows})
+    stored = store._get_path("renewable_flows").stat().st_mtime_ns  # noqa: SLF001
+    names = [f"flows_{i}" for i in range(8)]
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        list(pool.map(lambda name: result_store.ResultStore(1).write({name: flows}), names))
+
+    assert store.names() == {"renewable_flows", *names}
+    assert store._get_path("renewable_flows").stat().st_mtime_ns == stored  # noqa: SLF001
+    for name in names:
+        pd.testing.assert_frame_equal(store.read(name), flows, check_freq=False)
+
+
+def test_compaction_keeps_sums(store, flows):  # noqa: ANN001
+    """Test that compaction drops flows but keeps precomputed sums and series."""
+    series = pd.Series([1.0, 2.0], index=["ABW-wind-onshore", "ABW-hydro-ror"], name="values")
+    store.write({"renewable_flows": flows, "capacities": series})
+    size = store.size()
+    store.compact()
+
+    assert store.size() < size
+    assert store.names() == {"renewable_flows", "capacities"}
+    pd.testing.assert_series_equal(store.read("capacities"), series)
+    pd.testing.assert_series_equal(store.read_sums("renewable_flows"), flows.sum())
+    pd.testing.assert_series_equal(store.read_row_sums("renewable_flows"), flows.sum(axis=1), check_freq=False)
+    with pytest.raises(ValueError, match="compacted"):
+        store.read("renewable_flows")
@@ -0,0 +1,48 @@
+"""Module to test synthetic datapackage generation."""
+
+import pathlib
+import tempfile
+
+import numpy as np
+from django.conf import settings
+from django.contrib.gis.gdal import DataSource
+
+from digiplan.map import models
+from digiplan.utils import synthetic_data
+
+
+def test_municipality_cells_within_bounds():
+    """Test that every municipality gets its own cell within map bounds."""
+    cells = synthetic_data.get_municipality_cells(250)
+    (xmin, ymin), (xmax, ymax) = settings.MAP_ENGINE_MAX_BOUNDS
+    assert len(cells) == 250
+    assert len(set(cells)) == 250
+    for cell in cells:
+        assert xmin <= cell[0] < cell[2] <= xmax + 1e-9
+        assert ymin <= cell[1] < cell[3] <= ymax + 1e-9
+
+
+def test_geopackage_readable_by_ogr():
+    """Test that written geopackage can be read via OGR as used by layer mapping."""
+    rng = np.random.default_rng(0)
+    cells = synthetic_data.get_municipality_cells(4)
+    features = []
+    for municipality_id, cell in enumerate(cells):
+        properties = synthetic_data.get_random_properties(models.Hydro, rng)
+        properties["municipality_id"] = municipality_id
+        features.append((synthetic_data.get_random_point(cell, rng), properties))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = pathlib.Path(tmpdir) / f"{models.Hydro.data_file}.gpkg"
+        synthetic_data.write_geopackage(
+            filename,
+            models.Hydro.layer,
+            synthetic_data.get_ogr_fields(models.Hydro),
+            features,
+        )
+        layer = DataSource(str(filename))[0]
+        assert layer.name == models.Hydro.layer
+        assert layer.geom_type.name == "Point"
+        assert len(layer) == 4
+        assert "municipality_id" in layer.fields
+        assert [feature["municipality_id"].value for feature in layer] == [0, 1, 2, 3]
@@ -0,0 +1,38 @@
+"""Module to test tile calculation around map center at startup."""
+
+import pytest
+from django.core.cache import cache
+
+from digiplan.map import tiles
+
+
+def test_get_tile():
+    """Test that tile is calculated in slippy map scheme."""
+    assert tiles.get_tile(0, 0, 0) == (0, 0, 0)
+    assert tiles.get_tile(12.0, 51.8, 8) == (136, 84, 8)
+
+
+def test_startup_tiles_surround_startup_tile():
+    """Test that startup tiles cover startup tile and its neighbours on all startup zoom levels."""
+    startup_tiles = list(tiles.get_startup_tiles())
+    edge = 2 * tiles.STARTUP_TILE_RADIUS + 1
+
+    assert len(startup_tiles) == edge**2 * len(tiles.STARTUP_ZOOM_OFFSETS)
+    assert tiles.get_startup_tile() in startup_tiles
+    assert len(set(startup_tiles)) == len(startup_tiles)
+
+
+@pytest.mark.django_db()
+def test_prerendered_tiles_are_served_from_cache(client):  # noqa: ANN001
+    """Test that pre-rendered startup tiles are served by middleware, other tiles are passed on."""
+    x, y, z = tiles.get_startup_tile()
+    url = tiles.get_mvt_url("municipality", x, y, z)
+    cache.set(tiles.get_tile_key("municipality", x, y, z), b"tile")
+    cache.set(tiles.get_tile_key("municipality", x + 1, y, z), b"")
+
+    assert url in tiles.get_preload_urls()
+    assert tiles.get_prerendered_tile(tiles.get_mvt_url("forest", x, y, z)) is None
+    tile_response = client.get(url)
+    assert tile_response.status_code == 200
+    assert tile_response.content == b"tile"
+    assert client.get(tiles.get_mvt_url("municipality", x + 1, y, z)).status_code == 204
@@ -0,0 +1,50 @@
+"""Module to test downsampling of time series."""
+
+import numpy as np
+import pytest
+from django.urls import reverse
+
+from digiplan.map import models, timeseries
+
+
+def test_lttb_keeps_budget_and_borders():
+    """Test that LTTB returns requested number of sorted points including first and last one."""
+    values = np.random.default_rng(0).random(8760)
+    indices = timeseries.lttb(values, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0
+    assert indices[-1] == 8759
+    assert (np.diff(indices) > 0).all()
+
+
+def test_lttb_keeps_peaks():
+    """Test that single peaks survive downsampling."""
+    values = np.zeros(8760)
+    values[[1000, 5000]] = [10, -10]
+    indices = timeseries.lttb(values, 100)
+    assert {1000, 5000} <= set(indices.tolist())
+
+
+def test_lttb_without_downsampling():
+    """Test that all points are returned if budget exceeds length."""
+    values = np.arange(10, dtype=float)
+    assert timeseries.lttb(values, 20).tolist() == list(range(10))
+
+
+@pytest.mark.django_db()
+def test_timeseries_of_compacted_simulation_is_gone(client, monkeypatch):  # noqa: ANN001
+    """Test that time series of compacted simulation are answered with 410 instead of failing on result store."""
+    monkeypatch.setattr(models.SimulationUsage, "is_compacted", lambda simulation_id: simulation_id == 1)
+    response = client.get(reverse("map:timeseries", kwargs={"lookup": "renewables"}), {"simulation_id": 1})
+    assert response.status_code == 410
+    assert b"compacted" in response.content
+
+
+@pytest.mark.django_db()
+def test_unknown_flows_are_rejected(client, monkeypatch):  # noqa: ANN001
+    """Test that unknown flows are answered with 400 instead of failing when reading result store."""
+    monkeypatch.setattr(timeseries, "get_flows", lambda simulation_id, lookup: ["ABW-wind-onshore"])  # noqa: ARG005
+    url = reverse("map:timeseries", kwargs={"lookup": "renewables"})
+    response = client.get(url, {"simulation_id": 1, "flows[]": ["ABW-wind-onshore", "unknown"]})
+    assert response.status_code == 400
+    assert client.get(reverse("map:timeseries", kwargs={"lookup": "unknown"}), {"simulation_id": 1}).status_code == 400
@@ -0,0 +1,56 @@
+"""Module to test request timing."""
+
+import time
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from digiplan.utils import timing
+
+
+def test_nested_measurements_are_exclusive():
+    """Test that time of inner category is not counted for outer category."""
+    timer = timing.Timer()
+    with timer.measure("calc"):
+        time.sleep(0.01)
+        with timer.measure("csv"):
+            time.sleep(0.02)
+    assert timer.durations["csv"] >= 0.02
+    assert 0.01 <= timer.durations["calc"] < timer.durations["csv"]
+
+
+def test_server_timing_header(settings):  # noqa: ANN001
+    """Test that middleware attributes measured time to categories and adds header only if enabled."""
+
+    def view(request: HttpRequest) -> HttpResponse:  # noqa: ARG001
+        with timing.measure("csv"):
+            time.sleep(0.01)
+        return timing.JsonResponse({"value": 1})
+
+    settings.SERVER_TIMING = True
+    response = timing.ServerTimingMiddleware(view)(RequestFactory().get("/choropleth/energy/municipality"))
+    header = response["Server-Timing"]
+    for category in ("calc", "csv", "json", "total"):
+        assert f"{category};dur=" in header
+
+    settings.SERVER_TIMING = False
+    response = timing.ServerTimingMiddleware(view)(RequestFactory().get("/choropleth/energy/municipality"))
+    assert not response.has_header("Server-Timing")
+
+
+def test_profiling_switch(tmp_path, settings):  # noqa: ANN001
+    """Test that profile is dumped only if profiling is enabled."""
+    settings.PROFILE_DIR = str(tmp_path)
+    middleware = timing.ServerTimingMiddleware(lambda request: time.sleep(0.05) or HttpResponse())  # noqa: ARG005
+
+    middleware(RequestFactory().get("/charts"))
+    assert not list(tmp_path.iterdir())
+
+    timing.enable_profiling()
+    try:
+        middleware(RequestFactory().get("/charts"))
+    finally:
+        timing.disable_profiling()
+    profiles = list(tmp_path.iterdir())
+    assert len(profiles) == 1
+    assert "test_timing" in profiles[0].read_text()